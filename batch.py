@@ -0,0 +1,133 @@
+"""Vectorized batch API: filter and score many game states in one call.
+
+Replaying large numbers of recorded games one filter_words call at a time is dominated by
+Python overhead. Here N guess histories become arrays, and the candidate masks for all of them
+come out of a few NumPy operations over the shared feedback table. Suggestions use the same
+letter-frequency scoring as suggest_next_guess, computed with matrix products for the whole batch.
+"""
+import numpy as np
+
+from patterns import encode_feedback, get_pattern_table
+from word_store import WordStore
+
+class BatchSolver:
+    """Filters and scores batches of guess histories against one word list."""
+
+    def __init__(self, words, guesses=None):
+        self.words = list(words)
+        # Guesses may include words that can't be the answer (e.g. past used words)
+        self.table = get_pattern_table(guesses if guesses is not None else self.words)
+        if not self.table.covers(self.words):
+            self.table = get_pattern_table(self.words)
+        self.answer_cols = self.table.answer_indices(self.words)
+        self.matrix = np.asarray(self.table.matrix)[:, self.answer_cols]
+
+        store = WordStore.from_words(self.words)
+        letters = store.letters.astype(np.intp)
+        num_words, length = letters.shape
+        # One-hot of letter k at position i, flattened to (N, length * 26)
+        self.position_onehot = np.zeros((num_words, length * 26), dtype=np.float32)
+        self.position_onehot[np.arange(num_words)[:, None], np.arange(length) * 26 + letters] = 1
+        # Whether each word contains letter k at all
+        self.presence = (store.counts > 0).astype(np.float32)
+        self.unique_counts = self.presence.sum(axis=1)
+
+    def encode_histories(self, histories):
+        """Turns N lists of (guess, feedback) into padded (N, T) guess-row and code arrays.
+
+        Padding turns use guess row -1, which filter() ignores.
+        """
+        turns = max((len(history) for history in histories), default=0)
+        guess_rows = np.full((len(histories), turns), -1, dtype=np.intp)
+        codes = np.zeros((len(histories), turns), dtype=np.uint8)
+        for n, history in enumerate(histories):
+            for t, (guess, feedback) in enumerate(history):
+                row = self.table.guess_index.get(guess)
+                if row is None:
+                    raise ValueError(f"Guess {guess!r} is not in the word list")
+                guess_rows[n, t] = row
+                codes[n, t] = encode_feedback(feedback) if isinstance(feedback, str) else feedback
+        return guess_rows, codes
+
+    def filter(self, histories):
+        """Returns an (N, words) bool array: which words are still possible in each history."""
+        guess_rows, codes = self.encode_histories(histories)
+        masks = np.ones((len(histories), len(self.words)), dtype=bool)
+        for t in range(guess_rows.shape[1]):
+            played = guess_rows[:, t] >= 0
+            rows = self.matrix[guess_rows[played, t]]
+            masks[played] &= rows == codes[played, t][:, None]
+        return masks
+
+    def frequency_scores(self, masks):
+        """Scores every word for every state with suggest_next_guess's letter-frequency formula.
+
+        Returns an (N, words) float array; words that are no longer possible score -inf.
+        """
+        weights = masks.astype(np.float32)
+        counts = weights.sum(axis=1, keepdims=True)
+        safe_counts = np.maximum(counts, 1)
+        position_freq = weights @ self.position_onehot / safe_counts
+        letter_freq = weights @ self.presence / safe_counts
+        scores = position_freq @ self.position_onehot.T + letter_freq @ self.presence.T
+        scores += self.unique_counts * 0.2
+        scores[~masks] = -np.inf
+        return scores
+
+    def suggest(self, masks):
+        """Returns the best-scoring candidate for each state (None where nothing is possible).
+
+        Unlike suggest_next_guess this is deterministic: it always takes the top score rather
+        than a random pick among the top three.
+        """
+        best = self.frequency_scores(masks).argmax(axis=1)
+        has_words = masks.any(axis=1)
+        return [self.words[i] if ok else None for i, ok in zip(best, has_words)]
+
+    def solve(self, histories, chunk_size=4096, include_candidates=False):
+        """Filters and suggests for every history; returns (remaining counts, suggestions[, candidates]).
+
+        Histories are processed in chunks so the (chunk, words) score matrix stays bounded.
+        """
+        counts = []
+        suggestions = []
+        candidates = []
+        for start in range(0, len(histories), chunk_size):
+            masks = self.filter(histories[start:start + chunk_size])
+            counts.extend(masks.sum(axis=1).tolist())
+            suggestions.extend(self.suggest(masks))
+            if include_candidates:
+                candidates.extend([self.words[i] for i in np.flatnonzero(row)] for row in masks)
+        if include_candidates:
+            return counts, suggestions, candidates
+        return counts, suggestions
+
+def batch_filter_words(words, histories):
+    """Convenience wrapper: returns the list of possible words for each history."""
+    solver = BatchSolver(words)
+    return [[solver.words[i] for i in np.flatnonzero(row)] for row in solver.filter(histories)]
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from patterns import get_feedback
+    from wordle_solver import read_word_file
+
+    words = read_word_file()
+    rng = random.Random(0)
+    histories = []
+    for _ in range(10000):
+        answer = rng.choice(words)
+        history = []
+        for _ in range(rng.randint(1, 3)):
+            guess = rng.choice(words)
+            history.append((guess, get_feedback(guess, answer)))
+        histories.append(history)
+
+    solver = BatchSolver(words)
+    start = time.perf_counter()
+    counts, suggestions = solver.solve(histories)
+    elapsed = time.perf_counter() - start
+    print(f"Filtered and scored {len(histories)} histories in {elapsed:.2f}s "
+          f"({len(histories) / elapsed:.0f} states/sec)")
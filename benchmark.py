@@ -0,0 +1,206 @@
+"""Micro-benchmarks for the solver kernels, recorded as JSON for regression comparison.
+
+Times word loading, filter_words (and the WordIndex bitset filter) and suggest_next_guess at
+several candidate-set sizes. Every case runs on the same seeded random states, so two runs on
+the same machine are directly comparable.
+
+    python benchmark.py --output before.json
+    python benchmark.py --output after.json --compare before.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+import wordle_solver
+from constraints import Constraints
+from patterns import get_feedback
+from suggestion_cache import words_fingerprint
+from word_index import WordIndex
+from wordle_solver import filter_words, read_word_file, suggest_next_guess
+
+SIZES = (50, 200, 1000, None)  # None means the full word list
+
+def time_calls(func, args_list, repeat=1):
+    """Calls func on every argument tuple repeat times; returns per-call times in ms."""
+    times = []
+    for _ in range(repeat):
+        for args in args_list:
+            start = time.perf_counter()
+            func(*args)
+            times.append((time.perf_counter() - start) * 1000)
+    return times
+
+def summarize_times(times):
+    """Mean, min and nearest-rank percentiles of a list of times in ms."""
+    ordered = sorted(times)
+    count = len(ordered)
+
+    def pct(p):
+        return ordered[min(count - 1, int(count * p / 100))]
+
+    return {
+        "runs": count,
+        "mean_ms": round(sum(ordered) / count, 4),
+        "min_ms": round(ordered[0], 4),
+        "p50_ms": round(pct(50), 4),
+        "p90_ms": round(pct(90), 4),
+        "p99_ms": round(pct(99), 4),
+    }
+
+def make_states(words, size, count, rng):
+    """Random (candidate subset, constraints) states for filtering a subset of the given size.
+
+    The constraints come from one or two guesses against a random answer from the subset, so
+    every state filters down to a realistic, non-empty set.
+    """
+    states = []
+    for _ in range(count):
+        subset = words if size is None or size >= len(words) else rng.sample(words, size)
+        answer = rng.choice(subset)
+        constraints = Constraints.empty()
+        for _ in range(rng.randint(1, 2)):
+            guess = rng.choice(words)
+            constraints = constraints.apply(guess, get_feedback(guess, answer))
+        states.append((subset, constraints))
+    return states
+
+def bench_loading(repeat):
+    """Times reading the word file and the full load (compiled universe when it is up to date)."""
+    results = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        results["read_word_file"] = summarize_times(time_calls(read_word_file, [()], repeat))
+        results["load_word_universe"] = summarize_times(time_calls(wordle_solver.load_word_universe, [()], repeat))
+    return results
+
+def bench_filter(words, states_by_size, repeat):
+    """Times filter_words and the WordIndex filter on the same states."""
+    results = {}
+    for size, states in states_by_size.items():
+        results[f"filter_words[n={size}]"] = summarize_times(time_calls(filter_words, states, repeat))
+
+        index = WordIndex(words)
+        indexed = [(index.from_words(subset), constraints) for subset, constraints in states]
+        results[f"word_index.filter[n={size}]"] = summarize_times(time_calls(index.filter, indexed, repeat))
+    return results
+
+def bench_suggest(states_by_size, strategies, repeat, seed):
+    """Times suggest_next_guess on candidate lists of each size; also digests the guesses made."""
+    results = {}
+    checksums = {}
+    for size, states in states_by_size.items():
+        candidate_lists = [(subset,) for subset, _ in states]
+        for strategy in strategies:
+            def suggest(possible_words):
+                return suggest_next_guess(possible_words, None, strategy)
+
+            suggest(*candidate_lists[0])  # Warm the feedback table
+            name = f"suggest_next_guess[{strategy},n={size}]"
+            random.seed(seed)
+            results[name] = summarize_times(time_calls(suggest, candidate_lists, repeat))
+            random.seed(seed)
+            checksums[name] = words_fingerprint([suggest(*args) or "" for args in candidate_lists])
+    return results, checksums
+
+def run_benchmarks(words_file="words.txt", sizes=SIZES, states=20, repeat=3, strategies=("frequency", "entropy"), seed=0):
+    """Runs every benchmark and returns a JSON-serializable report."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        wordle_solver.load_word_universe(words_file)
+    words = read_word_file(words_file)
+    rng = random.Random(seed)
+    states_by_size = {size or len(words): make_states(words, size, states, rng) for size in sizes}
+
+    results = bench_loading(repeat * 10)
+    results.update(bench_filter(words, states_by_size, repeat))
+    suggest_results, checksums = bench_suggest(states_by_size, strategies, repeat, seed)
+    results.update(suggest_results)
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "words": len(words),
+            "words_hash": words_fingerprint(words),
+            "seed": seed,
+            "states_per_size": states,
+            "repeat": repeat,
+        },
+        "results": results,
+        # Digests of the suggestions made, to catch speedups that change the answers
+        "checksums": checksums,
+    }
+
+def print_report(report):
+    print(f"{'benchmark':<42}{'runs':>6}{'mean ms':>11}{'p50 ms':>11}{'p90 ms':>11}{'p99 ms':>11}")
+    for name, stats in report["results"].items():
+        print(f"{name:<42}{stats['runs']:>6}{stats['mean_ms']:>11.3f}{stats['p50_ms']:>11.3f}"
+              f"{stats['p90_ms']:>11.3f}{stats['p99_ms']:>11.3f}")
+
+def compare_reports(baseline, current, threshold=1.25):
+    """Prints the p50 ratio of every benchmark against the baseline; returns the regressed names."""
+    regressions = []
+    print(f"\n{'benchmark':<42}{'base p50':>11}{'now p50':>11}{'ratio':>8}")
+    for name, stats in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<42}{'-':>11}{stats['p50_ms']:>11.3f}{'new':>8}")
+            continue
+        ratio = stats["p50_ms"] / base["p50_ms"] if base["p50_ms"] else float("inf")
+        flag = ""
+        if ratio > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<42}{base['p50_ms']:>11.3f}{stats['p50_ms']:>11.3f}{ratio:>8.2f}{flag}")
+
+    same_inputs = all(baseline["meta"].get(key) == current["meta"][key]
+                      for key in ("words_hash", "seed", "states_per_size", "repeat"))
+    if same_inputs:
+        for name, digest in current["checksums"].items():
+            if baseline.get("checksums", {}).get(name, digest) != digest:
+                print(f"Warning: {name} now suggests different words than the baseline")
+    else:
+        print("Note: the baseline used a different word list or settings, so suggestions were not compared")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the filtering and scoring kernels")
+    parser.add_argument("--words", default="words.txt", help="word list (default: words.txt)")
+    parser.add_argument("--sizes", type=int, nargs="+", help="candidate-set sizes (default: 50 200 1000 and the full list)")
+    parser.add_argument("--states", type=int, default=20, help="random game states per size (default: 20)")
+    parser.add_argument("--repeat", type=int, default=3, help="times each state is run (default: 3)")
+    parser.add_argument("--strategy", action="append", choices=wordle_solver.STRATEGIES,
+                        help="strategy to benchmark; repeat for several (default: all)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the random states (default: 0)")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare against an earlier JSON result")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="p50 slowdown ratio that counts as a regression (default: 1.25)")
+    args = parser.parse_args()
+
+    sizes = tuple(args.sizes) if args.sizes else SIZES
+    report = run_benchmarks(args.words, sizes, args.states, args.repeat,
+                            tuple(args.strategy or wordle_solver.STRATEGIES), args.seed)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r') as file:
+            baseline = json.load(file)
+        regressions = compare_reports(baseline, report, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.2f}x")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
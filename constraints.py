@@ -0,0 +1,134 @@
+import struct
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+ALL_LETTERS_MASK = (1 << 26) - 1
+
+def letter_bit(letter):
+    """Returns the bit for a letter in a 26-bit letter mask (a = bit 0)."""
+    return 1 << (ord(letter) - ord('a'))
+
+class Constraints:
+    """Everything learned from the feedback so far, as an immutable, hashable value.
+
+    masks[i] is a 26-bit mask of the letters still allowed at position i.
+    min_counts[k] / max_counts[k] bound how many times letter k appears in the answer.
+
+    Folding in a guess with apply() returns a new Constraints, so a state can be cached,
+    shared between threads, or kept around for undo.
+    """
+    __slots__ = ("masks", "min_counts", "max_counts", "_hash")
+
+    def __init__(self, masks, min_counts, max_counts):
+        self.masks = tuple(masks)
+        self.min_counts = tuple(min_counts)
+        self.max_counts = tuple(max_counts)
+        self._hash = hash((self.masks, self.min_counts, self.max_counts))
+
+    @classmethod
+    def empty(cls, length=5):
+        """Returns the constraints before any guess: every letter allowed everywhere."""
+        return cls([ALL_LETTERS_MASK] * length, [0] * 26, [length] * 26)
+
+    @property
+    def length(self):
+        return len(self.masks)
+
+    def apply(self, guess, feedback):
+        """Returns new constraints with one guess and its 'GYX' feedback folded in."""
+        masks = list(self.masks)
+        min_counts = list(self.min_counts)
+        max_counts = list(self.max_counts)
+
+        non_gray = {}
+        has_gray = set()
+        for i, (letter, fb) in enumerate(zip(guess, feedback)):
+            bit = letter_bit(letter)
+            if fb == 'G':
+                masks[i] = bit
+                non_gray[letter] = non_gray.get(letter, 0) + 1
+            else:
+                # Yellow or gray: the letter is not at this position either way
+                masks[i] &= ~bit
+                if fb == 'Y':
+                    non_gray[letter] = non_gray.get(letter, 0) + 1
+                else:
+                    has_gray.add(letter)
+
+        for letter in set(non_gray) | has_gray:
+            k = ord(letter) - ord('a')
+            count = non_gray.get(letter, 0)
+            # The answer has at least as many as were colored, and exactly that many
+            # if one of the copies came back gray (e.g. APPLE -> YXXXG means exactly one P)
+            min_counts[k] = max(min_counts[k], count)
+            if letter in has_gray:
+                max_counts[k] = min(max_counts[k], count)
+
+        # A letter that can't appear at all is removed from every position
+        absent_mask = 0
+        for k, max_count in enumerate(max_counts):
+            if max_count == 0:
+                absent_mask |= 1 << k
+        if absent_mask:
+            masks = [mask & ~absent_mask for mask in masks]
+
+        return Constraints(masks, min_counts, max_counts)
+
+    def pack(self):
+        """Returns the constraints as compact bytes (4 per position plus 52): about 100 bytes instead of 640."""
+        return struct.pack(f"<{len(self.masks)}I", *self.masks) + bytes(self.min_counts) + bytes(self.max_counts)
+
+    @classmethod
+    def unpack(cls, data):
+        """Inverse of pack()."""
+        length = (len(data) - 52) // 4
+        masks = struct.unpack_from(f"<{length}I", data)
+        return cls(masks, data[4 * length:4 * length + 26], data[4 * length + 26:])
+
+    def matches(self, word):
+        """Checks whether word is consistent with everything learned so far."""
+        return bool(self.filter([word]))
+
+    def filter(self, words):
+        """Returns the words that satisfy these constraints."""
+        # Only letters with a real bound need counting, so collect them once up front
+        bounded = [(ALPHABET[k], low, high)
+                   for k, (low, high) in enumerate(zip(self.min_counts, self.max_counts))
+                   if low or high < self.length]
+        masks = self.masks
+        result = []
+        for word in words:
+            if all(mask >> (ord(letter) - 97) & 1 for mask, letter in zip(masks, word)) and \
+                    all(low <= word.count(letter) <= high for letter, low, high in bounded):
+                result.append(word)
+        return result
+
+    def known_letters(self):
+        """Returns the letter fixed at each position (green), or None where it isn't known yet."""
+        return [ALPHABET[mask.bit_length() - 1] if mask and mask & (mask - 1) == 0 else None
+                for mask in self.masks]
+
+    def present_letters(self):
+        """Returns the letters known to be in the word but not yet placed (yellow)."""
+        placed = {}
+        for letter in self.known_letters():
+            if letter:
+                placed[letter] = placed.get(letter, 0) + 1
+        return {ALPHABET[k] for k, low in enumerate(self.min_counts) if low > placed.get(ALPHABET[k], 0)}
+
+    def absent_letters(self):
+        """Returns the letters known not to be in the word (gray)."""
+        return {ALPHABET[k] for k, high in enumerate(self.max_counts) if high == 0}
+
+    def __eq__(self, other):
+        if not isinstance(other, Constraints):
+            return NotImplemented
+        return (self.masks, self.min_counts, self.max_counts) == (other.masks, other.min_counts, other.max_counts)
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        known = "".join(letter or "_" for letter in self.known_letters())
+        present = "".join(sorted(self.present_letters()))
+        absent = "".join(sorted(self.absent_letters()))
+        return f"Constraints(known={known!r}, present={present!r}, absent={absent!r})"
@@ -0,0 +1,282 @@
+"""Offline builder and in-game lookup for a precomputed Wordle decision tree.
+
+For a fixed answer universe the best next guess after any feedback sequence can be worked out
+ahead of time. The builder searches the game tree below an opener, minimizing the expected
+number of guesses with a hard cap of 6, and writes the result to a compact binary file.
+In game, the suggestion is then a single walk down the tree.
+
+Usage: python decision_tree.py [--opener salet] [--breadth 6] [--workers 4] [--output decision_tree.bin]
+"""
+import argparse
+import json
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from patterns import ALL_GREEN, encode_feedback, entropy_scores, get_pattern_table, word_list_hash
+
+MAX_GUESSES = 6
+TREE_FILE = "decision_tree.bin"
+MAGIC = b"WDTREE01"
+# Header: magic, universe hash (16 hex chars), node count, root offset
+HEADER = struct.Struct("<8s16sII")
+# Node: guess (5 ascii bytes), child count; each child: feedback code, node offset
+NODE = struct.Struct("<5sB")
+CHILD = struct.Struct("<BI")
+INFEASIBLE = float("inf")
+
+def universe_hash(answers):
+    """Identifies the answer universe a tree was built for."""
+    return word_list_hash(answers, answers)
+
+class TreeSearch:
+    """Depth-limited search for the guess tree that minimizes total guesses over a set of answers.
+
+    Trying every guess at every node is far too slow, so each node only expands the `breadth`
+    guesses with the highest one-step entropy (plus the best candidate that could itself be the
+    answer). Results are memoized on the set of remaining answers.
+    """
+
+    def __init__(self, guesses, answers, breadth=6, max_guesses=MAX_GUESSES):
+        self.table = get_pattern_table(guesses)
+        self.guesses = self.table.guesses
+        self.answer_cols = self.table.answer_indices(answers)
+        self.breadth = breadth
+        self.max_guesses = max_guesses
+        self.memo = {}
+
+    def partition(self, guess_row, cols):
+        """Splits the answer columns by the feedback they give to a guess."""
+        codes = self.table.matrix[guess_row, cols]
+        order = np.argsort(codes, kind="stable")
+        codes = codes[order]
+        cols = cols[order]
+        splits = np.flatnonzero(np.diff(codes)) + 1
+        return [(int(bucket_codes[0]), bucket) for bucket_codes, bucket in
+                zip(np.split(codes, splits), np.split(cols, splits))]
+
+    def candidate_guesses(self, cols):
+        """Picks the guesses worth expanding at a node."""
+        scores = entropy_scores(self.table.matrix, cols)
+        ranked = list(np.argsort(-scores, kind="stable")[:self.breadth])
+        # Always consider the best guess that could also be the answer
+        best_answer = cols[np.argmax(scores[cols])]
+        if best_answer not in ranked:
+            ranked.append(best_answer)
+        # A guess that can't split the set only helps if it is the answer itself
+        return [int(g) for g in ranked if scores[g] > 0 or len(cols) == 1]
+
+    def solve(self, cols, depth=0):
+        """Returns (total guesses over all answers in cols, tree node) when guessing from depth."""
+        if depth >= self.max_guesses:
+            return INFEASIBLE, None
+        if len(cols) == 1:
+            return 1, (int(cols[0]), {})
+
+        key = (cols.tobytes(), depth)
+        if key in self.memo:
+            return self.memo[key]
+
+        if len(cols) == 2:
+            # Guess either one: 1 guess if right, 2 if not
+            first, second = int(cols[0]), int(cols[1])
+            cost = 3 if depth + 1 < self.max_guesses else INFEASIBLE
+            result = (cost, (first, {int(self.table.matrix[first, second]): (second, {})}))
+            self.memo[key] = result
+            return result
+
+        best = (INFEASIBLE, None)
+        for guess_row in self.candidate_guesses(cols):
+            result = self.expand(guess_row, cols, depth, best[0])
+            if result[0] < best[0]:
+                best = result
+        self.memo[key] = best
+        return best
+
+    def expand(self, guess_row, cols, depth, bound=INFEASIBLE):
+        """Returns (total guesses, node) for playing guess_row at this node."""
+        total = len(cols)
+        children = {}
+        for code, bucket in self.partition(guess_row, cols):
+            if code == ALL_GREEN:
+                continue
+            cost, child = self.solve(bucket, depth + 1)
+            total += cost
+            if total >= bound:
+                return INFEASIBLE, None
+            children[code] = child
+        return total, (guess_row, children)
+
+    def node_to_words(self, node):
+        """Converts a node from row numbers to words, for checkpoints and serialization."""
+        guess_row, children = node
+        return [self.guesses[guess_row], {str(code): self.node_to_words(child) for code, child in children.items()}]
+
+def _solve_bucket(args):
+    """Worker: solves the subtree under one feedback to the opener."""
+    guesses, answers, bucket_words, breadth, max_guesses = args
+    search = TreeSearch(guesses, answers, breadth, max_guesses)
+    cost, node = search.solve(search.table.answer_indices(bucket_words), depth=1)
+    return cost, search.node_to_words(node) if node else None
+
+def build_tree(guesses, answers, opener, breadth=6, workers=None, checkpoint=None, max_guesses=MAX_GUESSES):
+    """Builds the decision tree below opener, one process per opener feedback bucket.
+
+    Finished buckets are written to the checkpoint file as they complete, so an interrupted
+    build picks up where it left off.
+    """
+    search = TreeSearch(guesses, answers, breadth, max_guesses)
+    opener_row = search.table.guess_index[opener]
+    buckets = {code: [search.guesses[c] for c in bucket]
+               for code, bucket in search.partition(opener_row, search.answer_cols) if code != ALL_GREEN}
+
+    done = {}
+    if checkpoint and os.path.exists(checkpoint):
+        with open(checkpoint, 'r') as file:
+            saved = json.load(file)
+        if saved.get("universe") == universe_hash(answers) and saved.get("opener") == opener:
+            done = {int(code): tuple(result) for code, result in saved["buckets"].items()}
+            print(f"Resuming from checkpoint: {len(done)}/{len(buckets)} buckets already solved")
+
+    todo = {code: words for code, words in buckets.items() if code not in done}
+    # Largest buckets first so the slowest work starts early
+    order = sorted(todo, key=lambda code: -len(todo[code]))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_solve_bucket, (guesses, answers, todo[code], breadth, max_guesses)): code
+                   for code in order}
+        for future in as_completed(futures):
+            code = futures[future]
+            done[code] = future.result()
+            print(f"  solved bucket {len(done)}/{len(buckets)} ({len(buckets[code])} answers)")
+            if checkpoint:
+                _write_checkpoint(checkpoint, answers, opener, done)
+
+    total = len(search.answer_cols)
+    children = {}
+    for code, (cost, node) in done.items():
+        total += cost
+        children[str(code)] = node
+    return total / len(answers), [opener, children]
+
+def _write_checkpoint(path, answers, opener, done):
+    """Saves the finished buckets atomically."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as file:
+        json.dump({"universe": universe_hash(answers), "opener": opener,
+                   "buckets": {str(code): list(result) for code, result in done.items()}}, file)
+    os.replace(tmp_path, path)
+
+def serialize_tree(root, answers):
+    """Packs a [guess, {code: child}] tree into the binary tree format."""
+    body = bytearray()
+
+    def write(node):
+        guess, children = node
+        children = {code: child for code, child in children.items() if child is not None}
+        offset = len(body)
+        body.extend(NODE.pack(guess.encode("ascii"), len(children)))
+        slots = len(body)
+        body.extend(bytes(CHILD.size * len(children)))
+        for i, (code, child) in enumerate(sorted(children.items(), key=lambda item: int(item[0]))):
+            CHILD.pack_into(body, slots + i * CHILD.size, int(code), write(child))
+        return offset
+
+    node_count = _count_nodes(root)
+    root_offset = write(root)
+    header = HEADER.pack(MAGIC, universe_hash(answers).encode("ascii"), node_count, root_offset)
+    return header + bytes(body)
+
+def _count_nodes(node):
+    return 1 + sum(_count_nodes(child) for child in node[1].values() if child is not None)
+
+class DecisionTree:
+    """A read-only view over a serialized decision tree."""
+
+    def __init__(self, data):
+        magic, universe, self.node_count, self.root = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a decision tree file")
+        self.universe = universe.decode("ascii")
+        self.data = memoryview(data)[HEADER.size:]
+
+    @property
+    def opener(self):
+        return self._guess_at(self.root)
+
+    def _guess_at(self, offset):
+        guess, _ = NODE.unpack_from(self.data, offset)
+        return guess.decode("ascii")
+
+    def _child(self, offset, code):
+        _, count = NODE.unpack_from(self.data, offset)
+        base = offset + NODE.size
+        for i in range(count):
+            child_code, child_offset = CHILD.unpack_from(self.data, base + i * CHILD.size)
+            if child_code == code:
+                return child_offset
+        return None
+
+    def lookup(self, history):
+        """Returns the tree's next guess after a list of (guess, feedback) turns, or None.
+
+        None means the history left the tree (a different guess was played, or the
+        feedback is impossible for the tree's universe).
+        """
+        offset = self.root
+        for guess, feedback in history:
+            if self._guess_at(offset) != guess:
+                return None
+            code = encode_feedback(feedback) if isinstance(feedback, str) else feedback
+            offset = self._child(offset, code)
+            if offset is None:
+                return None
+        return self._guess_at(offset)
+
+    def matches(self, answers):
+        """Checks whether this tree was built for the given answer universe."""
+        return self.universe == universe_hash(answers)
+
+def load_decision_tree(answers, filename=TREE_FILE):
+    """Loads the tree file if it exists and was built for this answer universe, else None."""
+    try:
+        with open(filename, 'rb') as file:
+            tree = DecisionTree(file.read())
+    except (FileNotFoundError, ValueError, struct.error):
+        return None
+    if not tree.matches(answers):
+        print(f"Note: {filename} was built for a different word list and will not be used")
+        return None
+    return tree
+
+def main():
+    from wordle_solver import load_past_words, load_words, read_word_file
+
+    parser = argparse.ArgumentParser(description="Precompute the solver's decision tree for the current word list")
+    parser.add_argument("--opener", default="crane", help="first guess at the root of the tree (default: crane)")
+    parser.add_argument("--breadth", type=int, default=6, help="guesses expanded at each node (default: 6)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--output", default=TREE_FILE, help=f"tree file to write (default: {TREE_FILE})")
+    parser.add_argument("--checkpoint", default=None, help="checkpoint file (default: <output>.checkpoint.json)")
+    args = parser.parse_args()
+
+    load_past_words()
+    answers = load_words()
+    guesses = read_word_file()
+    checkpoint = args.checkpoint or f"{args.output}.checkpoint.json"
+
+    start = time.perf_counter()
+    expected, root = build_tree(guesses, answers, args.opener, args.breadth, args.workers, checkpoint)
+    data = serialize_tree(root, answers)
+    with open(args.output, 'wb') as file:
+        file.write(data)
+    if os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
+    print(f"Expected guesses from '{args.opener}': {expected:.4f}")
+    print(f"Wrote {_count_nodes(root)} nodes ({len(data)} bytes) to {args.output} in {time.perf_counter() - start:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""Exhaustive differential check of the filtering engines against the rules of the game.
+
+For every guess in the word list and every answer, the words still possible after that single
+turn are exactly the words that would have produced the same feedback: get_feedback(guess, word)
+== get_feedback(guess, answer). That set is the reference. Each engine (filter_words, the
+WordIndex bitsets, the feedback table and the batch API, plus any engine passed with --engine)
+is run on the same turn, and every disagreement is reported with the words it wrongly kept or
+dropped. The result only depends on (guess, feedback), so answers sharing a feedback are checked
+once and the disagreement lists how many (guess, answer) pairs it affects.
+
+--histories N also checks N random multi-turn games, where the letter counts of separate turns
+interact (e.g. a letter that is yellow in one guess and gray in another).
+
+    python differential_check.py                        # every (guess, answer) pair
+    python differential_check.py --guesses 200 --workers 4
+    python differential_check.py --engine my_engine:make_filter
+"""
+import argparse
+import importlib
+import json
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from constraints import Constraints
+from patterns import get_feedback
+from wordle_solver import filter_words, read_word_file
+
+def history_constraints(history):
+    constraints = Constraints.empty()
+    for guess, feedback in history:
+        constraints = constraints.apply(guess, feedback)
+    return constraints
+
+# Engine factories: each takes the word list and returns a function from a list of histories
+# (each a list of (guess, feedback) turns) to the list of words still possible for each one.
+
+def filter_words_engine(words):
+    return lambda histories: [filter_words(words, history_constraints(history)) for history in histories]
+
+def word_index_engine(words):
+    from word_index import WordIndex
+
+    index = WordIndex(words)
+    return lambda histories: [index.words_of(index.filter(index.all, history_constraints(history)))
+                              for history in histories]
+
+def pattern_table_engine(words):
+    from patterns import get_pattern_table
+
+    table = get_pattern_table(words)
+
+    def run(histories):
+        results = []
+        for history in histories:
+            possible_words = words
+            for guess, feedback in history:
+                possible_words = table.filter(possible_words, guess, feedback)
+            results.append(possible_words)
+        return results
+    return run
+
+def batch_engine(words):
+    import numpy as np
+
+    from batch import BatchSolver
+
+    solver = BatchSolver(words)
+    return lambda histories: [[solver.words[i] for i in np.flatnonzero(row)] for row in solver.filter(histories)]
+
+ENGINES = {
+    "filter_words": filter_words_engine,
+    "word_index": word_index_engine,
+    "pattern_table": pattern_table_engine,
+    "batch": batch_engine,
+}
+
+def load_engine(spec):
+    """Resolves an engine name, or a 'module:factory' path to a factory with the same signature."""
+    if spec in ENGINES:
+        return ENGINES[spec]
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"Unknown engine {spec!r}; use one of {', '.join(ENGINES)} or module:factory")
+    return getattr(importlib.import_module(module_name), attr)
+
+def reference_filter(words, history):
+    """The words that would have given exactly this feedback on every turn."""
+    return [word for word in words if all(get_feedback(guess, word) == feedback for guess, feedback in history)]
+
+def compare(engine_name, history, expected, actual, pairs=1):
+    """Returns a disagreement record, or None if the engine's result matches."""
+    expected = set(expected)
+    actual = set(actual)
+    if expected == actual:
+        return None
+    return {
+        "engine": engine_name,
+        "history": [list(turn) for turn in history],
+        "pairs": pairs,
+        "missing": sorted(expected - actual),  # Possible answers the engine ruled out
+        "extra": sorted(actual - expected),    # Words the engine kept that can't be the answer
+    }
+
+# Words and engines for the checks run in this process (set by init_worker)
+_WORDS = []
+_ENGINES = {}
+
+def init_worker(words, engine_specs):
+    global _WORDS, _ENGINES
+    _WORDS = words
+    _ENGINES = {spec: load_engine(spec)(words) for spec in engine_specs}
+
+def check_guesses(guesses):
+    """Checks every (guess, answer) pair for the given guesses; returns (pairs, turns, disagreements)."""
+    pairs = 0
+    turns = 0
+    disagreements = []
+    for guess in guesses:
+        # Group the answers by the feedback they give; each group is the reference result
+        buckets = {}
+        for answer in _WORDS:
+            buckets.setdefault(get_feedback(guess, answer), []).append(answer)
+        histories = [[(guess, feedback)] for feedback in buckets]
+        pairs += len(_WORDS)
+        turns += len(histories)
+        for name, engine in _ENGINES.items():
+            for history, actual in zip(histories, engine(histories)):
+                expected = buckets[history[0][1]]
+                record = compare(name, history, expected, actual, len(expected))
+                if record:
+                    disagreements.append(record)
+    return pairs, turns, disagreements
+
+def check_histories(histories):
+    """Checks multi-turn histories against the reference filter; returns the disagreements."""
+    disagreements = []
+    expected = [reference_filter(_WORDS, history) for history in histories]
+    for name, engine in _ENGINES.items():
+        for history, wanted, actual in zip(histories, expected, engine(histories)):
+            record = compare(name, history, wanted, actual)
+            if record:
+                disagreements.append(record)
+    return disagreements
+
+def random_histories(words, count, seed=0, max_turns=4):
+    """Random games of 2 to max_turns guesses against random answers."""
+    rng = random.Random(seed)
+    histories = []
+    for _ in range(count):
+        answer = rng.choice(words)
+        guesses = [rng.choice(words) for _ in range(rng.randint(2, max_turns))]
+        histories.append([(guess, get_feedback(guess, answer)) for guess in guesses])
+    return histories
+
+def run_check(words, engine_specs, guesses=None, histories=0, workers=1, seed=0, batch_size=16):
+    """Runs the exhaustive check (and the random histories) and returns a summary dict."""
+    guesses = words if guesses is None else guesses
+    batches = [guesses[i:i + batch_size] for i in range(0, len(guesses), batch_size)]
+    history_list = random_histories(words, histories, seed)
+    history_batches = [history_list[i:i + 100] for i in range(0, len(history_list), 100)]
+
+    pairs = 0
+    turns = 0
+    disagreements = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(words, engine_specs)) as pool:
+        for done, (batch_pairs, batch_turns, batch_disagreements) in enumerate(pool.map(check_guesses, batches), 1):
+            pairs += batch_pairs
+            turns += batch_turns
+            disagreements.extend(batch_disagreements)
+            print(f"\r  checked {min(done * batch_size, len(guesses))}/{len(guesses)} guesses, "
+                  f"{len(disagreements)} disagreements", end="", file=sys.stderr, flush=True)
+        print(file=sys.stderr)
+        for batch_disagreements in pool.map(check_histories, history_batches):
+            disagreements.extend(batch_disagreements)
+
+    return {
+        "words": len(words),
+        "guesses": len(guesses),
+        "pairs": pairs,
+        "distinct_turns": turns,
+        "histories": len(history_list),
+        "engines": list(engine_specs),
+        "seconds": round(time.perf_counter() - start, 2),
+        "disagreements": disagreements,
+    }
+
+def print_summary(summary, show=20):
+    print(f"Checked {summary['pairs']} (guess, answer) pairs ({summary['distinct_turns']} distinct turns) "
+          f"and {summary['histories']} multi-turn histories in {summary['seconds']:.1f}s")
+    for engine in summary["engines"]:
+        found = [record for record in summary["disagreements"] if record["engine"] == engine]
+        pairs = sum(record["pairs"] for record in found)
+        status = "OK" if not found else f"{len(found)} disagreements covering {pairs} pairs"
+        print(f"  {engine:<16} {status}")
+    for record in summary["disagreements"][:show]:
+        turns = " ".join(f"{guess}:{feedback}" for guess, feedback in record["history"])
+        print(f"  [{record['engine']}] {turns}  missing={record['missing'][:8]} extra={record['extra'][:8]}")
+    if len(summary["disagreements"]) > show:
+        print(f"  ... and {len(summary['disagreements']) - show} more")
+
+def main():
+    parser = argparse.ArgumentParser(description="Check every filtering engine against the rules of the game")
+    parser.add_argument("--words", default="words.txt", help="word list (default: words.txt)")
+    parser.add_argument("--engine", action="append",
+                        help=f"engine to check, one of {', '.join(ENGINES)} or module:factory; repeat for several (default: all built-in)")
+    parser.add_argument("--guesses", type=int, help="only check a random sample of this many guesses")
+    parser.add_argument("--histories", type=int, default=0, help="also check this many random multi-turn games")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for sampling guesses and histories")
+    parser.add_argument("--output", help="write the full report, with every disagreement, to this JSON file")
+    args = parser.parse_args()
+
+    words = read_word_file(args.words)
+    guesses = random.Random(args.seed).sample(words, min(args.guesses, len(words))) if args.guesses else words
+    summary = run_check(words, args.engine or list(ENGINES), guesses, args.histories, args.workers, args.seed)
+    print_summary(summary)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(summary, file, indent=2)
+        print(f"Report written to {args.output}")
+    if summary["disagreements"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
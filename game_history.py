@@ -0,0 +1,118 @@
+"""Undo, redo and editing of earlier turns, for the CLI and the GUI.
+
+The game keeps one Snapshot per turn: the candidate bitset and constraints after that turn,
+plus the guess and feedback that led there. Both are immutable values, so undo and redo only
+move a cursor along the list and hand back the snapshot there; nothing is re-filtered.
+Entering new feedback after an undo drops the undone turns, as in a text editor.
+
+Editing an earlier turn keeps the snapshots before it and replays only the turns from there on.
+The constraints are stored packed (see Constraints.pack), so a snapshot of the standard game is
+a few hundred bytes, most of it the candidate bitset.
+"""
+import sys
+
+from constraints import Constraints
+
+class Snapshot:
+    """The state after one turn (or at the start of the game, with no guess)."""
+    __slots__ = ("candidates", "packed", "guess", "feedback")
+
+    def __init__(self, candidates, constraints, guess=None, feedback=None):
+        self.candidates = candidates
+        self.packed = constraints.pack()
+        # Interned, so repeated guesses and the 3^length feedbacks are stored once
+        self.guess = sys.intern(guess) if guess else None
+        self.feedback = sys.intern(feedback) if feedback else None
+
+    @property
+    def constraints(self):
+        return Constraints.unpack(self.packed)
+
+    def size(self):
+        """Bytes held by this snapshot alone (the guess and feedback strings are shared)."""
+        return sys.getsizeof(self) + sys.getsizeof(self.candidates) + sys.getsizeof(self.packed)
+
+class GameHistory:
+    """The turns of one game as a list of snapshots with an undo/redo cursor."""
+
+    def __init__(self, index, candidates=None):
+        self.index = index
+        start = index.all if candidates is None else candidates
+        self.snapshots = [Snapshot(start, Constraints.empty(index.length))]
+        self.position = 0  # Index of the current snapshot; later ones can be redone
+
+    @property
+    def current(self):
+        return self.snapshots[self.position]
+
+    @property
+    def turns(self):
+        """Number of turns played (not counting undone ones)."""
+        return self.position
+
+    def history(self):
+        """The (guess, feedback) pairs played so far, oldest first."""
+        return [(snapshot.guess, snapshot.feedback) for snapshot in self.snapshots[1:self.position + 1]]
+
+    def tried_letters(self):
+        return {letter for guess, _ in self.history() for letter in guess}
+
+    def _next(self, snapshot, guess, feedback):
+        constraints = snapshot.constraints.apply(guess, feedback)
+        return Snapshot(self.index.filter(snapshot.candidates, constraints), constraints, guess, feedback)
+
+    def push(self, guess, feedback):
+        """Plays a turn from the current snapshot, dropping any undone turns, and returns the new snapshot."""
+        snapshot = self._next(self.current, guess, feedback)
+        del self.snapshots[self.position + 1:]
+        self.snapshots.append(snapshot)
+        self.position += 1
+        return snapshot
+
+    def can_undo(self):
+        return self.position > 0
+
+    def can_redo(self):
+        return self.position < len(self.snapshots) - 1
+
+    def undo(self):
+        """Steps back one turn; returns the restored snapshot, or None if there is nothing to undo."""
+        if not self.can_undo():
+            return None
+        self.position -= 1
+        return self.current
+
+    def redo(self):
+        """Steps forward one undone turn; returns the restored snapshot, or None if there is nothing to redo."""
+        if not self.can_redo():
+            return None
+        self.position += 1
+        return self.current
+
+    def edit(self, turn, guess, feedback):
+        """Replaces turn (1-based) and replays only the turns after it; undone turns are dropped.
+
+        Returns the new current snapshot.
+        """
+        if not 1 <= turn <= self.position:
+            raise ValueError(f"No turn {turn} to edit (turns played: {self.position})")
+        later = self.history()[turn:]
+        del self.snapshots[turn:]
+        self.position = turn - 1
+        self.push(guess, feedback)
+        for later_guess, later_feedback in later:
+            self.push(later_guess, later_feedback)
+        return self.current
+
+    def rebase(self, candidates):
+        """Replays the turns played so far from a new starting candidate set (e.g. a changed word list)."""
+        turns = self.history()
+        self.snapshots = [Snapshot(candidates, Constraints.empty(self.index.length))]
+        self.position = 0
+        for guess, feedback in turns:
+            self.push(guess, feedback)
+        return self.current
+
+    def size(self):
+        """Bytes held by all the snapshots, including undone ones."""
+        return sum(snapshot.size() for snapshot in self.snapshots)
@@ -0,0 +1,411 @@
+"""Streaming replay of recorded game logs.
+
+A log has one game per line: the turns in order, each a guess and its feedback in the same
+GGYXX notation the CLI accepts, written either as `crane:GYXXX` or as two tokens `crane GYXXX`.
+Blank lines and lines starting with '#' are skipped. Files ending in .gz are read with gzip.
+
+    crane:XYXXX sport:XXGGX lorry:GGGGG
+
+Every stage is a generator, so memory stays constant however large the file is: lines are read
+lazily, each game is replayed against words.txt as soon as it is parsed, and only running
+totals are kept. A replay checks that the history is possible, i.e. that some word in the list
+gives every recorded feedback, flags the turn where it stops being possible, and records how
+much each guess narrowed the candidates and how it compared with the engine's suggestion.
+
+    python game_logs.py replay games.txt.gz --workers 4
+    python game_logs.py generate games.txt.gz --games 100000
+"""
+import argparse
+import gzip
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import wordle_solver
+from constraints import Constraints
+from patterns import get_feedback
+from suggestion_cache import SuggestionCache, bitset_fingerprint
+from word_index import WordIndex
+
+MAX_EXAMPLES = 20  # Flagged games kept per problem, so a bad file can't grow the report without bound
+
+def open_log(filename):
+    """Opens a plain or gzip log file for reading text."""
+    if filename.endswith(".gz"):
+        return gzip.open(filename, 'rt', encoding="ascii", errors="replace")
+    return open(filename, 'r', encoding="ascii", errors="replace")
+
+def iter_lines(filename, start=0, end=None):
+    """Yields (line number or byte offset, line) for the lines that start in [start, end).
+
+    Plain files can be split into byte ranges this way: a line belongs to the range it starts in,
+    so every line is read by exactly one shard. The first value is the line number when reading
+    the whole file, and the line's byte offset when reading a range (line numbers aren't known
+    without reading everything before it).
+    """
+    if start == 0 and end is None:
+        with open_log(filename) as file:
+            for number, line in enumerate(file, 1):
+                yield number, line
+        return
+
+    with open(filename, 'rb') as file:
+        if start > 0:
+            # Skip the rest of the line in progress; it belongs to the previous shard
+            file.seek(start - 1)
+            file.readline()
+        position = file.tell()
+        while end is None or position < end:
+            line = file.readline()
+            if not line:
+                break
+            yield position, line.decode("ascii", errors="replace")
+            position += len(line)
+
+def parse_game(line):
+    """Parses one log line into [(guess, feedback), ...]; raises ValueError if it is malformed."""
+    tokens = line.split()
+    turns = []
+    pending = None
+    for token in tokens:
+        if ":" in token:
+            guess, _, feedback = token.partition(":")
+            turns.append((guess.lower(), feedback.upper()))
+        elif pending is None:
+            pending = token.lower()
+        else:
+            turns.append((pending, token.upper()))
+            pending = None
+    if pending is not None:
+        raise ValueError(f"guess {pending!r} has no feedback")
+    for guess, feedback in turns:
+        if not guess.isalpha() or len(feedback) != len(guess) or not all(c in "GYX" for c in feedback):
+            raise ValueError(f"malformed turn {guess}:{feedback}")
+    return turns
+
+def iter_games(lines):
+    """Yields (position, history or None, error or None) for every game line."""
+    for position, line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            yield position, parse_game(line), None
+        except ValueError as e:
+            yield position, None, str(e)
+
+class LogStats:
+    """Running totals for a replay; two LogStats can be merged, so shards are summed at the end."""
+
+    def __init__(self):
+        self.games = 0
+        self.solved = 0
+        self.turns = 0
+        self.problems = {}  # reason -> count
+        self.examples = {}  # reason -> a few (position, detail) samples
+        self.guess_counts = {}  # guesses taken -> solved games
+        # Per turn number: [turns, bits of information, candidates before, candidates after]
+        self.narrowing = {}
+        self.engine_turns = 0  # Turns where the engine's suggestion was compared
+        self.engine_matches = 0  # ... and the player chose the same word
+        self.player_left = 0  # Candidates left by the player's guesses (solved games)
+        self.engine_left = 0  # ... and by the engine's suggestion against the same answer
+        self.engine_better = 0
+        self.engine_worse = 0
+
+    def flag(self, reason, position, detail):
+        self.problems[reason] = self.problems.get(reason, 0) + 1
+        examples = self.examples.setdefault(reason, [])
+        if len(examples) < MAX_EXAMPLES:
+            examples.append((position, detail))
+
+    def add_turn(self, turn_number, before, after):
+        entry = self.narrowing.setdefault(turn_number, [0, 0.0, 0, 0])
+        entry[0] += 1
+        entry[1] += math.log2(before / after) if after else 0.0
+        entry[2] += before
+        entry[3] += after
+
+    def merge(self, other):
+        for name in ("games", "solved", "turns", "engine_turns", "engine_matches", "player_left",
+                     "engine_left", "engine_better", "engine_worse"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for reason, count in other.problems.items():
+            self.problems[reason] = self.problems.get(reason, 0) + count
+            examples = self.examples.setdefault(reason, [])
+            examples.extend(other.examples[reason][:MAX_EXAMPLES - len(examples)])
+        for guesses, count in other.guess_counts.items():
+            self.guess_counts[guesses] = self.guess_counts.get(guesses, 0) + count
+        for turn_number, values in other.narrowing.items():
+            entry = self.narrowing.setdefault(turn_number, [0, 0.0, 0, 0])
+            for i, value in enumerate(values):
+                entry[i] += value
+        return self
+
+    def to_dict(self):
+        return {
+            "games": self.games,
+            "solved": self.solved,
+            "turns": self.turns,
+            "problems": dict(self.problems),
+            "examples": {reason: examples for reason, examples in self.examples.items()},
+            "guess_distribution": {str(k): v for k, v in sorted(self.guess_counts.items())},
+            "narrowing": {
+                str(turn): {
+                    "turns": n,
+                    "mean_bits": round(bits / n, 3),
+                    "mean_before": round(before / n, 1),
+                    "mean_after": round(after / n, 1),
+                }
+                for turn, (n, bits, before, after) in sorted(self.narrowing.items())
+            },
+            "engine": {
+                "compared_turns": self.engine_turns,
+                "same_guess_rate": round(self.engine_matches / self.engine_turns, 4) if self.engine_turns else 0.0,
+                "player_mean_left": round(self.player_left / self.engine_turns, 2) if self.engine_turns else 0.0,
+                "engine_mean_left": round(self.engine_left / self.engine_turns, 2) if self.engine_turns else 0.0,
+                "engine_better": self.engine_better,
+                "engine_worse": self.engine_worse,
+            },
+        }
+
+class GameReplayer:
+    """Replays histories against one word list, with a cache of the engine's suggestions."""
+
+    def __init__(self, words, strategy="frequency", compare=True, seed=0):
+        self.index = WordIndex(words, len(words[0]))
+        self.strategy = strategy
+        self.compare = compare
+        self.seed = seed
+        self.cache = SuggestionCache(50000)  # Many games share their first few states
+
+    def suggestion(self, candidates):
+        """The engine's guess for a candidate bitset; ties are broken by a seed derived from the state."""
+        fingerprint = bitset_fingerprint(self.index, candidates)
+
+        def compute():
+            random.seed(f"{self.seed}:{fingerprint}")
+            return wordle_solver.suggest_next_guess(self.index.words_of(candidates), None, self.strategy)
+
+        return self.cache.get_or_compute(self.cache.make_key(fingerprint, self.strategy), compute)
+
+    def replay(self, position, history, stats):
+        """Replays one game into stats."""
+        index = self.index
+        stats.games += 1
+        length = len(history[0][0]) if history else index.length
+        all_green = "G" * length
+        answer = history[-1][0] if history and history[-1][1] == all_green else None
+        if answer is not None and answer not in index:
+            stats.flag("answer_not_in_word_list", position, answer)
+        if any(len(guess) != index.length for guess, _ in history):
+            stats.flag("wrong_length", position, " ".join(guess for guess, _ in history))
+            return
+
+        constraints = Constraints.empty(index.length)
+        candidates = index.all
+        count = len(index)
+        for turn_number, (guess, feedback) in enumerate(history, 1):
+            stats.turns += 1
+            if guess not in index:
+                stats.flag("guess_not_in_word_list", position, guess)
+            if feedback == all_green:
+                if turn_number != len(history):
+                    stats.flag("turns_after_solve", position, f"turn {turn_number}: {guess}")
+                    return
+                if not candidates >> index.positions.get(guess, len(index)) & 1:
+                    stats.flag("impossible_feedback", position, f"turn {turn_number}: {guess}:{feedback}")
+                    return
+                stats.add_turn(turn_number, count, 1)
+                break
+
+            compare = self.compare and answer is not None and count > 2
+            if compare:
+                engine_guess = self.suggestion(candidates)
+
+            previous, constraints = constraints, constraints.apply(guess, feedback)
+            new_candidates = index.filter(candidates, constraints)
+            new_count = index.count(new_candidates)
+            stats.add_turn(turn_number, count, new_count)
+            if not new_count:
+                stats.flag("impossible_feedback", position, f"turn {turn_number}: {guess}:{feedback}")
+                return
+
+            if compare and engine_guess:
+                # What the engine's guess would have left, against the same answer
+                engine_constraints = previous.apply(engine_guess, get_feedback(engine_guess, answer))
+                engine_left = index.count(index.filter(candidates, engine_constraints))
+                stats.engine_turns += 1
+                stats.engine_matches += engine_guess == guess
+                stats.player_left += new_count
+                stats.engine_left += engine_left
+                stats.engine_better += engine_left < new_count
+                stats.engine_worse += engine_left > new_count
+            candidates, count = new_candidates, new_count
+
+        if answer is not None:
+            stats.solved += 1
+            stats.guess_counts[len(history)] = stats.guess_counts.get(len(history), 0) + 1
+
+def replay_lines(lines, replayer):
+    """Replays every game in an iterable of (position, line) and returns the LogStats."""
+    stats = LogStats()
+    for position, history, error in iter_games(lines):
+        if error is not None:
+            stats.games += 1
+            stats.flag("malformed", position, error)
+        elif history:
+            replayer.replay(position, history, stats)
+    return stats
+
+# Replayer for the games handled in this process (set by init_worker)
+_REPLAYER = None
+
+def init_worker(words, strategy, compare, seed):
+    global _REPLAYER
+    _REPLAYER = GameReplayer(words, strategy, compare, seed)
+    wordle_solver.ALL_WORDS = words
+
+def _replay_range(args):
+    filename, start, end = args
+    return replay_lines(iter_lines(filename, start, end), _REPLAYER)
+
+def _replay_batch(lines):
+    return replay_lines(lines, _REPLAYER)
+
+def byte_ranges(filename, shards):
+    """Splits a file into shards contiguous byte ranges."""
+    size = os.path.getsize(filename)
+    step = max(1, -(-size // shards))
+    return [(start, min(size, start + step)) for start in range(0, size, step)]
+
+def batched(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def replay_file(filename, words, strategy="frequency", workers=1, compare=True, seed=0, batch_size=2000):
+    """Replays a whole log file and returns the merged LogStats.
+
+    With several workers a plain file is split into byte ranges, one per shard, that each worker
+    reads on its own. A gzip stream can't be entered in the middle, so it is read here and
+    handed out in batches of lines, with only a few batches in flight at a time.
+    """
+    if workers <= 1:
+        init_worker(words, strategy, compare, seed)
+        return replay_lines(iter_lines(filename), _REPLAYER)
+
+    stats = LogStats()
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(words, strategy, compare, seed)) as pool:
+        if not filename.endswith(".gz"):
+            # A few shards per worker so an uneven shard doesn't leave the others idle
+            shards = [(filename, start, end) for start, end in byte_ranges(filename, workers * 4)]
+            for shard_stats in pool.map(_replay_range, shards):
+                stats.merge(shard_stats)
+            return stats
+
+        pending = []
+        for batch in batched(iter_lines(filename), batch_size):
+            pending.append(pool.submit(_replay_batch, batch))
+            if len(pending) >= workers * 2:
+                stats.merge(pending.pop(0).result())
+        for future in pending:
+            stats.merge(future.result())
+    return stats
+
+def generate_log(filename, words, games, seed=0, noise=0.02):
+    """Writes a synthetic log of solver games (some with random or mistyped turns) for testing."""
+    rng = random.Random(seed)
+    index = WordIndex(words, len(words[0]))
+    with (gzip.open(filename, 'wt', encoding="ascii") if filename.endswith(".gz") else open(filename, 'w')) as file:
+        for _ in range(games):
+            answer = rng.choice(words)
+            candidates = index.all
+            constraints = Constraints.empty(index.length)
+            turns = []
+            for _ in range(6):
+                possible_words = index.words_of(candidates)
+                guess = rng.choice(words) if rng.random() < 0.3 else rng.choice(possible_words[:50])
+                feedback = get_feedback(guess, answer)
+                if rng.random() < noise:
+                    feedback = "".join(rng.choice("GYX") for _ in feedback)  # A mistyped feedback
+                turns.append(f"{guess}:{feedback}")
+                if feedback == "G" * index.length:
+                    break
+                constraints = constraints.apply(guess, feedback)
+                candidates = index.filter(candidates, constraints)
+                if not candidates:
+                    break
+            file.write(" ".join(turns) + "\n")
+
+def print_report(stats, elapsed):
+    report = stats.to_dict()
+    print(f"Replayed {report['games']} games ({report['turns']} turns) in {elapsed:.1f}s "
+          f"({report['games'] / elapsed if elapsed else 0:.0f} games/sec)")
+    print(f"Solved: {report['solved']}")
+    if report["problems"]:
+        print("Problems:")
+        for reason, count in sorted(report["problems"].items()):
+            samples = ", ".join(f"{position}: {detail}" for position, detail in report["examples"][reason][:3])
+            print(f"  {reason:<26}{count:>8}   e.g. {samples}")
+    print("Narrowing per turn:")
+    for turn, entry in report["narrowing"].items():
+        print(f"  turn {turn}: {entry['turns']:>8} turns, {entry['mean_bits']:.2f} bits, "
+              f"{entry['mean_before']:.1f} -> {entry['mean_after']:.1f} candidates")
+    engine = report["engine"]
+    if engine["compared_turns"]:
+        print(f"Engine comparison ({engine['compared_turns']} turns of solved games):")
+        print(f"  player chose the engine's word: {engine['same_guess_rate']:.1%}")
+        print(f"  mean candidates left: player {engine['player_mean_left']}, engine {engine['engine_mean_left']}")
+        print(f"  engine's guess would have left fewer: {engine['engine_better']}, more: {engine['engine_worse']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream, validate and analyse recorded game logs")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    replay = subparsers.add_parser("replay", help="replay a log file and report statistics")
+    replay.add_argument("log", help="log file, optionally gzip-compressed (.gz)")
+    replay.add_argument("--words", default="words.txt", help="word list to validate against (default: words.txt)")
+    replay.add_argument("--length", type=int, default=5, help="letters per word, e.g. 4-8 (default: 5)")
+    replay.add_argument("--workers", type=int, default=1, help="worker processes (default: 1)")
+    replay.add_argument("--strategy", choices=wordle_solver.STRATEGIES, default="frequency",
+                        help="engine to compare the player's guesses with (default: frequency)")
+    replay.add_argument("--no-compare", action="store_true", help="skip the comparison with the engine")
+    replay.add_argument("--seed", type=int, default=0, help="seed for the engine's random choices")
+    replay.add_argument("--json", metavar="FILE", help="also write the statistics as JSON")
+
+    generate = subparsers.add_parser("generate", help="write a synthetic log for testing")
+    generate.add_argument("log", help="output file (.gz to compress)")
+    generate.add_argument("--words", default="words.txt", help="word list (default: words.txt)")
+    generate.add_argument("--length", type=int, default=5, help="letters per word, e.g. 4-8 (default: 5)")
+    generate.add_argument("--games", type=int, default=10000, help="number of games (default: 10000)")
+    generate.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    args = parser.parse_args()
+
+    words = wordle_solver.read_word_file(args.words, args.length)
+    if not words:
+        parser.error(f"No {args.length}-letter words in {args.words}")
+    if args.command == "generate":
+        generate_log(args.log, words, args.games, args.seed)
+        print(f"Wrote {args.games} games to {args.log}")
+        return
+
+    start = time.perf_counter()
+    stats = replay_file(args.log, words, args.strategy, args.workers, not args.no_compare, args.seed)
+    print_report(stats, time.perf_counter() - start)
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(stats.to_dict(), file, indent=2)
+        print(f"Statistics written to {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""Opt-in hot-path instrumentation for the solver.
+
+Set WORDLE_TRACE=trace.jsonl (or pass --trace to the CLI, GUI or simulator) to record one JSON
+line per call of the traced functions: wall time, candidate counts in and out, and the change in
+allocated memory blocks. When tracing is off the functions are left exactly as they are, so
+there is no overhead at all.
+
+    python instrumentation.py summarize trace.jsonl
+"""
+import argparse
+import atexit
+import functools
+import json
+import math
+import os
+import sys
+import threading
+import time
+
+TRACE_ENV = "WORDLE_TRACE"
+
+_writer = None
+
+class TraceWriter:
+    """Appends trace records to a JSON-lines file from any thread."""
+
+    def __init__(self, filename):
+        self.filename = filename
+        # Line buffered, so each record is a single append even with several processes writing
+        self.file = open(filename, 'a', buffering=1)
+        self.lock = threading.Lock()
+        atexit.register(self.close)
+
+    def write(self, record):
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self.lock:
+            if not self.file.closed:
+                self.file.write(line)
+
+    def close(self):
+        with self.lock:
+            if not self.file.closed:
+                self.file.close()
+
+def enable(filename):
+    """Turns tracing on for functions instrumented from now on."""
+    global _writer
+    if _writer is None or _writer.filename != filename:
+        _writer = TraceWriter(filename)
+    return _writer
+
+def is_enabled():
+    return _writer is not None
+
+def _size(value):
+    """Best-effort candidate count for an argument or result."""
+    if isinstance(value, (list, set, frozenset)):  # Not tuples: functions return several values as one
+        return len(value)
+    if isinstance(value, dict) and "possible_words" in value:
+        return len(value["possible_words"])
+    if isinstance(value, int) and not isinstance(value, bool) and value > 0xFFFF:
+        return bin(value).count("1")  # A candidate bitset
+    return None
+
+def traced(func, name=None):
+    """Wraps func to record a trace line per call; returns func itself when tracing is off."""
+    if _writer is None or getattr(func, "__traced__", False):
+        return func
+    name = name or func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        blocks_before = sys.getallocatedblocks()
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        record = {
+            "fn": name,
+            "ts": time.time(),
+            "ms": round(elapsed * 1000, 4),
+            "alloc_blocks": sys.getallocatedblocks() - blocks_before,
+        }
+        # Skip self for methods; the first real argument is the candidate list where there is one
+        for arg in args[:2]:
+            size = _size(arg)
+            if size is not None:
+                record["n_in"] = size
+                break
+        size = _size(result)
+        if size is not None:
+            record["n_out"] = size
+        _writer.write(record)
+        return result
+
+    wrapper.__traced__ = True
+    return wrapper
+
+def instrument_module(namespace, names):
+    """Replaces the named functions in a module namespace (e.g. globals()) with traced versions."""
+    if _writer is None:
+        return
+    for name in names:
+        if name in namespace:
+            namespace[name] = traced(namespace[name], name)
+
+def instrument_class(cls, names):
+    """Replaces the named methods of a class with traced versions."""
+    if _writer is None:
+        return
+    for name in names:
+        setattr(cls, name, traced(getattr(cls, name), f"{cls.__name__}.{name}"))
+
+def profile_call(filename, func, *args, **kwargs):
+    """Runs func under cProfile, dumps the stats to filename and prints the top entries."""
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args, **kwargs)
+    finally:
+        profiler.dump_stats(filename)
+        print(f"\nProfile written to {filename}; top functions by cumulative time:")
+        pstats.Stats(filename).sort_stats("cumulative").print_stats(15)
+
+def summarize(filename, buckets_per_decade=3):
+    """Aggregates a trace file into per-function latency stats and log-scale histograms."""
+    samples = {}
+    with open(filename, 'r') as file:
+        for line in file:
+            if line.strip():
+                record = json.loads(line)
+                samples.setdefault(record["fn"], []).append(record)
+
+    for name, records in sorted(samples.items()):
+        times = sorted(record["ms"] for record in records)
+        count = len(times)
+
+        def pct(p):
+            return times[min(count - 1, int(count * p / 100))]
+
+        print(f"\n{name}: {count} calls, total {sum(times):.1f} ms")
+        print(f"  mean={sum(times) / count:.3f} p50={pct(50):.3f} p90={pct(90):.3f} "
+              f"p99={pct(99):.3f} max={times[-1]:.3f} ms")
+        n_in = [record["n_in"] for record in records if "n_in" in record]
+        n_out = [record["n_out"] for record in records if "n_out" in record]
+        if n_in:
+            print(f"  candidates in: mean={sum(n_in) / len(n_in):.1f} max={max(n_in)}")
+        if n_out:
+            print(f"  candidates out: mean={sum(n_out) / len(n_out):.1f} max={max(n_out)}")
+        allocs = [record.get("alloc_blocks", 0) for record in records]
+        print(f"  allocated blocks: mean={sum(allocs) / count:.1f} max={max(allocs)}")
+
+        # Log-scale latency histogram
+        histogram = {}
+        for ms in times:
+            bucket = math.floor(math.log10(max(ms, 1e-4)) * buckets_per_decade)
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+        largest = max(histogram.values())
+        for bucket in range(min(histogram), max(histogram) + 1):
+            upper = 10 ** ((bucket + 1) / buckets_per_decade)
+            hits = histogram.get(bucket, 0)
+            print(f"  < {upper:10.3f} ms {hits:7} {'#' * round(40 * hits / largest)}")
+    return samples
+
+# Environment opt-in: traced modules check this when they are imported
+if os.environ.get(TRACE_ENV):
+    enable(os.environ[TRACE_ENV])
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize a solver trace file")
+    parser.add_argument("command", choices=["summarize"])
+    parser.add_argument("trace", help="JSON-lines trace file written with WORDLE_TRACE or --trace")
+    args = parser.parse_args()
+    summarize(args.trace)
+
+if __name__ == "__main__":
+    main()
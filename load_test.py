@@ -0,0 +1,226 @@
+"""Load generator for solver_service.py.
+
+Each simulated client plays whole games against the service: it creates a session, then keeps
+playing the suggested word (scored against a random answer) until the game is solved.
+
+Usage: python load_test.py [--url http://127.0.0.1:8080] [--clients 8] [--duration 10]
+
+With --workers 1 2 4 8 it instead starts the service itself with each number of worker processes in
+turn and reports requests/sec and per-worker memory (RSS, PSS and private, read from /proc on
+Linux). PSS splits shared pages between the processes sharing them, so it is the number that shows
+whether memory grows with the worker count.
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlparse
+
+from patterns import get_feedback
+from wordle_solver import read_word_file
+
+class Client:
+    """A keep-alive HTTP connection to the service."""
+
+    def __init__(self, url):
+        parsed = urlparse(url)
+        self.connection = http.client.HTTPConnection(parsed.hostname, parsed.port or 80, timeout=30)
+
+    def request(self, method, path, body=None):
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        headers = {"Content-Type": "application/json"} if data else {}
+        self.connection.request(method, path, body=data, headers=headers)
+        response = self.connection.getresponse()
+        return response.status, json.loads(response.read())
+
+def run_client(url, answers, strategy, deadline, seed, results):
+    """Plays games until the deadline and records (latency, ok) for every request."""
+    rng = random.Random(seed)
+    client = Client(url)
+    latencies = []
+    errors = 0
+    games = 0
+    while time.perf_counter() < deadline:
+        answer = rng.choice(answers)
+        start = time.perf_counter()
+        status, state = client.request("POST", "/sessions", {"strategy": strategy})
+        latencies.append(time.perf_counter() - start)
+        if status != 201:
+            errors += 1
+            continue
+        path = f"/sessions/{state['session_id']}/guesses"
+        while not state["solved"] and state["suggestion"] and state["guesses"] < 6:
+            guess = state["suggestion"]
+            start = time.perf_counter()
+            status, state = client.request("POST", path, {"guess": guess, "feedback": get_feedback(guess, answer)})
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors += 1
+                break
+        client.request("DELETE", f"/sessions/{state.get('session_id', '')}")
+        games += 1
+    results.append((latencies, errors, games))
+
+def run_clients(args):
+    """Runs client threads until the deadline; returns their results and the elapsed time."""
+    url, answers, clients, duration, strategy, seed = args
+    results = []
+    deadline = time.perf_counter() + duration
+    threads = [threading.Thread(target=run_client, args=(url, answers, strategy, deadline, seed + i, results))
+               for i in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, time.perf_counter() - start
+
+def run_load_test(url, answers, clients=8, duration=10.0, strategy="frequency", seed=0, processes=1):
+    """Runs the clients for duration seconds and returns a summary dict.
+
+    With processes > 1 the clients are spread over that many processes, so the load generator's own
+    GIL doesn't cap the throughput of a multi-worker service.
+    """
+    if processes <= 1:
+        results, elapsed = run_clients((url, answers, clients, duration, strategy, seed))
+    else:
+        shares = [clients // processes + (i < clients % processes) for i in range(processes)]
+        tasks = [(url, answers, share, duration, strategy, seed + 1000 * i) for i, share in enumerate(shares) if share]
+        with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+            runs = list(executor.map(run_clients, tasks))
+        results = [result for run_results, _ in runs for result in run_results]
+        elapsed = max(run_elapsed for _, run_elapsed in runs)
+
+    latencies = sorted(latency for client_latencies, _, _ in results for latency in client_latencies)
+    requests = len(latencies)
+
+    def pct(p):
+        return latencies[min(requests - 1, int(requests * p / 100))] * 1000 if requests else 0.0
+
+    return {
+        "clients": clients,
+        "requests": requests,
+        "errors": sum(errors for _, errors, _ in results),
+        "games": sum(games for _, _, games in results),
+        "seconds": elapsed,
+        "requests_per_sec": requests / elapsed if elapsed else 0.0,
+        "p50_ms": pct(50),
+        "p90_ms": pct(90),
+        "p99_ms": pct(99),
+    }
+
+def process_memory(pid):
+    """RSS, PSS and private memory of a process in MB, from /proc/<pid>/smaps_rollup (Linux only)."""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup", 'r') as file:
+        for line in file:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                values[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    return {"rss_mb": values["Rss"], "pss_mb": values["Pss"],
+            "private_mb": values["Private_Clean"] + values["Private_Dirty"]}
+
+def child_pids(pid):
+    """The processes whose parent is pid (the service's workers)."""
+    children = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", 'r') as file:
+                # The command name is in parentheses and may contain spaces; the parent pid is 2 fields after it
+                fields = file.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[1]) == pid:
+            children.append(int(entry))
+    return children
+
+def wait_until_ready(url, timeout=120.0):
+    """Polls /stats until the service answers."""
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            status, _ = Client(url).request("GET", "/stats")
+            if status == 200:
+                return
+        except OSError:
+            pass
+        if time.perf_counter() > deadline:
+            raise RuntimeError(f"Service at {url} did not start within {timeout:.0f}s")
+        time.sleep(0.2)
+
+def run_scaling(worker_counts, answers, clients=8, duration=10.0, strategy="frequency", seed=0, processes=1,
+                port=8090, service_args=()):
+    """Starts the service with each worker count in turn; returns one summary per count, with memory per worker."""
+    service_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "solver_service.py")
+    url = f"http://127.0.0.1:{port}"
+    summaries = []
+    for workers in worker_counts:
+        command = [sys.executable, service_script, "--port", str(port), "--workers", str(workers), *service_args]
+        service = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+        try:
+            wait_until_ready(url)
+            summary = run_load_test(url, answers, clients, duration, strategy, seed, processes)
+            # With one worker the service runs in a single process; otherwise the supervisor only waits
+            worker_pids = child_pids(service.pid) if workers > 1 else [service.pid]
+            memory = [process_memory(pid) for pid in worker_pids]
+            supervisor = process_memory(service.pid) if workers > 1 else None
+        finally:
+            service.terminate()
+            service.wait()
+        summary["workers"] = workers
+        for key in ("rss_mb", "pss_mb", "private_mb"):
+            summary[f"worker_{key}"] = sum(entry[key] for entry in memory) / len(memory)
+        summary["total_pss_mb"] = sum(entry["pss_mb"] for entry in memory) + (supervisor["pss_mb"] if supervisor else 0.0)
+        summaries.append(summary)
+    return summaries
+
+def print_scaling(summaries):
+    print(f"{'workers':>7} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>6} "
+          f"{'RSS/worker':>11} {'PSS/worker':>11} {'private/worker':>15} {'total PSS':>10}")
+    for summary in summaries:
+        print(f"{summary['workers']:>7} {summary['requests_per_sec']:>9.1f} {summary['p50_ms']:>8.2f} "
+              f"{summary['p99_ms']:>8.2f} {summary['errors']:>6} {summary['worker_rss_mb']:>9.1f}MB "
+              f"{summary['worker_pss_mb']:>9.1f}MB {summary['worker_private_mb']:>13.1f}MB {summary['total_pss_mb']:>8.1f}MB")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure requests/sec against a running solver service")
+    parser.add_argument("--url", default="http://127.0.0.1:8080", help="service base URL")
+    parser.add_argument("--clients", type=int, default=8, help="concurrent clients (default: 8)")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run (default: 10)")
+    parser.add_argument("--strategy", default="frequency", help="strategy for the sessions (default: frequency)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for picking answers")
+    parser.add_argument("--processes", type=int, default=1, help="client processes to spread the clients over (default: 1)")
+    parser.add_argument("--workers", type=int, nargs="+", metavar="N",
+                        help="start the service with each number of worker processes and compare (Linux)")
+    parser.add_argument("--port", type=int, default=8090, help="port for the service started by --workers (default: 8090)")
+    parser.add_argument("--guesses", metavar="FILE", help="pass an allowed-guess list to the service started by --workers")
+    parser.add_argument("--output", help="with --workers, also write the results to this JSON file")
+    args = parser.parse_args()
+
+    answers = read_word_file()
+    if args.workers:
+        service_args = ("--guesses", args.guesses) if args.guesses else ()
+        summaries = run_scaling(args.workers, answers, args.clients, args.duration, args.strategy, args.seed,
+                                args.processes, args.port, service_args)
+        print_scaling(summaries)
+        if args.output:
+            with open(args.output, 'w') as file:
+                json.dump(summaries, file, indent=2)
+        return
+
+    summary = run_load_test(args.url, answers, args.clients, args.duration, args.strategy, args.seed, args.processes)
+    print(f"{summary['requests']} requests, {summary['games']} games, {summary['errors']} errors "
+          f"in {summary['seconds']:.1f}s with {summary['clients']} clients")
+    print(f"Throughput: {summary['requests_per_sec']:.1f} requests/sec")
+    print(f"Latency ms: p50={summary['p50_ms']:.2f} p90={summary['p90_ms']:.2f} p99={summary['p99_ms']:.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Anytime two-step lookahead for suggestions, within a time budget.
+
+The strategies in wordle_solver.py score a guess by its feedback alone, one step ahead. Looking
+two steps ahead scores a guess by how many answers are expected to be left after it *and* the
+best follow-up guess for each feedback, which finds better guesses but is too slow to finish on
+every request.
+
+LookaheadSearch makes that trade-off explicit. It first ranks every guess one step ahead (the
+expected number of answers left, see patterns.remaining_scores) and takes the best as its
+answer, which is ready straight away. It then works down that ranking, scoring guesses two
+steps ahead and keeping the best found so far, until the deadline. Most guesses are cut off
+early: a bucket of c answers can at best be cut down to c - 1 by the next guess (solve one, split
+the rest into singletons), so a guess whose bound can't beat the best so far is skipped, and one
+whose running total passes the best is abandoned between buckets. Given enough time the search
+finishes and the answer is the exact two-step optimum over the guess pool.
+"""
+import time
+
+import numpy as np
+
+from patterns import prune_guesses, remaining_scores
+
+OUT_OF_TIME = -1  # score() ran past the deadline before it was done with a guess
+
+class LookaheadSearch:
+    """A two-step search over one set of possible answers; best holds the best guess found so far."""
+
+    def __init__(self, table, possible_words, prune_max_answers=32):
+        self.table = table
+        self.patterns = table.num_patterns
+        self.answer_cols = table.answer_indices(possible_words)
+        self.is_candidate = np.zeros(len(table.guesses), dtype=bool)
+        self.is_candidate[table.guess_indices(possible_words)] = True
+
+        rows = np.arange(len(table.guesses))
+        if len(possible_words) <= prune_max_answers:
+            # Guesses that split the answers the same way score the same at both steps
+            rows, _ = prune_guesses(table.matrix, self.answer_cols, preferred_rows=np.flatnonzero(self.is_candidate),
+                                    patterns=self.patterns)
+        self.rows = rows
+        scores = remaining_scores(table.matrix, self.answer_cols, rows, self.patterns)
+        # Best one-step score first; on a tie, a guess that could be the answer
+        self.order = rows[np.lexsort((~self.is_candidate[rows], scores))]
+
+        self.best = self.order[0]  # The one-step answer until the search has something better
+        self.best_total = None  # Two-step total of best, once it has been scored
+        self.next = 0  # Position in order of the next guess to score
+        self.improved = 0  # Guesses scored in full, each one better than the best before it
+        self.cut = 0
+
+    @property
+    def complete(self):
+        return self.next >= len(self.order)
+
+    @property
+    def best_guess(self):
+        return self.table.guesses[self.best]
+
+    def buckets(self, row):
+        """The answer columns of each feedback bucket of a guess, biggest first, without the all-green one."""
+        codes = np.asarray(self.table.matrix[row, self.answer_cols])
+        order = np.argsort(codes, kind="stable")
+        codes = codes[order]
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        buckets = [self.answer_cols[group] for group, code in zip(np.split(order, starts[1:]), codes[starts])
+                   if code != self.patterns - 1]
+        buckets.sort(key=len, reverse=True)
+        return buckets
+
+    def score(self, row, limit, deadline=None):
+        """Two-step total of a guess: summed over its buckets, the best follow-up's squared bucket sizes.
+
+        Divided by the number of answers it is the expected number left after two guesses.
+        Returns None as soon as the total can't come in under limit, or OUT_OF_TIME if
+        time.perf_counter() passes the deadline first.
+        """
+        buckets = self.buckets(row)
+        bound = sum(len(bucket) - 1 for bucket in buckets)
+        if limit is not None and bound >= limit:
+            return None
+        total = 0
+        for bucket in buckets:
+            bound -= len(bucket) - 1
+            if len(bucket) <= 2:
+                best = len(bucket) - 1  # Guess one of them: solved, or one left
+            else:
+                best = int(remaining_scores(self.table.matrix, bucket, self.rows, self.patterns).min())
+            total += best
+            if limit is not None and total + bound >= limit:
+                return None
+            if deadline is not None and bound and time.perf_counter() >= deadline:
+                return OUT_OF_TIME
+        return total
+
+    def step(self, deadline=None):
+        """Scores the next guess in one-step order; returns False once every guess has been scored or cut.
+
+        A guess left unfinished at the deadline is scored again from the start by the next step.
+        """
+        if self.complete:
+            return False
+        row = self.order[self.next]
+        limit = self.best_total
+        if limit is not None and self.is_candidate[row] and not self.is_candidate[self.best]:
+            limit += 1  # Ties go to guesses that could be the answer
+        total = self.score(row, limit, deadline)
+        if total == OUT_OF_TIME:
+            return True
+        self.next += 1
+        if total is None:
+            self.cut += 1
+        else:
+            self.improved += 1
+            self.best, self.best_total = row, total
+        return not self.complete
+
+    def run(self, deadline):
+        """Refines best until the search is complete or time.perf_counter() passes the deadline."""
+        while time.perf_counter() < deadline and self.step(deadline):
+            pass
+        return self.best_guess
+
+    def stats(self):
+        return {
+            "guesses": len(self.order),
+            "improved": self.improved,
+            "cut": self.cut,
+            "complete": self.complete,
+            "depth": 2 if self.best_total is not None else 1,
+            "expected_remaining": round(self.best_total / len(self.answer_cols), 3) if self.best_total is not None else None,
+        }
+
+def lookahead_guess(table, possible_words, time_budget_ms, prune_max_answers=32):
+    """Returns (guess, stats): the best two-step guess found within the time budget.
+
+    The one-step ranking is always finished first, so a budget of 0 gives the one-step best.
+    """
+    start = time.perf_counter()
+    search = LookaheadSearch(table, possible_words, prune_max_answers)
+    guess = search.run(start + time_budget_ms / 1000)
+    stats = search.stats()
+    stats["ms"] = round((time.perf_counter() - start) * 1000, 2)
+    return guess, stats
@@ -0,0 +1,143 @@
+"""Multi-board solving (Dordle, Quordle, Octordle): several hidden words, one shared guess per turn.
+
+Every board keeps its own candidate set as an array of answer columns in the feedback table.
+A guess is scored by the information it gives on all the unsolved boards together: the sum of
+its feedback entropy on each board, plus the expected number of boards it solves outright.
+Every guess is scored against every board with a single offset bincount per block of guesses,
+the same kernel as patterns.entropy_scores with one more offset for the board.
+"""
+import numpy as np
+
+from patterns import CHUNK_BYTES, encode_feedback, get_pattern_table
+
+# Guesses allowed per game for the usual variants
+MAX_GUESSES = {1: 6, 2: 7, 4: 9, 8: 13}
+
+def max_guesses(boards):
+    return MAX_GUESSES.get(boards, boards + 5)
+
+class MultiBoardState:
+    """The state of one multi-board game; treated as immutable, so it can be handed to a worker thread.
+
+    boards[b] holds the answer columns still possible on board b, solved[b] the word that solved
+    it (or None), and history the (guess, feedbacks) turns played so far.
+    """
+    __slots__ = ("boards", "solved", "history")
+
+    def __init__(self, boards, solved, history):
+        self.boards = tuple(boards)
+        self.solved = tuple(solved)
+        self.history = tuple(history)
+
+    @property
+    def num_boards(self):
+        return len(self.boards)
+
+    @property
+    def guesses_used(self):
+        return len(self.history)
+
+    def unsolved(self):
+        """Returns the indices of the boards that are still being played."""
+        return [b for b, word in enumerate(self.solved) if word is None]
+
+    def is_finished(self):
+        return all(word is not None for word in self.solved)
+
+class MultiBoardSolver:
+    """Filters and scores several boards over one word list and a shared feedback table."""
+
+    def __init__(self, words, num_boards, guesses=None):
+        self.words = list(words)
+        self.num_boards = num_boards
+        self.length = len(self.words[0])
+        # Guesses may include words that can't be the answer (e.g. past used words)
+        self.table = get_pattern_table(guesses if guesses is not None else self.words)
+        if not self.table.covers(self.words):
+            self.table = get_pattern_table(self.words)
+        self.answer_cols = self.table.answer_indices(self.words)
+        self.patterns = self.table.num_patterns
+        self.all_green = "G" * self.length
+        # Guess row of each answer column, so "this guess could be board b's answer" is a lookup
+        self.col_guess_rows = np.full(len(self.table.answers), -1, dtype=np.intp)
+        self.col_guess_rows[self.answer_cols] = self.table.guess_indices(self.words)
+
+    def new_game(self):
+        return MultiBoardState([self.answer_cols] * self.num_boards, [None] * self.num_boards, [])
+
+    def apply(self, state, guess, feedbacks):
+        """Returns the state after a guess; feedbacks has one 'GYX' string per board (ignored for solved boards)."""
+        if len(feedbacks) != state.num_boards:
+            raise ValueError(f"Expected feedback for {state.num_boards} boards, got {len(feedbacks)}")
+        row = self.table.guess_index.get(guess)
+        if row is None:
+            raise ValueError(f"Guess {guess!r} is not in the word list")
+        codes = np.asarray(self.table.matrix[row])
+
+        boards = list(state.boards)
+        solved = list(state.solved)
+        for b in state.unsolved():
+            feedback = feedbacks[b].upper()
+            if feedback == self.all_green:
+                solved[b] = guess
+                boards[b] = self.table.answer_indices([guess]) if guess in self.table.answer_index else boards[b][:0]
+                continue
+            cols = boards[b]
+            boards[b] = cols[codes[cols] == encode_feedback(feedback)]
+        return MultiBoardState(boards, solved, state.history + ((guess, tuple(feedbacks)),))
+
+    def candidates(self, state, board):
+        """Returns the words still possible on one board."""
+        if state.solved[board] is not None:
+            return [state.solved[board]]
+        return [self.table.answers[col] for col in state.boards[board]]
+
+    def scores(self, state, budget=CHUNK_BYTES):
+        """Scores every guess for the unsolved boards in one pass per block of guesses.
+
+        Returns (entropy summed over the boards, expected number of boards solved), both per guess row.
+        """
+        unsolved = [b for b in state.unsolved() if len(state.boards[b])]
+        num_guesses = len(self.table.guesses)
+        if not unsolved:
+            return np.zeros(num_guesses), np.zeros(num_guesses)
+
+        cols = np.concatenate([state.boards[b] for b in unsolved])
+        sizes = np.array([len(state.boards[b]) for b in unsolved], dtype=np.float64)
+        board_of_col = np.repeat(np.arange(len(unsolved)), sizes.astype(np.intp))
+        buckets = len(unsolved) * self.patterns
+        # Each board gets its own block of buckets, and each guess row its own block of those
+        col_offsets = (board_of_col * self.patterns).astype(np.int64)
+
+        largest = int(sizes.max())
+        counts_xlogx = np.arange(largest + 1, dtype=np.float64)
+        counts_xlogx *= np.log2(np.maximum(counts_xlogx, 1))
+
+        entropy = np.empty(num_guesses, dtype=np.float64)
+        step = max(1, budget // (len(cols) * 12 + buckets * 16))
+        for start in range(0, num_guesses, step):
+            stop = min(num_guesses, start + step)
+            block = np.asarray(self.table.matrix[start:stop][:, cols], dtype=np.int64)
+            row_offsets = np.arange(stop - start, dtype=np.int64)[:, None] * buckets
+            counts = np.bincount((block + col_offsets + row_offsets).ravel(), minlength=(stop - start) * buckets)
+            weighted = counts_xlogx[counts].reshape(stop - start, len(unsolved), self.patterns).sum(axis=2)
+            # H_b = log2(n_b) - sum(c log2 c) / n_b, summed over the boards
+            entropy[start:stop] = (np.log2(sizes) - weighted / sizes).sum(axis=1)
+
+        # A guess that is board b's answer solves it with probability 1 / n_b
+        solve_chance = np.zeros(num_guesses, dtype=np.float64)
+        np.add.at(solve_chance, self.col_guess_rows[cols], 1.0 / sizes[board_of_col])
+        return entropy, solve_chance
+
+    def suggest(self, state):
+        """Returns the best next guess, or None when every board is solved or has no candidates left."""
+        unsolved = [b for b in state.unsolved() if len(state.boards[b])]
+        if not unsolved:
+            return None
+        # A board that is down to one word should be finished now: it costs a guess either way
+        for b in unsolved:
+            if len(state.boards[b]) == 1:
+                return self.table.answers[state.boards[b][0]]
+        entropy, solve_chance = self.scores(state)
+        # Bits of information plus boards expected to be solved this turn; ties go to the entropy
+        return self.table.guesses[np.lexsort((-entropy, -(entropy + solve_chance)))[0]]
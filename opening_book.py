@@ -0,0 +1,230 @@
+"""Offline builder and in-game lookup for the opening book: the best first guess and the best reply to each of its feedbacks.
+
+The first two turns always start from the same candidate sets: the whole answer universe, then
+one of its buckets under the opener's feedback. The book ranks every allowed guess against the
+universe once, keeps the best as the opener, and stores the best second guess for every
+feedback the opener can get, so in game the first two turns are a dictionary lookup.
+
+The book records a hash of the word lists it was built for, and its answers. When a few answers
+change (e.g. a new word in past_used_words.txt), the solver brings it up to date at startup with
+update_book, which takes milliseconds. Any other change rebuilds it, which also builds the
+feedback table if no cached one matches.
+
+The book holds the entropy strategy's guesses, but every strategy opens from it, the frequency
+strategy included (it used to open from a fixed list of starters).
+
+Each guess pool (word file, word length and extra allowed guesses) gets its own book file, named
+by book_file, so other word lists don't overwrite the standard game's book.
+
+Usage: python opening_book.py [--workers 4] [--top 20] [--output FILE]
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from patterns import encode_feedback, entropy_scores, get_pattern_table, word_list_hash
+
+BOOK_FILE = "opening_book-{pool}.json"  # {pool} identifies the guess pool (see book_file)
+TOP_OPENERS = 20  # Ranked openers kept in the file, for reference
+MAX_UPDATE_WORDS = 50  # Changed answers update_book may apply at startup; beyond that the opener may no longer be the best
+
+def book_file(guesses):
+    """The default book file for a guess pool. Past answers changing doesn't change it; the book is rebuilt in place."""
+    return BOOK_FILE.format(pool=word_list_hash(guesses, ())[:8])
+
+def _table_for(guesses, answers):
+    """The guesses x answers feedback table; small even for a large allowed-guess pool."""
+    return get_pattern_table(guesses, answers)
+
+def best_guess(table, answer_cols, scores):
+    """Highest-entropy guess, preferring one that could itself be the answer (as suggest_entropy_guess does)."""
+    is_candidate = np.zeros(len(table.guesses), dtype=bool)
+    is_candidate[table.guess_indices([table.answers[col] for col in answer_cols])] = True
+    return table.guesses[np.lexsort((~is_candidate, -scores))[0]]
+
+def _score_rows(args):
+    """Worker: entropy of a range of guess rows over the whole answer universe."""
+    guesses, answers, start, stop = args
+    table = _table_for(guesses, answers)
+    cols = table.answer_indices(answers)
+    return start, entropy_scores(table.matrix, cols, np.arange(start, stop), patterns=table.num_patterns)
+
+def _best_reply(table, words):
+    """The best second guess when the opener left these words."""
+    if len(words) <= 2:
+        return words[0]  # Guess one of them: it is right half the time
+    cols = table.answer_indices(words)
+    return best_guess(table, cols, entropy_scores(table.matrix, cols, patterns=table.num_patterns))
+
+def _best_replies(args):
+    """Worker: the best second guess for each (code, bucket words) pair."""
+    guesses, answers, buckets = args
+    table = _table_for(guesses, answers)
+    return {code: _best_reply(table, words) for code, words in buckets}
+
+def _run(tasks, func, workers):
+    if workers <= 1:
+        return [func(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, tasks))
+
+def build_book(guesses, answers, workers=1, top=TOP_OPENERS):
+    """Ranks every guess as an opener and finds the best reply to each of the best opener's feedbacks."""
+    # Build (or load) the table once here, so the workers just memory-map it from the cache
+    table = _table_for(guesses, answers)
+    answer_cols = table.answer_indices(answers)
+
+    num_guesses = len(table.guesses)
+    step = -(-num_guesses // max(1, workers))
+    scores = np.empty(num_guesses, dtype=np.float64)
+    tasks = [(guesses, answers, start, min(num_guesses, start + step)) for start in range(0, num_guesses, step)]
+    for start, block in _run(tasks, _score_rows, workers):
+        scores[start:start + len(block)] = block
+
+    opener = best_guess(table, answer_cols, scores)
+    ranked = np.argsort(-scores, kind="stable")[:top]
+    openers = [[table.guesses[row], round(float(scores[row]), 4)] for row in ranked]
+
+    codes = np.asarray(table.matrix[table.guess_index[opener], answer_cols])
+    buckets = {}
+    for code, col in zip(codes.tolist(), answer_cols.tolist()):
+        buckets.setdefault(code, []).append(table.answers[col])
+    all_green = table.num_patterns - 1
+    buckets.pop(all_green, None)
+    # Largest buckets are the slowest; deal them out round-robin so the workers finish together
+    order = sorted(buckets.items(), key=lambda item: -len(item[1]))
+    shards = max(1, workers)
+    replies = {}
+    for shard_replies in _run([(guesses, answers, order[i::shards]) for i in range(shards)], _best_replies, workers):
+        replies.update(shard_replies)
+    return OpeningBook(word_list_hash(guesses, answers), opener, replies, openers, answers)
+
+def update_book(book, guesses, universe, answers, changed):
+    """Returns the book for an answer list that differs from the book's by the changed words.
+
+    Used when a word is added to the past answers: the opener is kept, and only the replies for
+    the feedback buckets that gained or lost a word are recomputed, using the guesses x universe
+    table (universe being every word, past answers included) that the solver already has loaded.
+    A full build_book() may pick a different opener once many answers have changed.
+    """
+    table = get_pattern_table(guesses) if guesses == universe else get_pattern_table(guesses, universe)
+    opener_row = table.matrix[table.guess_index[book.opener]]
+    codes = np.asarray(opener_row[table.answer_indices(answers)])
+    all_green = table.num_patterns - 1
+    replies = dict(book.replies)
+    for code in {int(opener_row[table.answer_index[word]]) for word in changed} - {all_green}:
+        words = [word for word, word_code in zip(answers, codes.tolist()) if word_code == code]
+        if words:
+            replies[code] = _best_reply(table, words)
+        else:
+            replies.pop(code, None)
+    return OpeningBook(word_list_hash(guesses, answers), book.opener, replies, book.openers, answers)
+
+class OpeningBook:
+    """The opener and its replies for one (guesses, answers) universe."""
+
+    def __init__(self, universe, opener, replies, openers=(), answers=()):
+        self.universe = universe
+        self.opener = opener
+        self.replies = replies  # feedback code -> second guess
+        self.openers = [tuple(entry) for entry in openers]  # (guess, bits), best first
+        self.answers = list(answers)  # The answers it was built for, so a later change can be applied by update_book
+
+    def lookup(self, history):
+        """Returns the book's guess after the (guess, feedback) turns so far, or None once out of book."""
+        if not history:
+            return self.opener
+        if len(history) == 1 and history[0][0] == self.opener:
+            feedback = history[0][1]
+            return self.replies.get(encode_feedback(feedback) if isinstance(feedback, str) else feedback)
+        return None
+
+    def matches(self, guesses, answers):
+        """Checks whether this book was built for the given word lists."""
+        return self.universe == word_list_hash(guesses, answers)
+
+    def changed_answers(self, guesses, universe, answers):
+        """The answers added or removed since the book was built, or None if update_book can't bring it up to date."""
+        if not self.answers or not self.matches(guesses, self.answers):
+            return None  # Saved without its answers, or built for another guess pool
+        changed = sorted(set(self.answers).symmetric_difference(answers))
+        known = set(universe)
+        if len(changed) > MAX_UPDATE_WORDS or not known.issuperset(changed) or not known.issuperset(answers):
+            return None
+        return changed
+
+    def save(self, filename):
+        data = {"universe": self.universe, "opener": self.opener, "openers": [list(entry) for entry in self.openers],
+                "replies": {str(code): guess for code, guess in sorted(self.replies.items())}, "answers": self.answers}
+        # Written to a temporary file first, so a process loading the book never sees half of it
+        tmp_path = f"{filename}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as file:
+            json.dump(data, file)
+        os.replace(tmp_path, filename)
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename, 'r') as file:
+            data = json.load(file)
+        replies = {int(code): guess for code, guess in data["replies"].items()}
+        return cls(data["universe"], data["opener"], replies, data.get("openers", ()), data.get("answers", ()))
+
+def load_opening_book(guesses, answers, filename=None, rebuild=True, universe=None):
+    """Loads the book if it was built for these word lists; otherwise updates or rebuilds it and saves it (if rebuild).
+
+    filename defaults to the guess pool's own file (see book_file). With universe (every word,
+    past answers included, whose guesses x universe table fits in memory), a book only a few
+    answers out of date is updated with update_book instead of being rebuilt.
+    """
+    filename = filename or book_file(guesses)
+    try:
+        book = OpeningBook.load(filename)
+    except (FileNotFoundError, ValueError, KeyError):
+        book = None
+    if book is not None and book.matches(guesses, answers):
+        return book
+    if not rebuild:
+        return None
+    changed = book.changed_answers(guesses, universe, answers) if book is not None and universe else None
+    if changed is not None:
+        print(f"Updating the opening book for {len(changed)} changed answer(s) ({filename})...")
+        book = update_book(book, guesses, universe, answers, changed)
+    else:
+        print(f"Building the opening book for the current word list ({filename})...")
+        book = build_book(guesses, answers)
+    try:
+        book.save(filename)
+    except OSError as e:
+        print(f"Warning: could not save {filename}: {e}")
+    return book
+
+def main():
+    from wordle_solver import load_past_words, load_words, read_word_file
+
+    parser = argparse.ArgumentParser(description="Precompute the opening book for the current word list")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--top", type=int, default=TOP_OPENERS, help=f"ranked openers to keep (default: {TOP_OPENERS})")
+    parser.add_argument("--output", default=None, help="book file to write (default: the word list's own file, see book_file)")
+    args = parser.parse_args()
+
+    load_past_words()
+    answers = load_words()
+    guesses = read_word_file()
+    workers = args.workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    book = build_book(guesses, answers, workers, args.top)
+    output = args.output or book_file(guesses)
+    book.save(output)
+
+    print("Best openers:")
+    for guess, bits in book.openers[:10]:
+        print(f"  {guess}  {bits:.3f} bits")
+    print(f"Wrote '{book.opener}' and {len(book.replies)} replies to {output} in {time.perf_counter() - start:.1f}s")
+
+if __name__ == "__main__":
+    main()
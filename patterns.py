@@ -0,0 +1,373 @@
+import hashlib
+import os
+
+import numpy as np
+
+# Feedback is stored as a base-3 number with one digit per position:
+# X (gray) = 0, Y (yellow) = 1, G (green) = 2, first letter = least significant digit.
+# For 5-letter words every code fits in 0-242, so the full table is uint8; 6-10 letter
+# words need uint16.
+FEEDBACK_DIGITS = {'X': 0, 'Y': 1, 'G': 2}
+FEEDBACK_LETTERS = "XYG"
+NUM_PATTERNS = 3 ** 5
+ALL_GREEN = NUM_PATTERNS - 1
+
+CACHE_DIR = os.environ.get("WORDLE_CACHE_DIR") or os.path.join(os.path.dirname(os.path.abspath(__file__)), ".wordle_cache")
+
+# Working memory for one block of a table build or entropy pass. Tables bigger than
+# MAX_TABLE_BYTES are never built; the entropy strategy streams over them instead.
+CHUNK_BYTES = 64 * 1024 * 1024
+MAX_TABLE_BYTES = 256 * 1024 * 1024
+
+def num_patterns(length=5):
+    """Returns how many different feedbacks a word of this length can get."""
+    return 3 ** length
+
+def pattern_dtype(length=5):
+    """Returns the smallest unsigned dtype that holds every feedback code for this length."""
+    if length <= 5:
+        return np.uint8
+    if length <= 10:
+        return np.uint16
+    raise ValueError(f"Words longer than 10 letters are not supported (got {length})")
+
+def table_bytes(num_guesses, num_answers, length=5):
+    """Returns the size of a full guess x answer table."""
+    return num_guesses * num_answers * np.dtype(pattern_dtype(length)).itemsize
+
+def chunk_rows(num_answers, length=5, budget=CHUNK_BYTES):
+    """Returns how many guess rows compute_patterns can do at once within the memory budget."""
+    # compute_patterns keeps a bool plane per position plus a few uint8/uint16 planes alive
+    return max(1, budget // max(1, num_answers * (length + 8)))
+
+def encode_feedback(feedback):
+    """Converts a feedback string like 'GYXXG' into its base-3 code."""
+    code = 0
+    for fb in reversed(feedback.upper()):
+        code = code * 3 + FEEDBACK_DIGITS[fb]
+    return code
+
+def decode_feedback(code, length=5):
+    """Converts a base-3 feedback code back into a 'GYXXG' style string."""
+    letters = []
+    for _ in range(length):
+        letters.append(FEEDBACK_LETTERS[code % 3])
+        code //= 3
+    return "".join(letters)
+
+def get_feedback(guess, answer):
+    """Returns the feedback string Wordle would give for guess against answer."""
+    result = ['X'] * len(guess)
+    unmatched = {}
+
+    # Greens first, so they can't be "used up" by an earlier yellow
+    for i, (g, a) in enumerate(zip(guess, answer)):
+        if g == a:
+            result[i] = 'G'
+        else:
+            unmatched[a] = unmatched.get(a, 0) + 1
+
+    # Yellows left to right, limited by how many of the letter are still unmatched
+    for i, g in enumerate(guess):
+        if result[i] != 'G' and unmatched.get(g, 0) > 0:
+            result[i] = 'Y'
+            unmatched[g] -= 1
+
+    return "".join(result)
+
+def words_to_array(words, length=5):
+    """Packs a list of equal-length words into an (N, length) uint8 array of letter indices (a=0)."""
+    if not words:
+        return np.zeros((0, length), dtype=np.uint8)
+    raw = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8)
+    return (raw.reshape(len(words), -1) - ord('a')).astype(np.uint8)
+
+def compute_patterns(guess_array, answer_array):
+    """Computes the (guesses x answers) feedback code matrix for two packed word arrays.
+
+    Works on 2-D (guesses, answers) planes only: a guess letter that isn't green is yellow when
+    the answer has more unmatched copies of it than earlier non-green slots of the guess used.
+    """
+    length = guess_array.shape[1]
+    dtype = pattern_dtype(length)
+    g = guess_array.T[:, :, None]   # (length, guesses, 1)
+    a = answer_array.T[:, None, :]  # (length, 1, answers)
+
+    green = [g[i] == a[i] for i in range(length)]
+    codes = np.zeros((guess_array.shape[0], answer_array.shape[0]), dtype=dtype)
+    for i in range(length):
+        codes += green[i].astype(dtype) * dtype(2 * 3 ** i)
+
+    for i in range(length):
+        # Copies of this letter in the answer that no green accounts for
+        available = np.zeros(codes.shape, dtype=np.uint8)
+        for j in range(length):
+            available += (a[j] == g[i]) & ~green[j]
+        # Earlier yellow or gray slots of the guess with the same letter, which use copies first
+        earlier = np.zeros(codes.shape, dtype=np.uint8)
+        for k in range(i):
+            earlier += (g[k] == g[i]) & ~green[k]
+        is_yellow = ~green[i] & (available > earlier)
+        codes += is_yellow.astype(dtype) * dtype(3 ** i)
+
+    return codes
+
+def iter_pattern_blocks(guess_array, answer_array, chunk_size=None):
+    """Yields (start row, feedback block) for consecutive blocks of guesses.
+
+    Only one block is in memory at a time, so a table can be written out or scored without
+    ever holding all of it.
+    """
+    chunk_size = chunk_size or chunk_rows(answer_array.shape[0], answer_array.shape[1])
+    for start in range(0, guess_array.shape[0], chunk_size):
+        yield start, compute_patterns(guess_array[start:start + chunk_size], answer_array)
+
+def build_pattern_matrix(guesses, answers, chunk_size=None):
+    """Builds the full guess x answer feedback matrix, a block of guesses at a time."""
+    length = len(guesses[0]) if guesses else 5
+    guess_array = words_to_array(guesses, length)
+    answer_array = words_to_array(answers, length)
+    matrix = np.empty((len(guesses), len(answers)), dtype=pattern_dtype(length))
+    for start, block in iter_pattern_blocks(guess_array, answer_array, chunk_size):
+        matrix[start:start + block.shape[0]] = block
+    return matrix
+
+def write_pattern_matrix(path, guesses, answers, chunk_size=None):
+    """Writes the feedback matrix straight to an .npy file, one block of guesses at a time."""
+    length = len(guesses[0]) if guesses else 5
+    guess_array = words_to_array(guesses, length)
+    answer_array = words_to_array(answers, length)
+    # open_memmap writes a valid .npy header; the rows are then appended with plain writes so
+    # the blocks never stay resident in this process
+    header = np.lib.format.open_memmap(path, mode='w+', dtype=pattern_dtype(length),
+                                       shape=(len(guesses), len(answers)))
+    offset = header.offset
+    del header
+    with open(path, 'r+b') as file:
+        file.seek(offset)
+        for _, block in iter_pattern_blocks(guess_array, answer_array, chunk_size):
+            file.write(block.tobytes())
+
+def word_list_hash(guesses, answers):
+    """Returns a short hash identifying a (guesses, answers) pair of word lists."""
+    digest = hashlib.sha256()
+    digest.update("\n".join(guesses).encode("ascii"))
+    digest.update(b"\0")
+    digest.update("\n".join(answers).encode("ascii"))
+    return digest.hexdigest()[:16]
+
+def load_pattern_matrix(guesses, answers=None, cache_dir=CACHE_DIR):
+    """Returns the feedback matrix for the word lists, memory-mapped from the on-disk cache.
+
+    The cache file is named after a hash of both word lists, so it is rebuilt automatically
+    whenever either list changes.
+    """
+    if answers is None:
+        answers = guesses
+    path = os.path.join(cache_dir, f"patterns-{word_list_hash(guesses, answers)}.npy")
+
+    try:
+        matrix = np.load(path, mmap_mode='r')
+        if matrix.shape == (len(guesses), len(answers)):
+            return matrix
+    except (FileNotFoundError, ValueError):
+        pass
+
+    print(f"Building feedback table for {len(guesses)} x {len(answers)} words...")
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write to a temporary file first so a concurrent reader never sees half a table
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    write_pattern_matrix(tmp_path, guesses, answers)
+    os.replace(tmp_path, path)
+    return np.load(path, mmap_mode='r')
+
+class PatternTable:
+    """A guess x answer feedback table plus the word <-> row/column lookups needed to use it."""
+
+    def __init__(self, guesses, answers=None, cache_dir=CACHE_DIR):
+        self.guesses = list(guesses)
+        self.answers = list(answers) if answers is not None else self.guesses
+        self.guess_index = {word: i for i, word in enumerate(self.guesses)}
+        self.answer_index = {word: i for i, word in enumerate(self.answers)}
+        self.length = len(self.guesses[0]) if self.guesses else 5
+        self.num_patterns = num_patterns(self.length)
+        self.matrix = load_pattern_matrix(self.guesses, self.answers, cache_dir)
+
+    def answer_indices(self, words):
+        """Returns the column indices of words in the answer list."""
+        return np.fromiter((self.answer_index[word] for word in words), dtype=np.intp, count=len(words))
+
+    def guess_indices(self, words):
+        """Returns the row indices of words in the guess list."""
+        return np.fromiter((self.guess_index[word] for word in words), dtype=np.intp, count=len(words))
+
+    def covers(self, words):
+        """Checks whether every word is a known answer in this table."""
+        return all(word in self.answer_index for word in words)
+
+    def feedback(self, guess, answer):
+        """Looks up the feedback code for a single guess/answer pair."""
+        return int(self.matrix[self.guess_index[guess], self.answer_index[answer]])
+
+    def filter(self, words, guess, feedback):
+        """Keeps the words that would have produced this feedback for the guess."""
+        code = encode_feedback(feedback) if isinstance(feedback, str) else feedback
+        row = self.matrix[self.guess_index[guess]]
+        return [word for word, idx in zip(words, self.answer_indices(words)) if row[idx] == code]
+
+def _block_entropy(block, patterns, xlogx):
+    """Entropy of each row of a (guesses, answers) block of feedback codes.
+
+    All rows are scored with a single bincount: each row's codes are offset into their own
+    block of `patterns` buckets so the counts for every guess come out of one pass.
+    """
+    num_guesses, num_answers = block.shape
+    offset_dtype = np.int32 if num_guesses * patterns < 2 ** 31 else np.int64
+    offsets = np.arange(0, num_guesses * patterns, patterns, dtype=offset_dtype)[:, None]
+    counts = np.bincount((block + offsets).ravel(), minlength=num_guesses * patterns)
+    # H = log2(n) - sum(c * log2(c)) / n, with c * log2(c) looked up instead of recomputed
+    weighted = xlogx[counts].reshape(num_guesses, patterns).sum(axis=1)
+    return np.log2(num_answers) - weighted / num_answers
+
+def _xlogx(num_answers):
+    sizes = np.arange(num_answers + 1, dtype=np.float64)
+    return sizes * np.log2(np.maximum(sizes, 1))
+
+def entropy_scores(matrix, answer_cols, guess_rows=None, patterns=NUM_PATTERNS, budget=CHUNK_BYTES):
+    """Returns the Shannon entropy (in bits) of each guess's feedback distribution over the answers.
+
+    patterns is the number of possible codes (num_patterns(length)). Guesses are scored a block
+    at a time so the bucket counts stay within the memory budget for long words and big lists.
+    """
+    guess_rows = np.arange(matrix.shape[0]) if guess_rows is None else np.asarray(guess_rows)
+    num_answers = len(answer_cols)
+    xlogx = _xlogx(num_answers)
+    # Per guess row: the gathered codes, their offset copies and the bucket counts
+    step = max(1, budget // (num_answers * 12 + patterns * 16))
+    scores = np.empty(len(guess_rows), dtype=np.float64)
+    for start in range(0, len(guess_rows), step):
+        rows = guess_rows[start:start + step]
+        scores[start:start + len(rows)] = _block_entropy(matrix[np.ix_(rows, answer_cols)], patterns, xlogx)
+    return scores
+
+def remaining_scores(matrix, answer_cols, guess_rows=None, patterns=NUM_PATTERNS, budget=CHUNK_BYTES):
+    """Returns, for each guess, the sum of squared bucket sizes of its feedback over the answers.
+
+    Divided by the number of answers this is the expected number of answers left after the guess.
+    The all-green bucket is left out: when the guess is the answer, nothing is left. Scores are
+    integers (int64); lower is better.
+    """
+    guess_rows = np.arange(matrix.shape[0]) if guess_rows is None else np.asarray(guess_rows)
+    num_answers = len(answer_cols)
+    squares = np.arange(num_answers + 1, dtype=np.int64) ** 2
+    step = max(1, budget // (num_answers * 12 + patterns * 16))
+    scores = np.empty(len(guess_rows), dtype=np.int64)
+    for start in range(0, len(guess_rows), step):
+        rows = guess_rows[start:start + step]
+        block = matrix[np.ix_(rows, answer_cols)]
+        offset_dtype = np.int32 if len(rows) * patterns < 2 ** 31 else np.int64
+        offsets = np.arange(0, len(rows) * patterns, patterns, dtype=offset_dtype)[:, None]
+        counts = np.bincount((block + offsets).ravel(), minlength=len(rows) * patterns).reshape(len(rows), patterns)
+        counts[:, patterns - 1] = 0
+        scores[start:start + len(rows)] = squares[counts].sum(axis=1)
+    return scores
+
+def streaming_entropy_scores(guesses, answers, budget=CHUNK_BYTES):
+    """Entropy of every guess over the answers without building or storing a feedback table.
+
+    Feedback is computed for one block of guesses at a time and scored straight away, so memory
+    stays within the budget however large the word lists are. Used when the full table would
+    be too big (see MAX_TABLE_BYTES).
+    """
+    length = len(answers[0])
+    guess_array = words_to_array(guesses, length)
+    answer_array = words_to_array(answers, length)
+    patterns = num_patterns(length)
+    xlogx = _xlogx(len(answers))
+    rows = min(chunk_rows(len(answers), length, budget), max(1, budget // (patterns * 16)))
+    scores = np.empty(len(guesses), dtype=np.float64)
+    for start, block in iter_pattern_blocks(guess_array, answer_array, rows):
+        scores[start:start + block.shape[0]] = _block_entropy(block, patterns, xlogx)
+    return scores
+
+def _canonical_partitions(block, patterns):
+    """Relabels each row's codes by the first answer column that got them.
+
+    Two guesses split the answers into the same groups exactly when their relabeled rows are
+    equal, whatever the feedback codes themselves are.
+    """
+    num_rows, num_answers = block.shape
+    # Each row's codes get their own block of `patterns` slots, as in _block_entropy
+    keys = (block.astype(np.int32) + np.arange(0, num_rows * patterns, patterns, dtype=np.int32)[:, None]).ravel()
+    first = np.full(num_rows * patterns, num_answers, dtype=np.int32)
+    np.minimum.at(first, keys, np.broadcast_to(np.arange(num_answers, dtype=np.int32), block.shape).ravel())
+    return first[keys].reshape(block.shape)
+
+def prune_guesses(matrix, answer_cols, guess_rows=None, preferred_rows=(), patterns=NUM_PATTERNS, budget=CHUNK_BYTES):
+    """Drops guesses that split nothing and keeps one guess per distinct partition of the answers.
+
+    A guess that gets the same feedback from every answer tells you nothing, and guesses that
+    split the answers into the same groups score the same, so only one of each needs scoring.
+    preferred_rows (e.g. the guesses that could still be the answer) are kept as the
+    representative of their class when the class has one. Partitions are compared by two
+    independent 64-bit hashes of their relabeled rows. Returns (kept rows in their original
+    order, stats), where stats counts the guesses considered, dropped for splitting nothing,
+    collapsed into another guess's class, and left to score.
+    """
+    guess_rows = np.arange(matrix.shape[0]) if guess_rows is None else np.asarray(guess_rows)
+    # Preferred rows go first, so they are the first member of their class to be seen
+    preferred = np.isin(guess_rows, np.asarray(preferred_rows, dtype=guess_rows.dtype))
+    ordered_rows = np.concatenate([guess_rows[preferred], guess_rows[~preferred]])
+
+    num_answers = len(answer_cols)
+    multipliers = np.random.default_rng(0).integers(1, 2 ** 63, size=(2, num_answers), dtype=np.uint64) | np.uint64(1)
+    # Per guess row: the gathered codes, the keys, column numbers and labels, and the first-column slots
+    step = max(1, budget // (num_answers * 24 + patterns * 4))
+    splitting = []
+    hashes = []
+    for start in range(0, len(ordered_rows), step):
+        rows = ordered_rows[start:start + step]
+        block = np.asarray(matrix[np.ix_(rows, answer_cols)])
+        splits = (block != block[:, :1]).any(axis=1)
+        if not splits.any():
+            continue
+        canonical = _canonical_partitions(block[splits], patterns).astype(np.uint64)
+        splitting.append(rows[splits])
+        hashes.append(np.stack([canonical @ multipliers[0], canonical @ multipliers[1]], axis=1))
+
+    if splitting:
+        splitting = np.concatenate(splitting)
+        # First occurrence of each class, so a preferred row represents it when it can
+        _, first = np.unique(np.concatenate(hashes), axis=0, return_index=True)
+        kept = np.sort(splitting[first])
+    else:
+        # Nothing splits (e.g. one answer left): keep the best-placed guess so there is still a choice
+        splitting = ()
+        kept = ordered_rows[:1]
+    stats = {
+        "guesses": len(guess_rows),
+        "no_split": len(guess_rows) - len(splitting),
+        "duplicates": len(splitting) - len(kept) if len(splitting) else 0,
+        "scored": len(kept),
+    }
+    return kept, stats
+
+_TABLES = {}
+
+def get_pattern_table(guesses, answers=None):
+    """Returns a PatternTable for the word lists, reusing one already loaded in this process."""
+    key = word_list_hash(guesses, answers if answers is not None else guesses)
+    if key not in _TABLES:
+        _TABLES[key] = PatternTable(guesses, answers)
+    return _TABLES[key]
+
+if __name__ == "__main__":
+    import sys
+    import time
+    from wordle_solver import read_word_file
+
+    words = read_word_file(sys.argv[1] if len(sys.argv) > 1 else "words.txt")
+    start = time.perf_counter()
+    table = PatternTable(words)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"Feedback table {table.matrix.shape[0]} x {table.matrix.shape[1]} ready in {elapsed:.1f} ms")
@@ -0,0 +1,145 @@
+"""Scaling benchmark: time and peak memory against dictionary size and word length.
+
+Each (length, size) case runs in a fresh process so its peak RSS is its own. The dictionaries are
+synthetic: random words drawn with English letter frequencies, which is enough to exercise the
+index, filtering and scoring at sizes no real word list reaches (use --words for a real one).
+
+    python scaling_benchmark.py                                # 5 letters, 1k to 100k words
+    python scaling_benchmark.py --lengths 4 6 8 --sizes 10000 100000 --output scaling.json
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+# Relative letter frequencies in English text, a-z
+LETTER_WEIGHTS = [8.2, 1.5, 2.8, 4.3, 12.7, 2.2, 2.0, 6.1, 7.0, 0.2, 0.8, 4.0, 2.4,
+                  6.7, 7.5, 1.9, 0.1, 6.0, 6.3, 9.1, 2.8, 1.0, 2.4, 0.2, 2.0, 0.1]
+SIZES = (1000, 10000, 30000, 100000)
+
+def synthetic_words(size, length, seed=0):
+    """Returns size distinct random words of the given length."""
+    rng = random.Random(f"{seed}:{length}")
+    alphabet = "abcdefghijklmnopqrstuvwxyz"
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choices(alphabet, LETTER_WEIGHTS, k=length)))
+    return sorted(words)
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far, in MB (ru_maxrss is KB on Linux)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def run_case(length, size, seed=0, words_file=None, entropy=True):
+    """Times each solver phase for one dictionary; returns {phase: {"ms", "peak_rss_mb"}}."""
+    import wordle_solver
+    from constraints import Constraints
+    from patterns import get_feedback
+    from word_index import WordIndex
+
+    results = {}
+
+    def record(name, start):
+        results[name] = {"ms": round((time.perf_counter() - start) * 1000, 2), "peak_rss_mb": round(peak_rss_mb(), 1)}
+
+    start = time.perf_counter()
+    if words_file:
+        words = wordle_solver.read_word_file(words_file, length)[:size]
+    else:
+        words = synthetic_words(size, length, seed)
+    record("load", start)
+    wordle_solver.WORD_LENGTH = length
+    wordle_solver.ALL_WORDS = words
+
+    start = time.perf_counter()
+    index = WordIndex(words, length)
+    record("index", start)
+
+    rng = random.Random(seed)
+    answer = rng.choice(words)
+    guess = wordle_solver.suggest_next_guess(words, None, "frequency")
+    constraints = Constraints.empty(length).apply(guess, get_feedback(guess, answer))
+
+    start = time.perf_counter()
+    candidates = index.filter(index.all, constraints)
+    possible_words = index.words_of(candidates)
+    record("filter", start)
+
+    start = time.perf_counter()
+    wordle_solver.filter_words(words, constraints)
+    record("filter_words", start)
+
+    start = time.perf_counter()
+    wordle_solver.suggest_next_guess(words, None, "frequency")
+    record("suggest_frequency", start)
+
+    if entropy and len(possible_words) > 2:
+        # After the first guess: every word as a guess against the remaining candidates, which
+        # streams over blocks of guesses once the full table would pass MAX_TABLE_BYTES
+        start = time.perf_counter()
+        wordle_solver.suggest_entropy_guess(possible_words)
+        record("suggest_entropy", start)
+
+    results["candidates_after_first_guess"] = len(possible_words)
+    return results
+
+def run_isolated(length, size, seed=0, words_file=None, entropy=True):
+    """Runs one case in a child process and returns its results."""
+    command = [sys.executable, __file__, "--case", str(length), str(size), "--seed", str(seed)]
+    if words_file:
+        command += ["--words", words_file]
+    if not entropy:
+        command.append("--no-entropy")
+    # Feedback tables built for the synthetic words go to a scratch directory, not .wordle_cache
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ, WORDLE_CACHE_DIR=cache_dir)
+        output = subprocess.run(command, check=True, capture_output=True, text=True, env=env).stdout
+    # The solver prints progress messages; the result is the last line
+    return json.loads(output.strip().splitlines()[-1])
+
+def print_table(report):
+    phases = ["load", "index", "filter", "filter_words", "suggest_frequency", "suggest_entropy"]
+    print(f"{'length':>6}{'words':>9}" + "".join(f"{phase:>19}" for phase in phases) + f"{'peak RSS':>11}")
+    for case in report["cases"]:
+        results = case["results"]
+        cells = "".join(f"{results[phase]['ms']:>16.1f} ms" if phase in results else f"{'-':>19}" for phase in phases)
+        peak = max(value["peak_rss_mb"] for value in results.values() if isinstance(value, dict))
+        print(f"{case['length']:>6}{case['size']:>9}{cells}{peak:>8.1f} MB")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure solver time and peak memory against dictionary size")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[5], help="word lengths (default: 5)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="dictionary sizes (default: 1k-100k)")
+    parser.add_argument("--words", help="take the words from this file instead of generating them")
+    parser.add_argument("--no-entropy", action="store_true", help="skip the entropy strategy, which dominates at large sizes")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic words (default: 0)")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--case", type=int, nargs=2, metavar=("LENGTH", "SIZE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        # Child process: run one case and print its results as the last line
+        print(json.dumps(run_case(*args.case, args.seed, args.words, not args.no_entropy)))
+        return
+
+    report = {"cases": []}
+    for length in args.lengths:
+        for size in args.sizes:
+            print(f"Running {size} words of {length} letters...", file=sys.stderr)
+            results = run_isolated(length, size, args.seed, args.words, not args.no_entropy)
+            report["cases"].append({"length": length, "size": size, "results": results})
+    print_table(report)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f"\nResults written to {args.output}")
+
+if __name__ == "__main__":
+    main()
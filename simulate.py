@@ -0,0 +1,222 @@
+"""Headless Wordle solver simulation and benchmark.
+
+Plays the solver against every answer in words.txt (or a subset) without any input() prompts,
+spreading games across processes, and reports guess counts, failures and timings.
+
+Usage: python simulate.py [--strategy frequency --strategy entropy] [--answers 500] [--workers 4]
+"""
+import argparse
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import instrumentation
+import wordle_solver
+from constraints import Constraints
+from patterns import get_feedback
+from word_index import WordIndex
+from wordle_solver import suggest_next_guess
+
+MAX_GUESSES = 6
+
+# Word list and its bitset index shared by every game played in this process (set by init_worker)
+_WORDS = []
+_INDEX = None
+
+def init_worker(words, book=None, guesses=None):
+    """Sets up the word list (with the opening book and allowed guesses for it, if any) once per worker process."""
+    global _WORDS, _INDEX
+    _WORDS = words
+    _INDEX = WordIndex(words, len(words[0]))
+    # The entropy strategy builds its feedback table over the full word list
+    wordle_solver.ALL_WORDS = words
+    wordle_solver.GUESS_WORDS = guesses or []
+    wordle_solver.OPENING_BOOK = book
+
+def build_opening_book(words, guesses=None):
+    """Builds the opening book for the simulated word list in memory, or returns None without NumPy."""
+    try:
+        from opening_book import build_book
+        from patterns import MAX_TABLE_BYTES, table_bytes
+    except ImportError:
+        return None
+    guesses = guesses or words
+    if table_bytes(len(guesses), len(words), len(words[0])) > MAX_TABLE_BYTES:
+        return None
+    return build_book(guesses, words)
+
+def play_game(answer, strategy="frequency", seed=0, max_guesses=MAX_GUESSES):
+    """Plays one game against answer; returns (guess count or None, filter times, suggest times)."""
+    # Seed per answer so results don't depend on how games are spread across workers
+    random.seed(f"{seed}:{answer}")
+    candidates = _INDEX.all
+    possible_words = list(_WORDS)
+    constraints = Constraints.empty(len(answer))
+    tried_letters = set()
+    history = []  # Walks the opening book for the first two guesses
+    filter_times = []
+    suggest_times = []
+
+    for guess_num in range(1, max_guesses + 1):
+        start = time.perf_counter()
+        guess = suggest_next_guess(possible_words, tried_letters, strategy, history)
+        suggest_times.append(time.perf_counter() - start)
+
+        if guess is None:
+            break
+
+        feedback = get_feedback(guess, answer)
+        tried_letters.update(guess)
+        if feedback == "G" * len(answer):
+            return guess_num, filter_times, suggest_times
+
+        history.append((guess, feedback))
+        start = time.perf_counter()
+        constraints = constraints.apply(guess, feedback)
+        candidates = _INDEX.filter(candidates, constraints)
+        possible_words = _INDEX.words_of(candidates)
+        filter_times.append(time.perf_counter() - start)
+
+    return None, filter_times, suggest_times
+
+def _play_batch(args):
+    """Plays a batch of answers in a worker process; returns the games and the batch's guess-pruning totals."""
+    answers, strategy, seed, max_guesses = args
+    for key in wordle_solver.PRUNING_TOTALS:
+        wordle_solver.PRUNING_TOTALS[key] = 0
+    games = [play_game(answer, strategy, seed, max_guesses) for answer in answers]
+    return games, dict(wordle_solver.PRUNING_TOTALS)
+
+def percentiles(samples, points=(50, 90, 99)):
+    """Returns the requested percentiles of samples (in ms) using nearest-rank."""
+    if not samples:
+        return {p: 0.0 for p in points}
+    ordered = sorted(samples)
+    return {p: ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))] * 1000 for p in points}
+
+def run_simulation(words, answers, strategy="frequency", workers=None, seed=0, max_guesses=MAX_GUESSES, batch_size=50,
+                   book=None, guesses=None):
+    """Plays every answer with the given strategy (opening from book, if given) and returns a summary dict.
+
+    guesses is an optional larger allowed-guess pool for the entropy strategy.
+    """
+    batches = [(answers[i:i + batch_size], strategy, seed, max_guesses) for i in range(0, len(answers), batch_size)]
+
+    start = time.perf_counter()
+    results = []
+    pruning = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(words, book, guesses)) as executor:
+        for games, totals in executor.map(_play_batch, batches):
+            results.extend(games)
+            for key, value in totals.items():
+                pruning[key] = pruning.get(key, 0) + value
+    elapsed = time.perf_counter() - start
+
+    distribution = {n: 0 for n in range(1, max_guesses + 1)}
+    failures = []
+    filter_times = []
+    suggest_times = []
+    for answer, (num_guesses, game_filter_times, game_suggest_times) in zip(answers, results):
+        if num_guesses is None:
+            failures.append(answer)
+        else:
+            distribution[num_guesses] += 1
+        filter_times.extend(game_filter_times)
+        suggest_times.extend(game_suggest_times)
+
+    solved = len(answers) - len(failures)
+    total_guesses = sum(n * count for n, count in distribution.items())
+    return {
+        "strategy": strategy,
+        "games": len(answers),
+        "distribution": distribution,
+        "failures": failures,
+        "failure_rate": len(failures) / len(answers) if answers else 0.0,
+        "mean_guesses": total_guesses / solved if solved else 0.0,
+        "seconds": elapsed,
+        "games_per_sec": len(answers) / elapsed if elapsed else 0.0,
+        "filter_ms": percentiles(filter_times),
+        "suggest_ms": percentiles(suggest_times),
+        "pruning": pruning,
+    }
+
+def print_report(summary):
+    """Prints the results of one simulation run."""
+    print(f"\n===== Strategy: {summary['strategy']} =====")
+    print(f"Games: {summary['games']}  ({summary['games_per_sec']:.1f} games/sec, {summary['seconds']:.2f}s)")
+    print(f"Mean guesses (solved games): {summary['mean_guesses']:.3f}")
+    print(f"Failures: {len(summary['failures'])} ({summary['failure_rate']:.2%})")
+    print("Guess distribution:")
+    largest = max(summary['distribution'].values()) or 1
+    for n, count in summary['distribution'].items():
+        bar = "#" * round(40 * count / largest)
+        print(f"  {n}: {count:5} {bar}")
+    for name in ("filter", "suggest"):
+        p = summary[f"{name}_ms"]
+        print(f"{name:>8} latency ms: p50={p[50]:.3f} p90={p[90]:.3f} p99={p[99]:.3f}")
+    pruning = summary.get("pruning", {})
+    if pruning.get("suggestions"):
+        n = pruning["suggestions"]
+        print(f"Guess pruning ({n} suggestions with <= {wordle_solver.PRUNE_MAX_ANSWERS} candidates): "
+              f"scored {pruning['scored'] / n:.0f} of {pruning['guesses'] / n:.0f} guesses on average "
+              f"({pruning['scored'] / pruning['guesses']:.1%}); {pruning['no_split'] / n:.0f} split nothing, "
+              f"{pruning['duplicates'] / n:.0f} duplicated another's partition")
+    if summary['failures']:
+        print(f"Failed answers: {', '.join(summary['failures'][:20])}{' ...' if len(summary['failures']) > 20 else ''}")
+
+def print_comparison(summaries):
+    """Prints a side by side table of several strategy runs."""
+    print("\n===== Comparison =====")
+    print(f"{'strategy':<12}{'mean':>8}{'fail%':>8}{'games/s':>10}{'filter p50':>12}{'suggest p50':>13}")
+    for s in summaries:
+        print(f"{s['strategy']:<12}{s['mean_guesses']:>8.3f}{s['failure_rate'] * 100:>8.2f}{s['games_per_sec']:>10.1f}"
+              f"{s['filter_ms'][50]:>12.3f}{s['suggest_ms'][50]:>13.3f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Play the solver against many answers and report its performance")
+    parser.add_argument("--words", default="words.txt", help="word list to play against (default: words.txt)")
+    parser.add_argument("--length", type=int, default=5, help="letters per word, e.g. 4-8 (default: 5)")
+    parser.add_argument("--strategy", action="append", choices=wordle_solver.STRATEGIES,
+                        help="strategy to run; repeat to compare several (default: frequency)")
+    parser.add_argument("--answers", type=int, default=None, help="play only a random sample of this many answers")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for sampling and for the solver's random choices")
+    parser.add_argument("--max-guesses", type=int, default=MAX_GUESSES, help="guesses allowed per game (default: 6)")
+    parser.add_argument("--guesses", metavar="FILE", help="extra allowed guesses (never answers) for the entropy strategy")
+    parser.add_argument("--no-book", action="store_true", help="don't open from the opening book; every guess comes from the strategy")
+    parser.add_argument("--trace", metavar="FILE", help="write a JSON-lines timing trace of every solver call")
+    parser.add_argument("--profile", metavar="FILE", help="play a single game under cProfile, dump the stats and exit")
+    args = parser.parse_args()
+
+    if args.trace:
+        wordle_solver.enable_tracing(args.trace)
+        instrumentation.instrument_module(globals(), ["suggest_next_guess", "play_game"])
+
+    words = wordle_solver.read_word_file(args.words, args.length)
+    answers = list(words)
+    if args.answers is not None and args.answers < len(answers):
+        answers = random.Random(args.seed).sample(answers, args.answers)
+    guesses = None
+    if args.guesses:
+        wordle_solver.ALL_WORDS = words
+        guesses = wordle_solver.load_guess_words(args.guesses, args.length)
+    book = None if args.no_book else build_opening_book(words, guesses)
+
+    if args.profile:
+        init_worker(words, book, guesses)
+        strategy = (args.strategy or ["frequency"])[0]
+        num_guesses, _, _ = instrumentation.profile_call(args.profile, play_game, answers[0], strategy, args.seed, args.max_guesses)
+        print(f"Solved '{answers[0]}' in {num_guesses} guesses" if num_guesses else f"Failed to solve '{answers[0]}'")
+        return
+
+    summaries = []
+    for strategy in args.strategy or ["frequency"]:
+        summary = run_simulation(words, answers, strategy, args.workers, args.seed, args.max_guesses, book=book, guesses=guesses)
+        print_report(summary)
+        summaries.append(summary)
+
+    if len(summaries) > 1:
+        print_comparison(summaries)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,753 @@
+"""Local HTTP/JSON solver service.
+
+Word lists (and the decision tree, if built) are loaded once per process; each game is a session
+kept in a bounded in-memory store with idle eviction. When words.txt or past_used_words.txt change,
+the word lists are reloaded without a restart (see word_universe.py); games already in progress
+finish on the word lists they started with.
+
+Endpoints:
+    POST /sessions                       start a game; optional body {"strategy": "entropy", "time_budget_ms": 200}
+    POST /sessions/<id>/guesses          body {"guess": "crane", "feedback": "GYXXX"}
+    GET  /sessions/<id>[?candidates=50]  suggestion, remaining count and (optionally) candidates
+    DELETE /sessions/<id>                end a game
+    GET  /stats                          request latencies and session store counters
+    POST /reload                         reload the word lists now if the files changed
+
+With --workers N the service loads everything once, then forks N worker processes that accept on
+the same socket. The feedback table and compiled word list are memory-mapped files, so every
+worker reads the same physical pages; the sessions live in one shared memory block
+(SharedSessionStore), so any worker can serve any session.
+
+Usage: python solver_service.py [--host 127.0.0.1] [--port 8080] [--workers 4]
+"""
+import argparse
+import gc
+import json
+import mmap
+import multiprocessing
+import os
+import re
+import signal
+import struct
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import wordle_solver
+from constraints import Constraints
+from suggestion_cache import SuggestionCache, bitset_fingerprint, words_fingerprint
+from word_universe import WordUniverse
+from wordle_solver import (STRATEGIES, load_book, load_tree, load_word_universe, lookahead_key, lookahead_search,
+                           read_guess_words, suggest_next_guess)
+
+MAX_GUESSES = 6
+RELOAD_INTERVAL = 5.0  # Seconds between checks of the word files for changes
+UNIVERSES_KEPT = 4  # Word-list versions kept for shared sessions that started on an older one
+MAX_TIME_BUDGET_MS = 10000  # Longest lookahead search a session may ask for per suggestion
+SESSION_PATH = re.compile(r"^/sessions/([0-9a-f]{32})(/guesses)?$")
+
+class Session:
+    """One game: the constraints so far and the remaining candidates as a bitset."""
+
+    def __init__(self, session_id, candidates, strategy, length=5, universe=None, time_budget_ms=None):
+        self.session_id = session_id
+        self.universe = universe  # The UniverseSnapshot the game started with
+        self.candidates = candidates
+        self.strategy = strategy
+        self.time_budget_ms = time_budget_ms  # Lookahead search time per suggestion, or None for the strategy alone
+        self.constraints = Constraints.empty(length)
+        self.history = []
+        self.tried_letters = set()
+        self.suggestion = None  # Cached until the next guess
+        self.solved = False
+        self.last_used = time.monotonic()
+        self.lock = threading.Lock()
+
+class SessionStore:
+    """A bounded, least-recently-used session store that also drops sessions left idle too long."""
+
+    def __init__(self, max_sessions=10000, idle_timeout=1800):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.sessions = OrderedDict()
+        self.lock = threading.Lock()
+        self.evicted_idle = 0
+        self.evicted_full = 0
+
+    def new_id(self):
+        return uuid.uuid4().hex
+
+    def add(self, session):
+        with self.lock:
+            self._evict_idle()
+            while len(self.sessions) >= self.max_sessions:
+                self.sessions.popitem(last=False)
+                self.evicted_full += 1
+            self.sessions[session.session_id] = session
+
+    def get(self, session_id):
+        with self.lock:
+            self._evict_idle()
+            session = self.sessions.get(session_id)
+            if session is not None:
+                session.last_used = time.monotonic()
+                self.sessions.move_to_end(session_id)
+            return session
+
+    def remove(self, session_id):
+        with self.lock:
+            return self.sessions.pop(session_id, None) is not None
+
+    def save(self, session):
+        pass  # Sessions are live objects here; nothing to write back
+
+    def _evict_idle(self):
+        # Sessions are kept in least-recently-used order, so idle ones are at the front
+        cutoff = time.monotonic() - self.idle_timeout
+        while self.sessions:
+            session = next(iter(self.sessions.values()))
+            if session.last_used >= cutoff:
+                break
+            self.sessions.popitem(last=False)
+            self.evicted_idle += 1
+
+    def __len__(self):
+        return len(self.sessions)
+
+class SharedSessionStore:
+    """A session store in one shared memory block, for worker processes forked from the same supervisor.
+
+    Each session is a fixed-size slot holding its strategy and time budget, its guesses and
+    feedback, the key of the word lists it started with, and when it was last used. The session id
+    starts with the slot number, so finding a session is one read. Workers rebuild the candidates
+    from the guesses (a few bitset filters) with replay(session_id, strategy, history, universe_key,
+    time_budget_ms), which returns a Session. Slots are handed out round-robin, so when the
+    store is full the oldest session is dropped rather than the least recently used one.
+
+    The block and its locks must be created before forking.
+    """
+    HEADER = struct.Struct("<QQQ")  # next slot, evicted idle, evicted full
+    LOCK_STRIPES = 64
+
+    def __init__(self, replay, max_sessions=10000, idle_timeout=1800, length=5):
+        self.replay = replay
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.length = length
+        # id, last used, word lists key, strategy, time budget (-1 for none), solved, guesses played,
+        # then every guess and its feedback as ASCII
+        self.slot = struct.Struct(f"<16sd8sBiBB{MAX_GUESSES * length}s{MAX_GUESSES * length}s")
+        self.memory = mmap.mmap(-1, self.HEADER.size + max_sessions * self.slot.size)  # Anonymous and shared
+        self.lock = multiprocessing.Lock()  # Guards the header
+        self.stripes = [multiprocessing.Lock() for _ in range(self.LOCK_STRIPES)]
+
+    def _offset(self, slot):
+        return self.HEADER.size + slot * self.slot.size
+
+    def _read(self, slot):
+        return self.slot.unpack_from(self.memory, self._offset(slot))
+
+    def _count(self, field):
+        with self.lock:
+            values = list(self.HEADER.unpack_from(self.memory, 0))
+            values[field] += 1
+            self.HEADER.pack_into(self.memory, 0, *values)
+
+    def _locate(self, session_id):
+        """Returns the slot number a session id points at, or None if the id can't be one of ours."""
+        slot = int(session_id[:8], 16)
+        return slot if slot < self.max_sessions else None
+
+    def new_id(self):
+        """Claims the next slot and returns a session id for it; the slot is written by save()."""
+        with self.lock:
+            next_slot, evicted_idle, evicted_full = self.HEADER.unpack_from(self.memory, 0)
+            slot = next_slot % self.max_sessions
+            with self.stripes[slot % self.LOCK_STRIPES]:
+                key, last_used = self._read(slot)[:2]
+                if key.strip(b"\0"):
+                    if last_used < time.monotonic() - self.idle_timeout:
+                        evicted_idle += 1
+                    else:
+                        evicted_full += 1
+                self.memory[self._offset(slot):self._offset(slot + 1)] = bytes(self.slot.size)
+            self.HEADER.pack_into(self.memory, 0, next_slot + 1, evicted_idle, evicted_full)
+        return f"{slot:08x}{uuid.uuid4().hex[:24]}"
+
+    def add(self, session):
+        session.lock = self.stripes[self._locate(session.session_id) % self.LOCK_STRIPES]
+        with session.lock:
+            self.save(session)
+
+    def get(self, session_id):
+        slot = self._locate(session_id)
+        if slot is None:
+            return None
+        with self.stripes[slot % self.LOCK_STRIPES]:
+            key, last_used, universe, strategy, time_budget_ms, solved, turns, guesses, feedback = self._read(slot)
+            if key != bytes.fromhex(session_id):
+                return None
+            now = time.monotonic()
+            if last_used < now - self.idle_timeout:
+                self.memory[self._offset(slot):self._offset(slot + 1)] = bytes(self.slot.size)
+                expired = True
+            else:
+                struct.pack_into("<d", self.memory, self._offset(slot) + 16, now)
+                expired = False
+        if expired:
+            self._count(1)
+            return None
+        n = self.length
+        history = [(guesses[i * n:(i + 1) * n].decode("ascii"), feedback[i * n:(i + 1) * n].decode("ascii"))
+                   for i in range(turns)]
+        session = self.replay(session_id, STRATEGIES[strategy], history, universe,
+                              None if time_budget_ms < 0 else time_budget_ms)
+        session.turns_loaded = turns
+        # Requests for the same session in other workers wait on the same lock
+        session.lock = self.stripes[slot % self.LOCK_STRIPES]
+        return session
+
+    def save(self, session):
+        """Writes a session's state to its slot (call with session.lock held).
+
+        Fails if another request changed the session since get(), or it was dropped meanwhile.
+        """
+        slot = self._locate(session.session_id)
+        key, _, _, _, _, _, turns = self._read(slot)[:7]
+        loaded = getattr(session, "turns_loaded", 0)
+        if key.strip(b"\0") and key != bytes.fromhex(session.session_id) or turns != loaded:
+            raise ValueError("The session was changed by another request; fetch it again and retry.")
+        guesses = "".join(guess for guess, _ in session.history).encode("ascii")
+        feedback = "".join(fb for _, fb in session.history).encode("ascii")
+        self.slot.pack_into(self.memory, self._offset(slot), bytes.fromhex(session.session_id), time.monotonic(),
+                            session.universe.key, STRATEGIES.index(session.strategy),
+                            -1 if session.time_budget_ms is None else session.time_budget_ms, session.solved,
+                            len(session.history), guesses, feedback)
+        session.turns_loaded = len(session.history)
+
+    def remove(self, session_id):
+        slot = self._locate(session_id)
+        if slot is None:
+            return False
+        with self.stripes[slot % self.LOCK_STRIPES]:
+            if self._read(slot)[0] != bytes.fromhex(session_id):
+                return False
+            self.memory[self._offset(slot):self._offset(slot + 1)] = bytes(self.slot.size)
+        return True
+
+    @property
+    def evicted_idle(self):
+        return self.HEADER.unpack_from(self.memory, 0)[1]
+
+    @property
+    def evicted_full(self):
+        return self.HEADER.unpack_from(self.memory, 0)[2]
+
+    def __len__(self):
+        cutoff = time.monotonic() - self.idle_timeout
+        live = 0
+        for slot in range(self.max_sessions):
+            key, last_used = self._read(slot)[:2]
+            live += bool(key.strip(b"\0")) and last_used >= cutoff
+        return live
+
+class LatencyStats:
+    """Per-endpoint request counts and latency percentiles over a bounded window of recent requests."""
+
+    def __init__(self, window=10000):
+        self.window = window
+        self.samples = {}
+        self.counts = {}
+        self.lock = threading.Lock()
+
+    def record(self, endpoint, seconds):
+        with self.lock:
+            if endpoint not in self.samples:
+                self.samples[endpoint] = deque(maxlen=self.window)
+                self.counts[endpoint] = 0
+            self.samples[endpoint].append(seconds)
+            self.counts[endpoint] += 1
+
+    def summary(self):
+        with self.lock:
+            snapshot = {endpoint: sorted(samples) for endpoint, samples in self.samples.items()}
+            counts = dict(self.counts)
+        result = {}
+        for endpoint, ordered in snapshot.items():
+            def pct(p):
+                return round(ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))] * 1000, 3)
+            result[endpoint] = {
+                "count": counts[endpoint],
+                "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+                "p50_ms": pct(50),
+                "p90_ms": pct(90),
+                "p99_ms": pct(99),
+                "max_ms": round(ordered[-1] * 1000, 3),
+            }
+        return result
+
+class SolverService:
+    """Holds everything shared by all requests: word lists, the index, sessions and stats."""
+
+    def __init__(self, words_file="words.txt", past_file="past_used_words.txt",
+                 max_sessions=10000, idle_timeout=1800, cache_size=100000, cache_file=None, length=5, guesses_file=None,
+                 shared_sessions=False, reload_interval=RELOAD_INTERVAL, time_budget_ms=None):
+        self.length = length
+        self.time_budget_ms = time_budget_ms  # Default lookahead budget for new sessions
+        wordle_solver.WORD_LENGTH = length
+        answers = load_word_universe(words_file, past_file, length=length)
+        self.guesses_file = guesses_file
+        # The index covers every word, past answers included, so a new past answer only changes
+        # the bitset new games start from (see word_universe.py)
+        self.universe = WordUniverse(words_file, past_file, length, wordle_solver.ALL_WORDS or answers, wordle_solver.PAST_WORDS)
+        snapshot = self.universe.current
+        self.set_guess_pool(snapshot, self.read_guess_pool(snapshot))
+        # Decision trees are only built for the standard 5-letter game
+        snapshot.tree = load_tree(snapshot.answers) if length == 5 else None
+        # Without a tree the first two guesses still come from the opening book
+        snapshot.book = load_book(snapshot.answers, guesses=snapshot.guesses, universe=snapshot.index.words) if snapshot.tree is None else None
+        # Recent word-list versions by key, for shared sessions that started on an older one
+        self.universes = OrderedDict([(snapshot.key, snapshot)])
+        self.reload_interval = reload_interval
+        self.last_check = time.monotonic()
+        self.last_reload = None
+        self.reload_lock = threading.Lock()
+        self.warm_entropy_table(snapshot)
+        self.cache = SuggestionCache(cache_size)
+        self.cache_file = cache_file
+        if cache_file:
+            print(f"Loaded {self.cache.load(cache_file)} cached suggestions from {cache_file}")
+        if shared_sessions:
+            # For worker processes (see serve_workers): any worker can pick up any session
+            self.sessions = SharedSessionStore(self.replay_session, max_sessions, idle_timeout, length)
+        else:
+            self.sessions = SessionStore(max_sessions, idle_timeout)
+        self.stats = LatencyStats()
+        self.started = time.time()
+
+    def read_guess_pool(self, snapshot):
+        """A snapshot's words plus the allowed guesses from guesses_file, if one was given."""
+        if self.guesses_file:
+            return read_guess_words(self.guesses_file, snapshot.index.words, self.length)
+        return snapshot.index.words
+
+    @staticmethod
+    def set_guess_pool(snapshot, guesses):
+        """Gives a snapshot its guess pool; suggestions for its games guess from that, not from wordle_solver's globals."""
+        snapshot.guesses = guesses
+        snapshot.guess_pool = words_fingerprint(guesses)
+
+    def warm_entropy_table(self, snapshot):
+        """Loads a snapshot's feedback table now so the first entropy request doesn't pay for it."""
+        if self.table_fits(snapshot):
+            from patterns import get_pattern_table
+
+            universe = snapshot.index.words
+            get_pattern_table(universe) if snapshot.guesses is universe else get_pattern_table(snapshot.guesses, universe)
+
+    def create_session(self, strategy="frequency", time_budget_ms=None):
+        """Starts a game; time_budget_ms (default: the service's) turns on the lookahead search."""
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy: {strategy}")
+        if time_budget_ms is None:
+            time_budget_ms = self.time_budget_ms
+        elif (not isinstance(time_budget_ms, int) or isinstance(time_budget_ms, bool)
+              or not 0 <= time_budget_ms <= MAX_TIME_BUDGET_MS):
+            raise ValueError(f"time_budget_ms must be a whole number of milliseconds from 0 to {MAX_TIME_BUDGET_MS}")
+        if time_budget_ms is not None and not self.table_fits(self.universe.current):
+            raise ValueError("The lookahead search needs NumPy and a feedback table that fits in memory")
+        self.check_word_files()
+        universe = self.universe.current
+        session = Session(self.sessions.new_id(), universe.answer_mask, strategy, self.length, universe, time_budget_ms)
+        self.sessions.add(session)
+        return session
+
+    def check_word_files(self):
+        """Reloads the word lists if the files changed, checking at most every reload_interval seconds."""
+        now = time.monotonic()
+        if self.reload_interval and now - self.last_check >= self.reload_interval:
+            self.last_check = now
+            self.reload_words()
+
+    def reload_words(self, force=False):
+        """Reloads the word lists if the files changed; returns the reload report, or None if nothing changed.
+
+        Games already in progress keep the snapshot they started with.
+        """
+        with self.reload_lock:
+            report = self.universe.reload(self.prepare_universe, force)
+        if report is not None:
+            self.last_reload = report
+            print(f"Reloaded word lists (version {report['version']}, {report['kind']}): {report['answers']} answers, "
+                  f"book {report['book']}, tree {report['tree']}, in {report['ms']:.1f} ms", flush=True)
+        return report
+
+    def prepare_universe(self, old, new, report):
+        """Gives a new snapshot its guess pool, decision tree and opening book before it is published.
+
+        wordle_solver's word-list globals are left alone: other threads are answering requests
+        from them, and the new snapshot carries everything its games need.
+        """
+        if report["kind"] == "full":
+            self.set_guess_pool(new, self.read_guess_pool(new))
+        else:
+            # Same words, only the past answers changed
+            new.guesses, new.guess_pool = old.guesses, old.guess_pool
+
+        # Trees are built offline, so a stale one is dropped (or replaced by a rebuilt file)
+        new.tree = load_tree(new.answers) if self.length == 5 else None
+        report["tree"] = "none" if new.tree is None else "kept" if new.tree is old.tree else "loaded"
+        if new.tree is not None:
+            report["book"] = "unused"
+        elif old.book is not None and report["kind"] == "incremental" and self.table_fits(new):
+            from opening_book import book_file, update_book
+
+            changed = report["answers_added"] + report["answers_removed"]
+            new.book = update_book(old.book, new.guesses, new.index.words, new.answers, changed)
+            new.book.save(book_file(new.guesses))
+            report["book"] = f"updated for {len(changed)} word(s)"
+        else:
+            new.book = load_book(new.answers, guesses=new.guesses, universe=new.index.words)
+            report["book"] = "rebuilt" if new.book is not None else "none"
+        if report["kind"] == "full":
+            self.warm_entropy_table(new)
+
+        self.universes[new.key] = new
+        while len(self.universes) > UNIVERSES_KEPT:
+            self.universes.popitem(last=False)
+
+    def table_fits(self, snapshot):
+        """Whether a snapshot's guesses x universe feedback table is small enough to keep loaded."""
+        try:
+            from patterns import MAX_TABLE_BYTES, table_bytes
+        except ImportError:
+            return False
+        return table_bytes(len(snapshot.guesses), len(snapshot.index.words), self.length) <= MAX_TABLE_BYTES
+
+    def replay_session(self, session_id, strategy, history, universe_key=None, time_budget_ms=None):
+        """Rebuilds a session from its guesses (used by SharedSessionStore).
+
+        The game is replayed on the word lists it started with. Workers reload on their own, so
+        one that hasn't seen those word lists yet reloads first.
+        """
+        universe = self.universes.get(universe_key)
+        if universe is None:
+            self.reload_words()
+            universe = self.universes.get(universe_key)
+        if universe is None:
+            raise ValueError("The session's word lists are no longer available on this server; start a new session.")
+        session = Session(session_id, universe.answer_mask, strategy, self.length, universe, time_budget_ms)
+        for guess, feedback in history:
+            self._play(session, guess, feedback)
+        return session
+
+    def add_guess(self, session, guess, feedback):
+        guess = str(guess).lower().strip()
+        feedback = str(feedback).upper().strip()
+        if len(guess) != self.length or not guess.isalpha():
+            raise ValueError(f"Guess must be exactly {self.length} letters.")
+        if len(feedback) != self.length or not all(c in "GYX" for c in feedback):
+            raise ValueError(f"Feedback must be {self.length} characters of G, Y or X.")
+        if session.solved:
+            raise ValueError("This game is already solved.")
+        if len(session.history) >= MAX_GUESSES:
+            raise ValueError("All 6 guesses have been used.")
+        self._play(session, guess, feedback)
+        self.sessions.save(session)
+
+    def _play(self, session, guess, feedback):
+        session.history.append((guess, feedback))
+        session.tried_letters.update(guess)
+        session.suggestion = None
+        if feedback == "G" * self.length:
+            session.solved = True
+            session.candidates = session.universe.index.from_words([guess])
+            return
+        session.constraints = session.constraints.apply(guess, feedback)
+        session.candidates = session.universe.index.filter(session.candidates, session.constraints)
+
+    def suggest(self, session):
+        """Picks the suggestion for a session, reusing the cached one for the same candidate set."""
+        universe = session.universe
+        if universe.tree is not None:
+            tree_guess = universe.tree.lookup(session.history)
+            if tree_guess:
+                return tree_guess
+        elif universe.book is not None and len(session.history) < 2:
+            book_guess = universe.book.lookup(session.history)
+            if book_guess:
+                return book_guess
+
+        def compute():
+            possible_words = universe.index.words_of(session.candidates)
+            return suggest_next_guess(possible_words, session.tried_letters, session.strategy,
+                                      time_budget_ms=session.time_budget_ms, guesses=universe.guesses,
+                                      universe=universe.index.words)
+
+        pool = universe.guess_pool if session.strategy == "entropy" or session.time_budget_ms is not None else ""
+        key = self.cache.make_key(bitset_fingerprint(universe.index, session.candidates),
+                                  lookahead_key(session.strategy, session.time_budget_ms), pool)
+        if session.time_budget_ms is not None and universe.index.count(session.candidates) > 2:
+            # Searches cut short by the time budget aren't cached (see SuggestionCache.get_or_search)
+            return self.cache.get_or_search(key, lambda: lookahead_search(universe.index.words_of(session.candidates),
+                                                                          session.time_budget_ms, universe.guesses,
+                                                                          universe.index.words))
+        return self.cache.get_or_compute(key, compute)
+
+    def save_cache(self):
+        """Writes the suggestion cache to its file, if one was configured."""
+        if self.cache_file:
+            self.cache.save(self.cache_file)
+            print(f"Saved {len(self.cache)} cached suggestions to {self.cache_file}")
+
+    def describe(self, session, candidate_limit=0):
+        """Returns the JSON-ready state of a session, computing the suggestion if needed."""
+        remaining = session.universe.index.count(session.candidates)
+        if session.suggestion is None and not session.solved and remaining:
+            session.suggestion = self.suggest(session)
+
+        state = {
+            "session_id": session.session_id,
+            "strategy": session.strategy,
+            "time_budget_ms": session.time_budget_ms,
+            "guesses": len(session.history),
+            "history": [{"guess": guess, "feedback": feedback} for guess, feedback in session.history],
+            "solved": session.solved,
+            "remaining": remaining,
+            "suggestion": None if session.solved else session.suggestion,
+        }
+        if candidate_limit:
+            state["candidates"] = session.universe.index.words_of(session.candidates)[:candidate_limit]
+        return state
+
+    def stats_summary(self):
+        return {
+            "pid": os.getpid(),  # With --workers, each worker reports its own latencies and cache
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "words": len(self.universe.current.answers),
+            "decision_tree": self.universe.current.tree is not None,
+            "word_lists": {
+                "version": self.universe.current.version,
+                "past_words": len(self.universe.current.past_words),
+                "last_reload": self.last_reload,
+            },
+            "sessions": {
+                "active": len(self.sessions),
+                "max": self.sessions.max_sessions,
+                "idle_timeout_seconds": self.sessions.idle_timeout,
+                "evicted_idle": self.sessions.evicted_idle,
+                "evicted_full": self.sessions.evicted_full,
+            },
+            "suggestion_cache": self.cache.stats(),
+            "endpoints": self.stats.summary(),
+        }
+
+def endpoint_name(method, path):
+    """Groups request paths for the latency stats, e.g. 'POST /sessions/<id>/guesses'."""
+    match = SESSION_PATH.match(path)
+    if match:
+        path = "/sessions/<id>" + (match.group(2) or "")
+    elif path not in ("/sessions", "/stats", "/reload"):
+        path = "<other>"
+    return f"{method} {path}"
+
+def candidate_limit(query):
+    """Parses the ?candidates=N query parameter: how many remaining words to list (0 for none)."""
+    value = query.get("candidates", [""])[0].strip()
+    if not value:
+        return 0
+    if not value.isdigit():
+        raise ValueError("'candidates' must be a whole number of words, 0 or more")
+    return int(value)
+
+class SolverRequestHandler(BaseHTTPRequestHandler):
+    """Routes requests to the SolverService attached to the server."""
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, Nagle + delayed ACK adds ~40 ms per response
+    disable_nagle_algorithm = True
+    quiet = True
+
+    @property
+    def service(self):
+        return self.server.service
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method):
+        start = time.perf_counter()
+        url = urlparse(self.path)
+        endpoint = endpoint_name(method, url.path)
+        try:
+            status, body = self._route(method, url)
+        except ValueError as e:
+            status, body = 400, {"error": str(e)}
+        except Exception as e:  # Keep serving; report the failure to the client
+            status, body = 500, {"error": f"Internal error: {e}"}
+        self._send_json(status, body)
+        self.service.stats.record(endpoint, time.perf_counter() - start)
+
+    def _route(self, method, url):
+        if url.path == "/sessions" and method == "POST":
+            body = self._read_json()
+            session = self.service.create_session(body.get("strategy", "frequency"), body.get("time_budget_ms"))
+            return 201, self.service.describe(session)
+
+        if url.path == "/stats" and method == "GET":
+            return 200, self.service.stats_summary()
+
+        if url.path == "/reload" and method == "POST":
+            report = self.service.reload_words()
+            return 200, report or {"reloaded": False}
+
+        match = SESSION_PATH.match(url.path)
+        if not match:
+            return 404, {"error": "Not found"}
+
+        session_id, is_guess = match.group(1), match.group(2)
+        if method == "DELETE" and not is_guess:
+            if not self.service.sessions.remove(session_id):
+                return 404, {"error": "Unknown session"}
+            return 200, {"deleted": session_id}
+
+        session = self.service.sessions.get(session_id)
+        if session is None:
+            return 404, {"error": "Unknown or expired session"}
+
+        with session.lock:
+            if is_guess and method == "POST":
+                body = self._read_json()
+                self.service.add_guess(session, body.get("guess", ""), body.get("feedback", ""))
+                return 200, self.service.describe(session)
+            if not is_guess and method == "GET":
+                limit = candidate_limit(parse_qs(url.query))
+                return 200, self.service.describe(session, limit)
+        return 405, {"error": "Method not allowed"}
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except json.JSONDecodeError:
+            raise ValueError("Request body must be JSON.")
+        if not isinstance(body, dict):
+            raise ValueError("Request body must be a JSON object.")
+        return body
+
+    def _send_json(self, status, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+def make_server(service, host="127.0.0.1", port=8080, quiet=True):
+    """Creates (but does not start) a threaded HTTP server for the service."""
+    server = ThreadingHTTPServer((host, port), SolverRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    SolverRequestHandler.quiet = quiet
+    return server
+
+def serve_workers(server, workers):
+    """Forks worker processes that all serve requests from the server's socket, and waits for them.
+
+    Everything loaded before this call is shared with the workers: memory-mapped files (the feedback
+    table, the compiled word list) through the page cache, and other objects copy-on-write.
+    """
+    # Every worker is woken for each new connection; the ones that lose the race to accept it
+    # get an error instead of blocking, and go back to waiting
+    server.socket.setblocking(False)
+    # Keep the garbage collector from writing to (and so copying) the objects loaded so far
+    gc.freeze()
+    pids = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os._exit(0)
+        pids.append(pid)
+
+    # Stop the workers too when the supervisor is terminated
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        for pid in pids:
+            os.waitpid(pid, 0)
+    except (KeyboardInterrupt, SystemExit):
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in pids:
+            os.waitpid(pid, 0)
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the Wordle solver over HTTP/JSON")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="port to listen on (default: 8080)")
+    parser.add_argument("--max-sessions", type=int, default=10000, help="most sessions kept at once (default: 10000)")
+    parser.add_argument("--idle-timeout", type=float, default=1800, help="seconds before an idle session is dropped (default: 1800)")
+    parser.add_argument("--cache-size", type=int, default=100000, help="most cached suggestions (default: 100000)")
+    parser.add_argument("--cache-file", default=None, help="load the suggestion cache from, and save it to, this file")
+    parser.add_argument("--words", default="words.txt", help="word list (default: words.txt)")
+    parser.add_argument("--length", type=int, default=5, help="letters per word, e.g. 4-8 (default: 5)")
+    parser.add_argument("--guesses", metavar="FILE", help="extra allowed guesses (never answers) for the entropy strategy")
+    parser.add_argument("--reload-interval", type=float, default=RELOAD_INTERVAL,
+                        help=f"seconds between checks of the word files for changes; 0 to turn off (default: {RELOAD_INTERVAL:g})")
+    parser.add_argument("--time-budget", type=int, metavar="MS",
+                        help="default lookahead search time per suggestion for new sessions (see lookahead.py)")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes sharing one copy of the tables (default: 1)")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+    if args.time_budget is not None and not 0 <= args.time_budget <= MAX_TIME_BUDGET_MS:
+        parser.error(f"--time-budget must be from 0 to {MAX_TIME_BUDGET_MS} ms")
+    if args.workers > 1 and not hasattr(os, "fork"):
+        parser.error("--workers needs os.fork (Linux or macOS)")
+
+    service = SolverService(args.words, max_sessions=args.max_sessions, idle_timeout=args.idle_timeout,
+                            cache_size=args.cache_size, cache_file=args.cache_file, length=args.length,
+                            guesses_file=args.guesses, shared_sessions=args.workers > 1,
+                            reload_interval=args.reload_interval, time_budget_ms=args.time_budget)
+    server = make_server(service, args.host, args.port, quiet=not args.verbose)
+    print(f"Wordle solver service listening on http://{args.host}:{args.port}", flush=True)
+    if args.workers > 1:
+        print(f"Serving with {args.workers} worker processes", flush=True)
+        try:
+            serve_workers(server, args.workers)
+        finally:
+            server.server_close()
+        # Each worker has its own suggestion cache, so --cache-file is only loaded, not saved
+        return
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down.")
+    finally:
+        server.server_close()
+        service.save_cache()
+
+if __name__ == "__main__":
+    main()
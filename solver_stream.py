@@ -0,0 +1,181 @@
+"""Non-interactive JSON-lines mode of the solver: python wordle_solver.py --stream < states.jsonl
+
+Each input line is a JSON object holding a guess history; each output line answers the input
+line in the same position:
+
+    {"id": 7, "history": [["crane", "XYXXG"], ["spore", "XXXGG"]]}
+    {"id": 7, "suggestion": "fibre", "remaining": 11}
+
+The history may also be a list of {"guess": ..., "feedback": ...} objects, as the HTTP service
+returns it. "id" is optional and copied to the output. With --candidates N the output also lists
+up to N of the remaining words. A line that can't be used gets {"error": ...} instead and the
+stream carries on; blank lines are skipped.
+
+The word lists are loaded once. Suggestions are cached per candidate set and their random
+tie-breaks are seeded from the state, so the output is the same with or without the cache and
+with any number of workers. Lines are read and answered in batches; with --workers the batches
+are handed to worker processes and written back in input order. Output is flushed once per
+batch, so use --batch-size 1 when another program waits for each answer. Loading messages go to
+stderr, keeping stdout pure JSON.
+"""
+import contextlib
+import json
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import wordle_solver
+from constraints import Constraints
+from game_logs import batched
+from suggestion_cache import SuggestionCache, bitset_fingerprint
+from word_index import WordIndex
+from wordle_solver import opening_guess, suggest_next_guess
+
+BATCH_SIZE = 1000
+
+class StreamSolver:
+    """Answers guess histories against one word list."""
+
+    def __init__(self, words, strategy="frequency", seed=0, candidates=0):
+        self.index = WordIndex(words, len(words[0]))
+        self.strategy = strategy
+        self.seed = seed
+        self.candidates = candidates
+        self.cache = SuggestionCache(100000)  # Many states share their first few turns
+
+    def suggestion(self, candidates):
+        """The suggestion for a candidate bitset; ties are broken by a seed derived from the state."""
+        fingerprint = bitset_fingerprint(self.index, candidates)
+
+        def compute():
+            random.seed(f"{self.seed}:{fingerprint}")
+            return suggest_next_guess(self.index.words_of(candidates), None, self.strategy)
+
+        return self.cache.get_or_compute(self.cache.make_key(fingerprint, self.strategy), compute)
+
+    def parse_history(self, state):
+        history = state.get("history")
+        if not isinstance(history, list):
+            raise ValueError("'history' must be a list of turns")
+        turns = []
+        for turn in history:
+            if isinstance(turn, dict):
+                turn = (turn.get("guess"), turn.get("feedback"))
+            if not isinstance(turn, (list, tuple)) or len(turn) != 2 or not all(isinstance(part, str) for part in turn):
+                raise ValueError(f"Bad turn {json.dumps(turn)}: expected [guess, feedback]")
+            guess, feedback = turn[0].lower(), turn[1].upper()
+            if len(guess) != self.index.length or not guess.isalpha():
+                raise ValueError(f"Guess '{guess}' must be exactly {self.index.length} letters")
+            if len(feedback) != self.index.length or not all(c in "GYX" for c in feedback):
+                raise ValueError(f"Feedback '{feedback}' must be {self.index.length} characters of G, Y or X")
+            turns.append((guess, feedback))
+        return turns
+
+    def solve(self, state):
+        """Returns the output object for one input object."""
+        history = self.parse_history(state)
+        constraints = Constraints.empty(self.index.length)
+        for guess, feedback in history:
+            constraints = constraints.apply(guess, feedback)
+        candidates = self.index.filter(self.index.all, constraints)
+        remaining = self.index.count(candidates)
+
+        suggestion = None
+        if remaining:
+            suggestion = opening_guess(history) or self.suggestion(candidates)
+        result = {"suggestion": suggestion, "remaining": remaining}
+        if self.candidates:
+            result["candidates"] = self.index.words_of(candidates)[:self.candidates]
+        return result
+
+    def answer_line(self, line):
+        """Returns the output line for one input line, or None for a blank line."""
+        if not line.strip():
+            return None
+        state_id = None
+        try:
+            state = json.loads(line)
+            if not isinstance(state, dict):
+                raise ValueError("Each line must be a JSON object")
+            state_id = state.get("id")
+            result = self.solve(state)
+        except ValueError as e:  # json.JSONDecodeError is a ValueError
+            result = {"error": str(e)}
+        if state_id is not None:
+            result = {"id": state_id, **result}
+        return json.dumps(result)
+
+    def answer_batch(self, lines):
+        return [out for out in map(self.answer_line, lines) if out is not None]
+
+_SOLVER = None  # StreamSolver of a worker process (set by init_worker)
+
+def init_worker(words, strategy, seed, candidates, all_words, tree, book, guesses):
+    """Sets up the solver and the solver globals (the entropy strategy guesses from all_words) once per process."""
+    global _SOLVER
+    _SOLVER = StreamSolver(words, strategy, seed, candidates)
+    wordle_solver.ALL_WORDS = all_words
+    wordle_solver.GUESS_WORDS = guesses
+    wordle_solver.DECISION_TREE = tree
+    wordle_solver.OPENING_BOOK = book
+
+def _answer_batch(lines):
+    return _SOLVER.answer_batch(lines)
+
+def load_for_stream(length=5, words_file="words.txt", guesses_file=None):
+    """Loads the word lists, tree and book like the interactive CLI, with its messages sent to stderr."""
+    with contextlib.redirect_stdout(sys.stderr):
+        wordle_solver.WORD_LENGTH = length
+        words = wordle_solver.load_word_universe(words_file, length=length)
+        if guesses_file:
+            wordle_solver.load_guess_words(guesses_file, length)
+        if words and length == 5:
+            wordle_solver.load_tree(words)
+        if words and wordle_solver.DECISION_TREE is None:
+            wordle_solver.load_book(words)
+    return words
+
+def run_stream(lines, out, words, strategy="frequency", workers=1, candidates=0, seed=0, batch_size=BATCH_SIZE):
+    """Answers every line of input and writes the answers to out in order; returns the number of lines written."""
+    initargs = (words, strategy, seed, candidates, wordle_solver.ALL_WORDS, wordle_solver.DECISION_TREE,
+                wordle_solver.OPENING_BOOK, wordle_solver.GUESS_WORDS)
+    written = 0
+
+    def write(answers):
+        nonlocal written
+        if answers:
+            out.write("\n".join(answers) + "\n")
+            out.flush()
+            written += len(answers)
+
+    if workers <= 1:
+        init_worker(*initargs)
+        for batch in batched(lines, batch_size):
+            write(_SOLVER.answer_batch(batch))
+        return written
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=initargs) as pool:
+        # A few batches per worker in flight, so input is never read far ahead of the output
+        pending = []
+        for batch in batched(lines, batch_size):
+            pending.append(pool.submit(_answer_batch, batch))
+            if len(pending) >= workers * 2:
+                write(pending.pop(0).result())
+        for future in pending:
+            write(future.result())
+    return written
+
+def main(strategy="frequency", length=5, words_file="words.txt", guesses_file=None, workers=1, candidates=0, seed=0,
+         batch_size=BATCH_SIZE):
+    """Entry point for wordle_solver.py --stream: reads stdin and writes stdout."""
+    words = load_for_stream(length, words_file, guesses_file)
+    if not words:
+        print("Word list is empty. Please provide a words.txt file.", file=sys.stderr)
+        return 1
+    try:
+        run_stream(sys.stdin, sys.stdout, words, strategy, workers, candidates, seed, batch_size)
+    except BrokenPipeError:
+        # The reader went away (e.g. | head): stop quietly, without another error when stdout is flushed at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    return 0
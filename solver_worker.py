@@ -0,0 +1,65 @@
+import itertools
+import queue
+import threading
+import time
+
+class SolverWorker:
+    """Runs solver jobs on a background thread so a UI thread never blocks on them.
+
+    Jobs are submitted under a kind (e.g. "refresh"). Submitting a new job of the same kind
+    makes any older one stale: if it hasn't started it is skipped, and if it is already
+    running its result is dropped. Results are collected with poll(), which a Tk app calls
+    from root.after so all widget updates stay on the main thread.
+    """
+
+    def __init__(self):
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+        self.latest = {}  # kind -> id of the most recent job of that kind
+        self.job_ids = itertools.count(1)
+        self.thread = threading.Thread(target=self._run, name="solver-worker", daemon=True)
+        self.thread.start()
+
+    def submit(self, kind, func, *args):
+        """Queues func(*args) and returns its job id; older jobs of the same kind become stale."""
+        job_id = next(self.job_ids)
+        self.latest[kind] = job_id
+        self.requests.put((kind, job_id, func, args))
+        return job_id
+
+    def cancel(self, kind):
+        """Makes every queued or running job of this kind stale."""
+        self.latest[kind] = None
+
+    def is_busy(self, kind):
+        """Checks whether a job of this kind is still pending."""
+        return self.latest.get(kind) is not None
+
+    def _run(self):
+        while True:
+            kind, job_id, func, args = self.requests.get()
+            if self.latest.get(kind) != job_id:
+                continue  # Superseded before it started
+
+            start = time.perf_counter()
+            try:
+                result, error = func(*args), None
+            except Exception as e:  # Reported back to the UI thread instead of killing the worker
+                result, error = None, e
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            if self.latest.get(kind) == job_id:
+                self.results.put((kind, job_id, result, error, elapsed_ms))
+
+    def poll(self):
+        """Returns the finished, still-current jobs as (kind, result, error, elapsed_ms) tuples."""
+        finished = []
+        while True:
+            try:
+                kind, job_id, result, error, elapsed_ms = self.results.get_nowait()
+            except queue.Empty:
+                return finished
+            # Check again: a newer job may have been submitted after this one finished
+            if self.latest.get(kind) == job_id:
+                self.latest[kind] = None
+                finished.append((kind, result, error, elapsed_ms))
@@ -0,0 +1,110 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+def words_fingerprint(words):
+    """A stable digest of a set of words, independent of their order."""
+    return hashlib.blake2b("\n".join(sorted(words)).encode("ascii"), digest_size=16).hexdigest()
+
+def bitset_fingerprint(word_index, candidates):
+    """A stable digest of a candidate bitset over a WordIndex; cheaper than hashing the words."""
+    digest = hashlib.blake2b(word_index.fingerprint.encode("ascii"), digest_size=16)
+    digest.update(candidates.to_bytes((len(word_index) + 7) // 8, "little"))
+    return digest.hexdigest()
+
+class SuggestionCache:
+    """A size-bounded LRU cache of suggestions keyed by (candidate set, strategy, guess pool).
+
+    Different guess paths often end at the same set of possible words, and the best guess only
+    depends on that set, so a suggestion computed once can be reused by every later game that
+    reaches the same state. The cache can be saved to and loaded from a JSON file.
+    """
+
+    def __init__(self, max_entries=100000):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(fingerprint, strategy, guess_pool=""):
+        return f"{fingerprint}:{strategy}:{guess_pool}"
+
+    def get(self, key):
+        """Returns the cached suggestion for key, or None."""
+        with self.lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        """Returns the cached suggestion for key, computing and storing it on a miss."""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            if value is not None:
+                self.put(key, value)
+        return value
+
+    def get_or_search(self, key, search):
+        """Like get_or_compute for a search that returns (suggestion, final).
+
+        Only final suggestions are stored: one from a search cut short by its time budget depends
+        on the load at the time, and a later search may get further.
+        """
+        value = self.get(key)
+        if value is None:
+            value, final = search()
+            if value is not None and final:
+                self.put(key, value)
+        return value
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+    def save(self, filename):
+        """Writes the cache to a JSON file, least recently used first."""
+        with self.lock:
+            items = list(self.entries.items())
+        tmp_path = f"{filename}.tmp"
+        with open(tmp_path, 'w') as file:
+            json.dump(items, file)
+        os.replace(tmp_path, filename)
+
+    def load(self, filename):
+        """Adds the entries from a saved cache file; returns how many were loaded."""
+        try:
+            with open(filename, 'r') as file:
+                items = json.load(file)
+        except FileNotFoundError:
+            return 0
+        for key, value in items:
+            self.put(key, value)
+        return len(items)
+
+    def __len__(self):
+        return len(self.entries)
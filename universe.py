@@ -0,0 +1,173 @@
+"""Compact binary word-universe format for fast cold start.
+
+`python universe.py compile` packs words.txt and past_used_words.txt into one file:
+
+    header   magic, word length, word count, content hash, source file sizes and mtimes
+    words    (N, length) uint8 array of ASCII letters
+    past     N bits, set where the word is a past Wordle answer (np.packbits)
+
+Loading memory-maps the file and views both arrays with numpy.frombuffer, with no per-word
+parsing; strings are only built when a word list is actually needed.
+
+`python universe.py bench` compares this with loading the text files.
+"""
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import time
+
+import numpy as np
+
+COMPILED_FILE = "words.bin"
+MAGIC = b"WUNIV001"
+# magic, word length, word count, content hash, words size, words mtime_ns, past size, past mtime_ns
+HEADER = struct.Struct("<8sBxxxI16sqqqq")
+
+def read_past_words(filename):
+    """Reads the ' | '-separated past answers file into a set (empty if the file is missing)."""
+    try:
+        with open(filename, 'r') as file:
+            return {word.strip().lower() for word in file.read().split('|') if word.strip()}
+    except FileNotFoundError:
+        return set()
+
+def _source_stamp(filename):
+    """Returns (size, mtime_ns) for a source file, or (-1, -1) if it doesn't exist."""
+    try:
+        stat = os.stat(filename)
+        return stat.st_size, stat.st_mtime_ns
+    except FileNotFoundError:
+        return -1, -1
+
+def content_hash(words, past_mask):
+    """Hashes the packed words and exclusion mask."""
+    digest = hashlib.sha256(words.tobytes())
+    digest.update(np.packbits(past_mask).tobytes())
+    return digest.hexdigest()[:16]
+
+def compile_universe(words_file="words.txt", past_file="past_used_words.txt", output=COMPILED_FILE, length=5):
+    """Writes the compiled universe file and returns the number of words packed."""
+    from wordle_solver import read_word_file
+
+    words = read_word_file(words_file, length)
+    past_words = read_past_words(past_file)
+    letters = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8).reshape(len(words), length)
+    past_mask = np.fromiter((word in past_words for word in words), dtype=bool, count=len(words))
+
+    words_size, words_mtime = _source_stamp(words_file)
+    past_size, past_mtime = _source_stamp(past_file)
+    header = HEADER.pack(MAGIC, length, len(words), content_hash(letters, past_mask).encode("ascii"),
+                         words_size, words_mtime, past_size, past_mtime)
+
+    tmp_path = f"{output}.tmp"
+    with open(tmp_path, 'wb') as file:
+        file.write(header)
+        file.write(letters.tobytes())
+        file.write(np.packbits(past_mask).tobytes())
+    os.replace(tmp_path, output)
+    return len(words)
+
+class CompiledUniverse:
+    """A memory-mapped compiled universe: packed words plus the past-answer mask."""
+
+    def __init__(self, filename=COMPILED_FILE):
+        with open(filename, 'rb') as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, self.length, count, digest, self.words_size, self.words_mtime,
+         self.past_size, self.past_mtime) = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC:
+            raise ValueError(f"{filename} is not a compiled word universe")
+        self.hash = digest.decode("ascii")
+
+        offset = HEADER.size
+        self.letters = np.frombuffer(self.buffer, dtype=np.uint8, count=count * self.length,
+                                     offset=offset).reshape(count, self.length)
+        offset += count * self.length
+        packed = np.frombuffer(self.buffer, dtype=np.uint8, count=(count + 7) // 8, offset=offset)
+        self.past_mask = np.unpackbits(packed, count=count).astype(bool)
+
+    def __len__(self):
+        return self.letters.shape[0]
+
+    def is_fresh(self, words_file="words.txt", past_file="past_used_words.txt"):
+        """Checks that the source files haven't changed since this file was compiled."""
+        return (_source_stamp(words_file) == (self.words_size, self.words_mtime) and
+                _source_stamp(past_file) == (self.past_size, self.past_mtime))
+
+    def _strings(self, rows):
+        blob = rows.tobytes().decode("ascii")
+        step = self.length
+        return [blob[i:i + step] for i in range(0, len(blob), step)]
+
+    def all_words(self):
+        """Every word, including past answers, as strings."""
+        return self._strings(self.letters)
+
+    def answer_words(self):
+        """The words that are not past answers, as strings."""
+        return self._strings(self.letters[~self.past_mask])
+
+    def past_words(self):
+        """The past answers that are in the word list, as a set."""
+        return set(self._strings(self.letters[self.past_mask]))
+
+def load_compiled_universe(words_file="words.txt", past_file="past_used_words.txt", filename=COMPILED_FILE):
+    """Returns the compiled universe if it exists and is up to date with the sources, else None."""
+    try:
+        universe = CompiledUniverse(filename)
+    except (FileNotFoundError, ValueError, struct.error):
+        return None
+    return universe if universe.is_fresh(words_file, past_file) else None
+
+def benchmark(words_file="words.txt", past_file="past_used_words.txt", filename=COMPILED_FILE, repeat=50):
+    """Times the text load against the compiled load and prints both."""
+    from wordle_solver import read_word_file
+
+    def text_load():
+        past_words = read_past_words(past_file)
+        all_words = read_word_file(words_file)
+        return [word for word in all_words if word not in past_words]
+
+    def binary_load():
+        return CompiledUniverse(filename).answer_words()
+
+    def binary_arrays_only():
+        universe = CompiledUniverse(filename)
+        return universe.letters[~universe.past_mask]
+
+    if not os.path.exists(filename):
+        compile_universe(words_file, past_file, filename)
+
+    results = {}
+    for name, func in (("text", text_load), ("binary -> strings", binary_load), ("binary arrays", binary_arrays_only)):
+        func()  # Warm the OS file cache
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        results[name] = (time.perf_counter() - start) / repeat * 1000
+
+    print(f"Startup load of {words_file} + {past_file} (mean of {repeat} runs):")
+    for name, ms in results.items():
+        print(f"  {name:<18} {ms:8.3f} ms")
+    print(f"  speedup (arrays vs text): {results['text'] / results['binary arrays']:.1f}x")
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the word lists into a fast-loading binary file")
+    parser.add_argument("command", choices=["compile", "bench"], help="compile the file, or benchmark loading it")
+    parser.add_argument("--words", default="words.txt", help="word list (default: words.txt)")
+    parser.add_argument("--past", default="past_used_words.txt", help="past answers (default: past_used_words.txt)")
+    parser.add_argument("--output", default=COMPILED_FILE, help=f"compiled file (default: {COMPILED_FILE})")
+    parser.add_argument("--length", type=int, default=5, help="letters per word (default: 5)")
+    args = parser.parse_args()
+
+    if args.command == "compile":
+        count = compile_universe(args.words, args.past, args.output, args.length)
+        print(f"Compiled {count} words into {args.output} ({os.path.getsize(args.output)} bytes)")
+    else:
+        benchmark(args.words, args.past, args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import hashlib
+
+from constraints import ALL_LETTERS_MASK
+
+class WordIndex:
+    """Inverted bitset indexes over a fixed word list.
+
+    A candidate set is a Python int with bit j set when words[j] is still possible, so filtering
+    is a handful of AND / AND NOT operations on big ints instead of a walk over every string:
+
+    - at[i][k]: words with letter k at position i
+    - at_least[k][c]: words containing letter k at least c times (at_least[k][0] is every word)
+
+    A letter being absent is just ~at_least[k][1].
+    """
+
+    def __init__(self, words, length=5):
+        self.words = list(words)
+        self.length = length
+        self.positions = {word: j for j, word in enumerate(self.words)}
+        # Identifies this word list, so bitsets from different indexes are never confused
+        self.fingerprint = self.fingerprint_of(self.words)
+        self.all = (1 << len(self.words)) - 1
+
+        # Collect the word positions for every bitset first: OR-ing bits into big ints one word
+        # at a time is quadratic, which matters for 100k-word dictionaries
+        at = [[[] for _ in range(26)] for _ in range(length)]
+        at_least = [[[] for _ in range(length + 1)] for _ in range(26)]
+        for j, word in enumerate(self.words):
+            counts = {}
+            for i, letter in enumerate(word):
+                k = ord(letter) - ord('a')
+                at[i][k].append(j)
+                counts[k] = counts.get(k, 0) + 1
+            for k, count in counts.items():
+                for c in range(1, count + 1):
+                    at_least[k][c].append(j)
+
+        size = len(self.words)
+        self.at = [[_bitset(positions, size) for positions in row] for row in at]
+        self.at_least = [[self.all] + [_bitset(positions, size) for positions in row[1:]] for row in at_least]
+
+    @staticmethod
+    def fingerprint_of(words):
+        """The fingerprint an index over these words would have, without building it."""
+        return hashlib.blake2b("\n".join(words).encode("ascii"), digest_size=16).hexdigest()
+
+    def filter(self, candidates, constraints):
+        """Returns the subset of the candidate bitset that satisfies the constraints."""
+        for i, mask in enumerate(constraints.masks):
+            if mask == ALL_LETTERS_MASK:
+                continue
+            # OR together whichever side is shorter: the allowed letters or the banned ones
+            if bin(mask).count("1") <= 13:
+                keep = 0
+                for k in _letters(mask):
+                    keep |= self.at[i][k]
+                candidates &= keep
+            else:
+                for k in _letters(ALL_LETTERS_MASK & ~mask):
+                    candidates &= ~self.at[i][k]
+            if not candidates:
+                return 0
+
+        for k, (low, high) in enumerate(zip(constraints.min_counts, constraints.max_counts)):
+            if low:
+                candidates &= self.at_least[k][low]
+            if high < self.length:
+                candidates &= ~self.at_least[k][high + 1]
+        return candidates
+
+    def from_words(self, words):
+        """Returns the bitset for a collection of words (words not in the index are ignored)."""
+        positions = self.positions
+        return _bitset((positions[word] for word in words if word in positions), len(self.words))
+
+    def words_of(self, candidates):
+        """Turns a candidate bitset back into a list of words, in index order."""
+        words = []
+        # Walk the bytes rather than clearing one bit at a time, which copies the whole int per word
+        for byte_index, byte in enumerate(candidates.to_bytes((len(self.words) + 7) // 8, "little")):
+            while byte:
+                low = byte & -byte
+                words.append(self.words[(byte_index << 3) + low.bit_length() - 1])
+                byte ^= low
+        return words
+
+    def count(self, candidates):
+        """Returns how many words are in a candidate bitset."""
+        return bin(candidates).count("1")
+
+    def __contains__(self, word):
+        return word in self.positions
+
+    def __len__(self):
+        return len(self.words)
+
+def _bitset(positions, size):
+    """Builds the big-int bitset with the given bit positions set."""
+    buffer = bytearray((size + 7) // 8)
+    for j in positions:
+        buffer[j >> 3] |= 1 << (j & 7)
+    return int.from_bytes(buffer, "little")
+
+def _letters(mask):
+    """Yields the letter numbers (a = 0) set in a 26-bit mask."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
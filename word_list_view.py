@@ -0,0 +1,155 @@
+"""Virtualized word list for the GUI: only the rows in view are drawn, however many words there are.
+
+The words live in a WordListModel, a plain ordered list kept apart from Tk. When feedback only
+removes candidates (the usual case) the model drops them in place instead of rebuilding, and the
+view keeps the first visible word that survived at the top. The view is a Canvas with one text
+item per visible cell, reused on every redraw, so showing or scrolling a 2,000-word list costs
+the same as a 20-word one.
+"""
+import tkinter as tk
+import tkinter.font as tkfont
+
+ORDERS = ("score", "alpha")
+
+class WordListModel:
+    """The words in display order, sorted by score (best first) or alphabetically."""
+
+    def __init__(self, order="score"):
+        self.words = []
+        self.members = set()
+        self.scores = {}
+        self.order = order
+
+    def __len__(self):
+        return len(self.words)
+
+    def sort(self):
+        if self.order == "score":
+            # Stable, so equal scores stay alphabetical
+            self.words.sort()
+            self.words.sort(key=lambda word: -self.scores.get(word, 0.0))
+        else:
+            self.words.sort()
+
+    def set_order(self, order):
+        if order not in ORDERS:
+            raise ValueError(f"Unknown order: {order}")
+        self.order = order
+        self.sort()
+
+    def update(self, words, scores=None):
+        """Replaces the words; returns how many were removed, or None if the list had to be rebuilt.
+
+        When the new words are a subset of the old ones they are removed in place. In score order
+        the survivors are then re-sorted by their new scores, which is cheap on a nearly sorted list.
+        """
+        if scores is not None:
+            self.scores = scores
+        members = set(words)
+        if self.words and members <= self.members:
+            removed = len(self.words) - len(members)
+            self.words = [word for word in self.words if word in members]
+            self.members = members
+            if self.order == "score" and scores is not None:
+                self.words.sort(key=lambda word: -self.scores.get(word, 0.0))
+            return removed
+        self.words = list(members)
+        self.members = members
+        self.sort()
+        return None
+
+class VirtualWordList(tk.Frame):
+    """A scrollable grid of words that draws only the visible rows."""
+
+    def __init__(self, parent, model=None, font=("Courier", 10), height=5, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.model = model if model is not None else WordListModel()
+        self.font = tkfont.Font(font=font)
+        self.row_height = self.font.metrics("linespace") + 2
+        self.top_row = 0  # First row in view
+        self.columns = 1
+        self.cell_width = 1
+        self.items = []  # Reusable canvas text items, one per visible cell
+        self.message = ""  # Shown instead of the words when the list is empty
+
+        self.canvas = tk.Canvas(self, height=height * self.row_height, bg="white", highlightthickness=0)
+        self.scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.canvas.bind("<Configure>", lambda event: self.redraw())
+        for widget in (self.canvas, self.scrollbar):
+            widget.bind("<MouseWheel>", self.on_mouse_wheel)  # Windows and macOS
+            widget.bind("<Button-4>", lambda event: self.scroll_rows(-3))  # X11
+            widget.bind("<Button-5>", lambda event: self.scroll_rows(3))
+
+    @property
+    def rows(self):
+        return -(-len(self.model) // self.columns)
+
+    def visible_rows(self):
+        return max(1, self.canvas.winfo_height() // self.row_height)
+
+    def set_words(self, words, scores=None, message=""):
+        """Shows a new candidate set, keeping the first visible word in place when words were only removed."""
+        anchor = self.model.words[self.top_row * self.columns] if self.top_row * self.columns < len(self.model) else None
+        removed = self.model.update(words, scores)
+        self.message = message
+        if removed is None or anchor is None:
+            self.top_row = 0
+        elif anchor in self.model.members:
+            self.top_row = self.model.words.index(anchor) // self.columns
+        self.redraw()
+
+    def set_order(self, order):
+        self.model.set_order(order)
+        self.top_row = 0
+        self.redraw()
+
+    def yview(self, *args):
+        """Scrollbar callback: ("moveto", fraction) or ("scroll", n, "units"/"pages")."""
+        if args[0] == "moveto":
+            self.top_row = int(float(args[1]) * self.rows)
+        elif args[0] == "scroll":
+            step = self.visible_rows() if args[2] == "pages" else 1
+            self.top_row += int(args[1]) * step
+        self.redraw()
+
+    def scroll_rows(self, rows):
+        self.top_row += rows
+        self.redraw()
+
+    def on_mouse_wheel(self, event):
+        # Windows reports multiples of 120 per notch; macOS reports small deltas
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self.scroll_rows(-delta * 3 if delta else 0)
+
+    def redraw(self):
+        """Draws the rows in view, reusing the canvas items from the last redraw."""
+        width = max(1, self.canvas.winfo_width())
+        length = len(self.model.words[0]) if self.model.words else 5
+        self.cell_width = self.font.measure("m" * (length + 2))
+        self.columns = max(1, width // self.cell_width)
+        visible = self.visible_rows()
+        self.top_row = max(0, min(self.top_row, self.rows - visible))
+
+        cells = visible * self.columns
+        while len(self.items) < cells:
+            self.items.append(self.canvas.create_text(0, 0, anchor=tk.NW, font=self.font, text=""))
+        first = self.top_row * self.columns
+        shown = self.model.words[first:first + cells]
+        for i, item in enumerate(self.items):
+            if i < len(shown):
+                row, col = divmod(i, self.columns)
+                self.canvas.coords(item, 4 + col * self.cell_width, 2 + row * self.row_height)
+                self.canvas.itemconfigure(item, text=shown[i])
+            elif i == 0 and self.message:
+                self.canvas.coords(item, 4, 2)
+                self.canvas.itemconfigure(item, text=self.message)
+            else:
+                self.canvas.itemconfigure(item, text="")
+
+        if self.rows:
+            self.scrollbar.set(self.top_row / self.rows, min(1.0, (self.top_row + visible) / self.rows))
+        else:
+            self.scrollbar.set(0.0, 1.0)
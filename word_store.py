@@ -0,0 +1,216 @@
+"""Array-backed word storage: a word list as NumPy arrays instead of Python strings.
+
+WordStore keeps the words as an (N, length) uint8 array of letter indices (a=0) and
+precomputes an (N, 26) matrix of letter counts. A subset of the words is an array of row numbers
+or a bool mask, and it converts to and from WordIndex bitsets. Strings are only built when asked
+for (word, words). Scoring runs over whole arrays: frequency_scores is the frequency strategy's
+formula for a subset, with no per-word Python loop.
+
+Membership goes through a perfect hash of each word's packed code (5 bits per letter) rather than
+a dict of strings. Every word in the store gets its own slot, so a lookup is two hashes and one
+comparison. The table is built on first use. It uses hash-and-displace: words are grouped into
+small buckets, and each bucket gets a displacement that puts its words in free slots.
+"""
+import numpy as np
+
+from patterns import words_to_array
+
+MASK64 = (1 << 64) - 1
+LOAD_FACTOR = 0.8  # Words per slot of the perfect hash; lower builds faster, higher uses less memory
+BUCKET_SIZE = 2  # Average words per displacement bucket; bigger buckets take longer to place
+
+GOLDEN = 0x9E3779B97F4A7C15
+
+def _mix(codes, seeds):
+    """splitmix64 of each code plus a seed (one for all, or one per code), on uint64 arrays; the arithmetic wraps."""
+    x = codes + np.multiply(np.asarray(seeds, dtype=np.uint64), np.uint64(GOLDEN))
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+def _mix_int(code, seed):
+    """_mix for a single code, in plain Python ints."""
+    x = (code + seed * GOLDEN) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+class PerfectHash:
+    """Maps each of a set of distinct uint64 codes to its own row, with no collisions to resolve.
+
+    Codes that aren't in the set land on some slot too, so lookups compare the code found there.
+    """
+
+    def __init__(self, codes):
+        self.codes = codes
+        self.num_slots = max(1, int(len(codes) / LOAD_FACTOR))
+        self.num_buckets = max(1, len(codes) // BUCKET_SIZE)
+        self.slots = np.full(self.num_slots, -1, dtype=np.int32 if len(codes) < 2 ** 31 else np.int64)
+        self.displacements = np.zeros(self.num_buckets, dtype=np.uint32)
+
+        buckets = (_mix(codes, 0) % np.uint64(self.num_buckets)).astype(np.intp)
+        order = np.argsort(buckets, kind="stable")  # Rows grouped by bucket
+        sizes = np.bincount(buckets, minlength=self.num_buckets)
+        starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        # Biggest buckets first, while most slots are still free. All buckets of one size try
+        # displacements together; a bucket is placed once none of its slots is taken or wanted
+        # by another bucket in the same round.
+        for size in np.unique(sizes[sizes > 0])[::-1]:
+            pending = np.flatnonzero(sizes == size)
+            displacement = np.ones(len(pending), dtype=np.uint32)
+            while len(pending):
+                members = order[starts[pending][:, None] + np.arange(size)]
+                slots = (_mix(codes[members], displacement[:, None]) % np.uint64(self.num_slots)).astype(np.intp)
+                _, inverse, wanted = np.unique(slots, return_inverse=True, return_counts=True)
+                clash = (self.slots[slots] >= 0) | (wanted[inverse].reshape(slots.shape) > 1)
+                placed = ~clash.any(axis=1)
+                self.slots[slots[placed]] = members[placed]
+                self.displacements[pending[placed]] = displacement[placed]
+                pending, displacement = pending[~placed], displacement[~placed] + 1
+
+    def lookup(self, code):
+        """Returns the row of a code, or None if it isn't in the set."""
+        bucket = _mix_int(code, 0) % self.num_buckets
+        row = int(self.slots[_mix_int(code, int(self.displacements[bucket])) % self.num_slots])
+        return row if row >= 0 and int(self.codes[row]) == code else None
+
+    def lookup_many(self, codes):
+        """Returns the row of each code in a uint64 array, -1 for codes not in the set."""
+        buckets = (_mix(codes, 0) % np.uint64(self.num_buckets)).astype(np.intp)
+        slots = _mix(codes, self.displacements[buckets]) % np.uint64(self.num_slots)
+        rows = self.slots[slots.astype(np.intp)].astype(np.intp)
+        found = rows >= 0
+        found[found] = self.codes[rows[found]] == codes[found]
+        return np.where(found, rows, -1)
+
+    @property
+    def nbytes(self):
+        return self.slots.nbytes + self.displacements.nbytes
+
+class WordStore:
+    """A fixed word list held as arrays: letters, letter counts and packed codes."""
+
+    def __init__(self, letters):
+        self.letters = np.ascontiguousarray(letters, dtype=np.uint8)  # (N, length), a=0
+        num_words, self.length = self.letters.shape
+        if self.length > 12:
+            raise ValueError(f"Words longer than 12 letters don't fit a 64-bit code (got {self.length})")
+        if (self.letters >= 26).any():
+            raise ValueError("Words must be lowercase a-z only")
+        rows = np.arange(num_words)
+        self.counts = np.zeros((num_words, 26), dtype=np.uint8)
+        for i in range(self.length):
+            self.counts[rows, self.letters[:, i]] += 1
+        # Whether position i holds the first occurrence of its letter in the word
+        self.first = np.ones(self.letters.shape, dtype=bool)
+        for i in range(1, self.length):
+            self.first[:, i] = (self.letters[:, :i] != self.letters[:, i:i + 1]).all(axis=1)
+        self.codes = self._pack(self.letters)
+        self._hash = None
+
+    @classmethod
+    def from_words(cls, words, length=None):
+        """Raises ValueError for words that aren't all lowercase a-z of one length."""
+        words = list(words)
+        return cls(words_to_array(words, length or (len(words[0]) if words else 5)))
+
+    @classmethod
+    def from_compiled(cls, compiled):
+        """Builds the store straight from a CompiledUniverse's ASCII array, without making strings."""
+        return cls(compiled.letters - ord('a'))
+
+    @staticmethod
+    def _pack(letters):
+        codes = np.zeros(letters.shape[0], dtype=np.uint64)
+        for i in range(letters.shape[1]):
+            codes |= letters[:, i].astype(np.uint64) << np.uint64(5 * i)
+        return codes
+
+    def encode(self, word):
+        """The packed code of a word, or None if it can't be in this store (wrong length or not a-z)."""
+        if len(word) != self.length:
+            return None
+        code = 0
+        for i, letter in enumerate(word):
+            k = ord(letter) - ord('a')
+            if not 0 <= k < 26:
+                return None
+            code |= k << (5 * i)
+        return code
+
+    @property
+    def perfect_hash(self):
+        if self._hash is None:
+            self._hash = PerfectHash(self.codes)
+        return self._hash
+
+    def index_of(self, word):
+        """The row of a word, or None if it isn't in the store."""
+        code = self.encode(word)
+        return None if code is None else self.perfect_hash.lookup(code)
+
+    def contains(self, word):
+        return self.index_of(word) is not None
+
+    __contains__ = contains
+
+    def rows_of(self, words):
+        """The row of each word as an array, -1 for words not in the store."""
+        words = list(words)
+        try:
+            letters = words_to_array(words, self.length)
+        except (UnicodeEncodeError, ValueError):
+            return np.array([-1 if row is None else row for row in map(self.index_of, words)], dtype=np.intp)
+        valid = (letters < 26).all(axis=1)
+        rows = self.perfect_hash.lookup_many(self._pack(np.where(valid[:, None], letters, 0)))
+        return np.where(valid, rows, -1)
+
+    def word(self, row):
+        return (self.letters[row] + ord('a')).astype(np.uint8).tobytes().decode("ascii")
+
+    def words(self, rows=None):
+        """The words at an array of rows or under a bool mask (all words if None), as strings."""
+        letters = self.letters if rows is None else self.letters[rows]
+        blob = (letters + ord('a')).astype(np.uint8).tobytes().decode("ascii")
+        return [blob[i:i + self.length] for i in range(0, len(blob), self.length)]
+
+    def rows_of_bitset(self, candidates):
+        """The rows set in a WordIndex candidate bitset over the same word list."""
+        packed = np.frombuffer(candidates.to_bytes((len(self) + 7) // 8, "little"), dtype=np.uint8)
+        return np.flatnonzero(np.unpackbits(packed, count=len(self), bitorder="little"))
+
+    def bitset_of(self, rows):
+        """A WordIndex candidate bitset from an array of rows or a bool mask."""
+        mask = np.zeros(len(self), dtype=bool)
+        mask[rows] = True
+        return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+
+    def frequency_scores(self, rows=None):
+        """The frequency strategy's score of each word in a subset (every word if rows is None).
+
+        Same formula as wordle_solver.frequency_scores, with the terms added in the same order,
+        so the scores are identical to the last bit and ties break the same way.
+        """
+        letters = self.letters if rows is None else self.letters[rows]
+        first = self.first if rows is None else self.first[rows]
+        counts = self.counts if rows is None else self.counts[rows]
+        num_words = len(letters)
+        if not num_words:
+            return np.zeros(0)
+        letter_freq = (counts > 0).sum(axis=0) / num_words
+        scores = np.zeros(num_words)
+        for i in range(self.length):
+            position_freq = np.bincount(letters[:, i], minlength=26) / num_words
+            scores += np.where(first[:, i], letter_freq[letters[:, i]], 0.0)
+            scores += position_freq[letters[:, i]]
+        scores += (counts > 0).sum(axis=1) * 0.2
+        return scores
+
+    @property
+    def nbytes(self):
+        """Bytes held by the arrays (and the perfect hash, once built)."""
+        total = self.letters.nbytes + self.counts.nbytes + self.first.nbytes + self.codes.nbytes
+        return total + (self._hash.nbytes if self._hash is not None else 0)
+
+    def __len__(self):
+        return self.letters.shape[0]
@@ -0,0 +1,101 @@
+"""A reloadable word universe for long-running processes (the HTTP service).
+
+past_used_words.txt gains a word every day. WordUniverse watches it and words.txt by size and
+mtime, and on a change publishes a new UniverseSnapshot rather than changing the current one, so
+a game keeps the snapshot it started with until it ends.
+
+When only the past answers changed, the new snapshot reuses the old WordIndex (built over every
+word, past answers included) and just recomputes the answer bitset. Everything keyed by the index
+or the full word list stays valid: cached suggestions, the feedback table, the allowed-guess pool.
+Only a change to words.txt itself rebuilds the index.
+"""
+import hashlib
+import os
+import time
+
+from word_index import WordIndex
+
+def file_stamp(filename):
+    """Returns (size, mtime_ns) for a file, or (-1, -1) if it doesn't exist."""
+    try:
+        stat = os.stat(filename)
+        return stat.st_size, stat.st_mtime_ns
+    except FileNotFoundError:
+        return -1, -1
+
+class UniverseSnapshot:
+    """One version of the word lists. It is not changed once published, so games can hold on to it."""
+
+    def __init__(self, index, past_words, version=1):
+        self.index = index  # Over every word, past answers included
+        self.past_words = frozenset(past_words)
+        self.answer_mask = index.all & ~index.from_words(self.past_words)
+        self.answers = index.words_of(self.answer_mask)
+        self.version = version
+        # Identifies the contents (not the version number), so separate processes agree on it
+        digest = hashlib.blake2b(index.fingerprint.encode("ascii"), digest_size=8)
+        digest.update(self.answer_mask.to_bytes((len(index.words) + 7) // 8, "little"))
+        self.key = digest.digest()
+        # Set by the owner before the snapshot is published
+        self.tree = None
+        self.book = None
+        self.guesses = None  # The guess pool: every word plus any extra allowed guesses
+        self.guess_pool = None  # Fingerprint of guesses, part of suggestion cache keys
+
+class WordUniverse:
+    """The current UniverseSnapshot, replaced by reload() when the word files change."""
+
+    def __init__(self, words_file="words.txt", past_file="past_used_words.txt", length=5, all_words=None, past_words=None):
+        from wordle_solver import load_past_words, read_word_file
+
+        self.words_file = words_file
+        self.past_file = past_file
+        self.length = length
+        self.stamps = self.file_stamps()
+        if all_words is None:
+            all_words = read_word_file(words_file, length)
+        if past_words is None:
+            past_words = load_past_words(past_file)
+        self.current = UniverseSnapshot(WordIndex(all_words, length), past_words)
+
+    def file_stamps(self):
+        return file_stamp(self.words_file), file_stamp(self.past_file)
+
+    def changed(self):
+        """Checks the files' sizes and mtimes; a cheap stat() each, no reading."""
+        return self.file_stamps() != self.stamps
+
+    def reload(self, prepare=None, force=False):
+        """Re-reads the word files if they changed and publishes the new snapshot.
+
+        prepare(old, new, report) runs before publishing, to attach the tree and book to the new
+        snapshot and add to the report. Returns the report, or None if the contents didn't change.
+        """
+        from wordle_solver import load_past_words, read_word_file
+
+        stamps = self.file_stamps()
+        if stamps == self.stamps and not force:
+            return None
+        start = time.perf_counter()
+        old = self.current
+        past_words = load_past_words(self.past_file)
+        index = old.index
+        if stamps[0] != self.stamps[0] or force:
+            words = read_word_file(self.words_file, self.length)
+            if WordIndex.fingerprint_of(words) != old.index.fingerprint:
+                index = WordIndex(words, self.length)
+        self.stamps = stamps
+        new = UniverseSnapshot(index, past_words, old.version + 1)
+        if new.key == old.key:
+            return None  # Touched, but the same words
+
+        report = {"version": new.version, "kind": "incremental" if index is old.index else "full",
+                  "words": len(index.words), "answers": len(new.answers)}
+        if index is old.index:
+            report["answers_added"] = index.words_of(new.answer_mask & ~old.answer_mask)
+            report["answers_removed"] = index.words_of(old.answer_mask & ~new.answer_mask)
+        if prepare is not None:
+            prepare(old, new, report)
+        self.current = new
+        report["ms"] = round((time.perf_counter() - start) * 1000, 2)
+        return report
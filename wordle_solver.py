@@ -1,8 +1,27 @@
+import os
 import random
 
+import instrumentation
+from game_history import GameHistory
+from instrumentation import TRACE_ENV, instrument_class, instrument_module
+from word_index import WordIndex
+
 # Placeholder for the word list
 WORD_LIST = []
+ALL_WORDS = []  # Every word from the word file, including past used words
+GUESS_WORDS = []  # ALL_WORDS plus any extra allowed guesses (see load_guess_words); empty if none were loaded
 PAST_WORDS = set()
+DECISION_TREE = None  # Precomputed decision tree for WORD_LIST, if one has been built
+OPENING_BOOK = None  # Best opener and second guesses for WORD_LIST (see opening_book.py)
+WORD_LENGTH = 5  # Letters per word; set with --length for 4-8 letter variants
+
+STRATEGIES = ("frequency", "entropy")
+HISTORY_COMMANDS = ("undo", "redo", "edit")  # Accepted at the guess prompt instead of a guess
+# Guess pruning only pays for itself against a small candidate set; above this the pool is scored as is
+PRUNE_MAX_ANSWERS = 32
+LAST_PRUNING = None  # Pruning stats of the latest entropy suggestion, or None if it wasn't pruned
+LAST_LOOKAHEAD = None  # Search stats of the latest lookahead suggestion, or None if there was no search
+PRUNING_TOTALS = {"suggestions": 0, "guesses": 0, "no_split": 0, "duplicates": 0, "scored": 0}
 
 def load_past_words(filename="past_used_words.txt"):
     """Loads past used Wordle words that should be excluded."""
@@ -19,12 +38,19 @@ def load_past_words(filename="past_used_words.txt"):
         PAST_WORDS = set()
     return PAST_WORDS
 
-def load_words(filename="words.txt"):
+def read_word_file(filename="words.txt", length=None):
+    """Reads the words of the given length (default WORD_LENGTH) from a file, without excluding past words."""
+    length = length or WORD_LENGTH
+    with open(filename, 'r') as file:
+        return [word.strip().lower() for word in file if len(word.strip()) == length and word.strip().isalpha()]
+
+def load_words(filename="words.txt", length=None):
     """Loads words from a file."""
-    global WORD_LIST
+    global WORD_LIST, ALL_WORDS
+    length = length or WORD_LENGTH
     try:
-        with open(filename, 'r') as file:
-            all_words = [word.strip().lower() for word in file if len(word.strip()) == 5 and word.strip().isalpha()]
+        all_words = read_word_file(filename, length)
+        ALL_WORDS = all_words
             
         # Filter out past used words
         if PAST_WORDS:
@@ -44,49 +70,138 @@ def load_words(filename="words.txt"):
             "alert", "alter", "later", "table", "ratio", "stare", "arise", "irate",
             "learn", "noble", "media", "ocean", "ideal", "radio", "steam", "dream"
         ]
-        WORD_LIST = [word.lower() for word in sample_words if len(word) == 5 and word.isalpha() and word not in PAST_WORDS]
+        WORD_LIST = [word.lower() for word in sample_words if len(word) == length and word.isalpha() and word not in PAST_WORDS]
     return WORD_LIST
 
-def get_guess_and_feedback():
-    """Gets the user's guess and Wordle's feedback."""
-    print("\nAfter playing your guess in the Wordle game:")
-    
+def load_word_universe(words_file="words.txt", past_file="past_used_words.txt", compiled_file="words.bin", length=None):
+    """Loads the word lists, from the compiled binary file (see universe.py) when it is up to date."""
+    global WORD_LIST, ALL_WORDS, PAST_WORDS
+    length = length or WORD_LENGTH
+    compiled = None
+    if os.path.exists(compiled_file):
+        from universe import load_compiled_universe
+        compiled = load_compiled_universe(words_file, past_file, compiled_file)
+    if compiled is None or compiled.length != length:
+        # No compiled file, the text files changed since it was built, or it's for another length
+        load_past_words(past_file)
+        return load_words(words_file, length)
+
+    PAST_WORDS = compiled.past_words()
+    ALL_WORDS = compiled.all_words()
+    WORD_LIST = compiled.answer_words()
+    print(f"Loaded {len(WORD_LIST)} words from {compiled_file} (excluding {len(PAST_WORDS)} past used words)")
+    return WORD_LIST
+
+def load_guess_words(filename, length=None):
+    """Adds a list of allowed guesses (e.g. words that are valid guesses but never answers) to the guess pool."""
+    global GUESS_WORDS
+    GUESS_WORDS = read_guess_words(filename, ALL_WORDS, length)
+    return guess_pool()
+
+def read_guess_words(filename, all_words, length=None):
+    """The guess pool for a word list: all_words plus the allowed guesses in filename that aren't already in it."""
+    length = length or WORD_LENGTH
+    try:
+        extra = read_word_file(filename, length)
+    except FileNotFoundError:
+        print(f"Warning: {filename} not found. Guessing from the word list only.")
+        return all_words
+    known = set(all_words)
+    added = [word for word in dict.fromkeys(extra) if word not in known]
+    print(f"Loaded {len(added)} extra allowed guesses from {filename} ({len(all_words) + len(added)} guesses in total)")
+    return all_words + added
+
+def guess_pool():
+    """Every word that may be guessed: the allowed-guess list if one was loaded, else the whole word list."""
+    return GUESS_WORDS or ALL_WORDS
+
+def load_tree(answers, filename="decision_tree.bin"):
+    """Loads the precomputed decision tree (see decision_tree.py) if one was built for these words."""
+    global DECISION_TREE
+    DECISION_TREE = None
+    if os.path.exists(filename):
+        from decision_tree import load_decision_tree
+        DECISION_TREE = load_decision_tree(answers, filename)
+        if DECISION_TREE:
+            print(f"Loaded decision tree with {DECISION_TREE.node_count} positions from {filename}")
+    return DECISION_TREE
+
+def load_book(answers, filename=None, guesses=None, universe=None):
+    """Loads the opening book for these answers (guessing from the guess pool), updating or rebuilding it if the words changed.
+
+    filename defaults to the guess pool's own book file (see opening_book.book_file).
+    guesses and universe (every word, past answers included) default to the guess pool and ALL_WORDS.
+    """
+    global OPENING_BOOK
+    OPENING_BOOK = None
+    try:
+        from opening_book import load_opening_book
+        from patterns import MAX_TABLE_BYTES, table_bytes
+    except ImportError:
+        return None  # NumPy missing: no book, just the frequency strategy
+    guesses = guesses or guess_pool() or answers
+    universe = universe or ALL_WORDS or answers
+    if table_bytes(len(guesses), len(universe), len(answers[0])) > MAX_TABLE_BYTES:
+        universe = None  # Too big to update from; a stale book is rebuilt
+    if table_bytes(len(guesses), len(answers), len(answers[0])) <= MAX_TABLE_BYTES:
+        OPENING_BOOK = load_opening_book(guesses, answers, filename, universe=universe)
+    return OPENING_BOOK
+
+def read_guess(length=5, commands=()):
+    """Prompts until the user enters a guess of the right length, or one of the given commands."""
     while True:
-        guess = input("Enter your 5-letter guess: ").lower().strip()
+        guess = input(f"Enter your {length}-letter guess: ").lower().strip()
         if not guess:
             print("Please enter a guess.")
             continue
+
+        # A leading "/" marks a command; without it, a word of the guess length is taken as a guess
+        # (so "edit" can still be guessed in the 4-letter game)
+        command = guess.lstrip("/")
+        parts = command.split()
+        if parts and parts[0] in commands and (guess.startswith("/") or len(guess) != length or not guess.isalpha()):
+            return command
             
-        if len(guess) != 5:
-            print("Guess must be exactly 5 letters.")
+        if len(guess) != length:
+            print(f"Guess must be exactly {length} letters.")
             continue
             
         if not guess.isalpha():
             print("Guess must contain only letters.")
             continue
             
-        break
+        return guess
 
-    print("\nEnter the color feedback from Wordle:")
-    print("G = Green (correct letter, correct position)")
-    print("Y = Yellow (correct letter, wrong position)")
-    print("X = Gray/Black (letter not in the word)")
-    
+def read_feedback(length=5, prompt="Feedback (GGYXX format): "):
+    """Prompts until the user enters a valid G/Y/X feedback string."""
     while True:
-        feedback_str = input("Feedback (GGYXX format): ").upper().strip()
+        feedback_str = input(prompt).upper().strip()
         if not feedback_str:
             print("Please enter feedback.")
             continue
             
-        if len(feedback_str) != 5:
-            print("Feedback must be exactly 5 characters.")
+        if len(feedback_str) != length:
+            print(f"Feedback must be exactly {length} characters.")
             continue
             
         if not all(c in "GYX" for c in feedback_str):
             print("Invalid feedback. Use only G, Y, or X for each position.")
             continue
             
-        break
+        return feedback_str
+
+def get_guess_and_feedback(length=5, commands=()):
+    """Gets the user's guess and Wordle's feedback; a command is returned as (command, None)."""
+    print("\nAfter playing your guess in the Wordle game:")
+    guess = read_guess(length, commands)
+    if guess.split()[0] in commands:
+        return guess, None
+
+    print("\nEnter the color feedback from Wordle:")
+    print("G = Green (correct letter, correct position)")
+    print("Y = Yellow (correct letter, wrong position)")
+    print("X = Gray/Black (letter not in the word)")
+    feedback_str = read_feedback(length)
         
     # Display what the user entered
     feedback_display = []
@@ -102,142 +217,153 @@ def get_guess_and_feedback():
     
     return guess, feedback_str
 
-def filter_words(possible_words, guess, feedback, known_letters, present_letters, absent_letters, yellow_misplaced):
-    """Filters the word list based on the feedback."""
-    new_possible_words = []
+def run_history_command(game, command, length=5):
+    """Carries out an 'undo', 'redo' or 'edit N' command typed at the guess prompt."""
+    words = command.split()
+    if words[0] == "undo":
+        if game.undo() is None:
+            print("Nothing to undo.")
+        else:
+            print(f"Undone. Back to guess {game.turns + 1}.")
+    elif words[0] == "redo":
+        snapshot = game.redo()
+        if snapshot is None:
+            print("Nothing to redo.")
+        else:
+            print(f"Redone: {snapshot.guess.upper()} {snapshot.feedback}")
+    elif len(words) != 2 or not words[1].isdigit() or not 1 <= int(words[1]) <= game.turns:
+        print(f"Usage: edit N, where N is a turn from 1 to {game.turns}." if game.turns else "No turns to edit yet.")
+    else:
+        turn = int(words[1])
+        old_guess, old_feedback = game.history()[turn - 1]
+        print(f"Turn {turn} was {old_guess.upper()} {old_feedback}. Enter it again:")
+        guess = read_guess(length)
+        feedback = read_feedback(length)
+        game.edit(turn, guess, feedback)
+        print(f"Turn {turn} is now {guess.upper()} {feedback}; {game.turns - turn} later turn(s) replayed.")
 
-    # Update knowledge based on feedback
-    for i, (letter, fb) in enumerate(zip(guess, feedback)):
-        if fb == 'G':
-            known_letters[i] = letter
-            if letter in present_letters: # If it was yellow before, now it's green
-                present_letters.discard(letter)
-            # A letter can be green and also previously yellow in another spot,
-            # so don't add to absent_letters if it's green.
-        elif fb == 'Y':
-            present_letters.add(letter)
-            yellow_misplaced[i].add(letter)
-        elif fb == 'X':
-            # Only add to absent_letters if not known or present from this guess or previous
-            # This handles words with duplicate letters where one is G/Y and other is X
-            is_letter_green_or_yellow_in_guess = False
-            for j, (g_letter, g_fb) in enumerate(zip(guess, feedback)):
-                if g_letter == letter and (g_fb == 'G' or g_fb == 'Y'):
-                    is_letter_green_or_yellow_in_guess = True
-                    break
-            
-            if not is_letter_green_or_yellow_in_guess and letter not in known_letters:
-                 absent_letters.add(letter)
+def filter_words(possible_words, constraints):
+    """Filters the word list down to the words consistent with the constraints.
 
+    Fold each guess into the constraints first with constraints.apply(guess, feedback).
+    Letter counts are tracked as a min/max per letter, so repeated letters are handled exactly:
+    e.g. 'APPLE' with feedback 'YXXXG' means the answer has exactly one P, not at position 0 or 1-3.
+    """
+    return constraints.filter(possible_words)
 
-    for word in possible_words:
-        valid = True
-        temp_present_letters = set(present_letters) # Copy for local check
+def record_pruning(stats):
+    """Keeps the latest pruning stats and adds them to the running totals."""
+    global LAST_PRUNING
+    LAST_PRUNING = stats
+    PRUNING_TOTALS["suggestions"] += 1
+    for key in ("guesses", "no_split", "duplicates", "scored"):
+        PRUNING_TOTALS[key] += stats[key]
 
-        # 1. Green Check: Check for letters in known positions
-        for i, known_letter in enumerate(known_letters):
-            if known_letter and word[i] != known_letter:
-                valid = False
-                break
-        if not valid:
-            continue
+def pruning_report(stats):
+    """One line describing how much of the guess pool was scored."""
+    return (f"Scored {stats['scored']} of {stats['guesses']} guesses "
+            f"({stats['no_split']} split nothing, {stats['duplicates']} duplicated another guess's partition)")
 
-        # 2. Yellow Check (misplaced letters)
-        for i, yellow_set_at_pos in enumerate(yellow_misplaced):
-            if word[i] in yellow_set_at_pos: # Letter is in a known yellow position
-                valid = False
-                break
-        if not valid:
-            continue
-        
-        # Count letters in the current word to handle duplicates correctly for yellow/gray
-        word_letter_counts = {}
-        for char_in_word in word:
-            word_letter_counts[char_in_word] = word_letter_counts.get(char_in_word, 0) + 1
-        
-        # Combined Yellow & Gray check (more robust for duplicates)
-        for i, char_in_word in enumerate(word):
-            # Gray check part 1: if a letter is truly absent
-            if char_in_word in absent_letters and known_letters[i] != char_in_word and char_in_word not in present_letters:
-                valid = False
-                break
-            
-            # Track if present letters are actually found
-            if char_in_word in temp_present_letters:
-                temp_present_letters.remove(char_in_word) # Mark as found
-        
-        if not valid:
-            continue
+def guess_table(possible_words, guesses=None, universe=None):
+    """The feedback table from the guess pool to the possible words, or None if it is too big to build.
 
-        # Yellow check part 2: All present_letters must be in the word
-        if len(temp_present_letters) > 0: # Some yellow letters were not found
-            valid = False
-            continue
+    guesses and universe are the table's rows and columns; they default to the guess pool and ALL_WORDS.
+    """
+    from patterns import MAX_TABLE_BYTES, get_pattern_table, table_bytes
 
-        # Edge case for gray letters with duplicates in guess vs solution
-        # e.g., guess 'SPOON', feedback 'XXXYX', answer 'BLOCK' (O is absent)
-        # e.g., guess 'APPLE', feedback 'YXXXG', answer 'PLATE' (one P is present, not at pos 0, E is at pos 4)
-        # The absent_letters logic already handles cases like "SPEED" (E is gray) vs "TREES" (E is green).
-        # What needs more care: if 'P' in 'APPLE' is Gray, but the word is 'PAPER' (one P)
-        # current absent_letters logic: adds to absent if not G/Y *in current guess*.
-        # This is mostly handled by ensuring that a letter isn't added to absent_letters if it's also G/Y.
-        # The more complex part is when a guessed letter (e.g. 'P' in "APPLE") has one instance 'Y' and another 'X'.
-        # This implies exactly one 'P'.
-        
-        # Count occurrences of letters from the guess in the current `word`
-        # to compare against non-gray occurrences in the `guess`.
-        guess_letter_counts = {}
-        non_gray_guess_letters = []
-        for gl, gf in zip(guess, feedback):
-            if gf != 'X':
-                non_gray_guess_letters.append(gl)
-                guess_letter_counts[gl] = guess_letter_counts.get(gl, 0) + 1
-
-        for letter_to_check_count in guess_letter_counts:
-            count_in_word = word.count(letter_to_check_count)
-            # If a letter was guessed (e.g., two 'P's in 'APPLE') and one 'P' is gray,
-            # it means the count of that letter in the solution is *exactly* the number of non-gray P's.
-            # Check if any letter from the guess was marked gray
-            gray_instances_of_letter_in_guess = 0
-            non_gray_instances_of_letter_in_guess = 0
-            for gl, gf in zip(guess, feedback):
-                if gl == letter_to_check_count:
-                    if gf == 'X':
-                        gray_instances_of_letter_in_guess +=1
-                    else:
-                        non_gray_instances_of_letter_in_guess +=1
-            
-            if gray_instances_of_letter_in_guess > 0: # This letter appeared as gray in the guess
-                if count_in_word != non_gray_instances_of_letter_in_guess:
-                    valid = False
-                    break
-            else: # This letter only appeared as G/Y in the guess
-                if count_in_word < non_gray_instances_of_letter_in_guess:
-                    valid = False # Word must contain at least as many as non-gray guess instances
-                    break
-        if not valid:
-            continue
+    universe = universe or ALL_WORDS or possible_words
+    guesses = guesses or guess_pool() or universe
+    if table_bytes(len(guesses), len(universe), len(possible_words[0])) > MAX_TABLE_BYTES:
+        return None
+    # Without extra guesses this is the square table over the word list; with them, guesses x words
+    table = get_pattern_table(guesses) if guesses is universe else get_pattern_table(guesses, universe)
+    if not table.covers(possible_words):
+        table = get_pattern_table(possible_words)
+    return table
 
+def suggest_entropy_guess(possible_words, guesses=None, universe=None):
+    """Suggests the guess whose feedback splits the possible words into the most even buckets.
 
-        if valid:
-            new_possible_words.append(word)
-            
-    return new_possible_words
+    Guesses come from the guess pool, so the best probe may be a word that can't be the answer.
+    With few candidates left, guesses that split nothing or split them the same way as another
+    guess are pruned before scoring (see patterns.prune_guesses).
+    guesses and universe are passed to guess_table.
+    """
+    # Imported here so the default frequency strategy works without NumPy installed
+    import numpy as np
+    from patterns import entropy_scores, prune_guesses, streaming_entropy_scores
 
-def suggest_next_guess(possible_words, tried_letters=None):
-    """Suggests a next guess from the list of possible words."""
-    if not possible_words:
-        return None
-    
-    if len(possible_words) == 1:
-        return possible_words[0]  # Only one word left, must be the answer
-        
-    if len(possible_words) <= 2:
-        return random.choice(possible_words)  # With just 2 options, either is a good guess
-    
-    # Use letter frequency to determine best guess
+    table = guess_table(possible_words, guesses, universe)
+    if table is None:
+        # Too big to build (e.g. 100k words): score blocks of guesses against just the
+        # remaining words, with nothing stored
+        guesses = guesses or guess_pool() or possible_words
+        scores = streaming_entropy_scores(guesses, possible_words)
+        remaining = set(possible_words)
+        is_candidate = np.fromiter((word in remaining for word in guesses), dtype=bool, count=len(guesses))
+        return guesses[np.lexsort((~is_candidate, -scores))[0]]
+
+    answer_cols = table.answer_indices(possible_words)
+    candidate_rows = table.guess_indices(possible_words)
+    rows = None
+    if len(possible_words) <= PRUNE_MAX_ANSWERS:
+        rows, stats = prune_guesses(table.matrix, answer_cols, preferred_rows=candidate_rows, patterns=table.num_patterns)
+        record_pruning(stats)
+    scores = entropy_scores(table.matrix, answer_cols, rows, patterns=table.num_patterns)
+    rows = np.arange(len(table.guesses)) if rows is None else rows
+
+    # Break ties in favour of guesses that could still be the answer
+    is_candidate = np.zeros(len(table.guesses), dtype=bool)
+    is_candidate[candidate_rows] = True
+    best = rows[np.lexsort((~is_candidate[rows], -scores))[0]]
+    return table.guesses[best]
+
+def lookahead_report(stats):
+    """One line describing how far the lookahead search got."""
+    if stats["depth"] == 1:
+        return f"Lookahead: one step ahead only; out of time after {stats['ms']:.0f} ms"
+    done = "complete" if stats["complete"] else f"stopped at {stats['ms']:.0f} ms"
+    return (f"Lookahead: two steps ahead, {stats['expected_remaining']} answers expected to be left "
+            f"({stats['cut']} of {stats['guesses']} guesses cut off early; {done})")
+
+def lookahead_search(possible_words, time_budget_ms, guesses=None, universe=None):
+    """Returns (guess, complete) for the lookahead search; complete is False when the time budget cut it short.
+
+    A complete search finds the same guess whatever the budget; one cut short depends on the load.
+    guesses and universe are passed to guess_table.
+    """
+    global LAST_LOOKAHEAD
+    from lookahead import lookahead_guess
+
+    table = guess_table(possible_words, guesses, universe)
+    if table is None:
+        return suggest_entropy_guess(possible_words, guesses, universe), True  # No table to search with
+    guess, stats = lookahead_guess(table, possible_words, time_budget_ms, PRUNE_MAX_ANSWERS)
+    LAST_LOOKAHEAD = stats
+    return guess, stats["complete"]
+
+def suggest_lookahead_guess(possible_words, time_budget_ms, guesses=None, universe=None):
+    """Suggests the best guess two steps ahead that can be found within the time budget (see lookahead.py)."""
+    return lookahead_search(possible_words, time_budget_ms, guesses, universe)[0]
+
+def frequency_scores(possible_words):
+    """Scores each possible word by how common its letters are, overall and at each position.
+
+    Returns {word: score}; higher is better. This is the frequency strategy's ranking, and the
+    GUI sorts its candidate list by it. With NumPy the words are scored as arrays (see
+    word_store.py), with the same results as the loop in python_frequency_scores.
+    """
+    try:
+        from word_store import WordStore
+        scores = WordStore.from_words(possible_words).frequency_scores()
+    except (ImportError, ValueError):  # No NumPy, or words that aren't all lowercase a-z of one length
+        return python_frequency_scores(possible_words)
+    return dict(zip(possible_words, scores.tolist()))
+
+def python_frequency_scores(possible_words):
+    """frequency_scores one word and letter at a time, without NumPy."""
     letter_freq = {}
-    position_freq = [{} for _ in range(5)]  # For each position, track the frequency of each letter
+    position_freq = [{} for _ in range(len(possible_words[0]))]  # For each position, track the frequency of each letter
     
     # Count letter frequencies in remaining possible words
     for word in possible_words:
@@ -276,7 +402,78 @@ def suggest_next_guess(possible_words, tried_letters=None):
         score += unique_letters_count * 0.2  # Weight for uniqueness
         
         word_scores[word] = score
+    return word_scores
+
+def opening_guess(history):
+    """The decision tree's or opening book's guess after these (guess, feedback) turns, or None once out of both."""
+    if DECISION_TREE is not None:
+        tree_guess = DECISION_TREE.lookup(history)
+        if tree_guess:
+            return tree_guess
+    if OPENING_BOOK is not None and len(history) < 2:
+        return OPENING_BOOK.lookup(history)
+    return None
+
+def lookahead_key(strategy, time_budget_ms=None):
+    """The strategy part of a suggestion cache key; only complete lookahead searches are cached, and they don't depend on the budget."""
+    return strategy if time_budget_ms is None else "lookahead"
+
+def suggest_next_guess(possible_words, tried_letters=None, strategy="frequency", history=None, cache=None,
+                       time_budget_ms=None, guesses=None, universe=None):
+    """Suggests a next guess from the list of possible words.
+
+    strategy is "frequency" (letter-frequency heuristic, the default) or "entropy"
+    (maximize the expected information of the feedback, using the feedback table).
+    With time_budget_ms, either strategy is replaced by the lookahead search: the best guess
+    two steps ahead found within that many milliseconds (see lookahead.py).
+    If a decision tree is loaded and history (the (guess, feedback) turns so far) is given,
+    the suggestion is a single tree walk instead; otherwise the first two turns come from the
+    opening book, if one is loaded, whatever the strategy.
+    cache is an optional SuggestionCache; suggestions are then reused for any path that
+    reaches the same set of possible words.
+    guesses and universe (default: the guess pool and ALL_WORDS) are the words the entropy and
+    lookahead strategies guess from and score against; callers that reload the word lists while
+    other threads are suggesting pass their own rather than rely on the globals.
+    """
+    global LAST_PRUNING, LAST_LOOKAHEAD
+    LAST_PRUNING = None
+    LAST_LOOKAHEAD = None
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {strategy}")
+
+    if history is not None:
+        known_guess = opening_guess(history)
+        if known_guess:
+            return known_guess
+
+    if cache is not None and len(possible_words) > 2:
+        from suggestion_cache import words_fingerprint
+        # Entropy guesses come from the whole word list, so that is part of the key too
+        pool = words_fingerprint(guesses or guess_pool()) if strategy == "entropy" or time_budget_ms is not None else ""
+        key = cache.make_key(words_fingerprint(possible_words), lookahead_key(strategy, time_budget_ms), pool)
+        if time_budget_ms is not None:
+            return cache.get_or_search(key, lambda: lookahead_search(possible_words, time_budget_ms, guesses, universe))
+        return cache.get_or_compute(key, lambda: suggest_next_guess(possible_words, tried_letters, strategy,
+                                                                    guesses=guesses, universe=universe))
+
+    if not possible_words:
+        return None
+    
+    if len(possible_words) == 1:
+        return possible_words[0]  # Only one word left, must be the answer
+        
+    if len(possible_words) <= 2:
+        return random.choice(possible_words)  # With just 2 options, either is a good guess
+
+    if time_budget_ms is not None:
+        return suggest_lookahead_guess(possible_words, time_budget_ms, guesses, universe)
+
+    if strategy == "entropy":
+        return suggest_entropy_guess(possible_words, guesses, universe)
     
+    # Use letter frequency to determine best guess
+    word_scores = frequency_scores(possible_words)
+
     # Sort by score (highest first)
     sorted_words = sorted(word_scores.items(), key=lambda x: x[1], reverse=True)
     
@@ -294,28 +491,31 @@ def suggest_next_guess(possible_words, tried_letters=None):
     
     return best_word
 
-def main():
+def main(strategy="frequency", length=5, words_file="words.txt", boards=1, guesses_file=None, time_budget_ms=None):
     """Main function to run the Wordle solver."""
-    # First load past used words to exclude them
-    load_past_words()
-    
-    # Then load the main word list
-    all_words = load_words()
+    global WORD_LENGTH
+    WORD_LENGTH = length
+    # Load the word list, excluding past used words
+    all_words = load_word_universe(words_file)
     if not all_words:
         print("Word list is empty. Please provide a words.txt file or check load_words function.")
         return
+    if guesses_file:
+        load_guess_words(guesses_file)
+    if boards > 1:
+        return main_multi_board(all_words, boards, length)
+    if length == 5:
+        # Decision trees are only built for the standard 5-letter game
+        load_tree(all_words)
+    if DECISION_TREE is None:
+        load_book(all_words)
 
-    possible_words = list(all_words)
-    
-    # Data to track across guesses
-    known_letters = [None] * 5  # Letters in correct position (Green)
-    present_letters = set()     # Letters in word, wrong position (Yellow)
-    absent_letters = set()      # Letters not in word (Gray)
-    # For each position, a set of letters that were yellow in that specific position
-    yellow_misplaced = [set() for _ in range(5)]
-    
-    # Track all tried letters
-    tried_letters = set()
+    # Candidates are kept as a bitset over the word list and only turned into words for display.
+    # Each turn's candidates and constraints are kept as a snapshot, so turns can be undone or edited.
+    word_index = WordIndex(all_words, length)
+    game = GameHistory(word_index)
+    suggestions = {}  # Snapshot -> suggested guess
+    all_green = "G" * length
 
     print("\n===== Welcome to Wordle Solver! =====")
     print(f"Loaded {len(all_words)} possible words.")
@@ -328,76 +528,169 @@ def main():
     print("   Y - Yellow (correct letter, wrong position)")
     print("   X - Gray (letter not in the word)")
     print("\nExample: If you guessed 'CRANE' and got Green, Yellow, Gray, Gray, Yellow")
-    print("You would enter: GYXXY\n")
+    print("You would enter: GYXXY")
+    print("\nMade a mistake? Type 'undo' or 'redo' instead of a guess, or 'edit N' to re-enter turn N.\n")
 
-    for guess_num in range(1, 7): # Max 6 guesses
+    while True:
+        guess_num = game.turns + 1
+        constraints = game.current.constraints
+        possible_words = word_index.words_of(game.current.candidates)
         print(f"\n--- Guess {guess_num}/6 ---")
-        
+
         if not possible_words:
             print("No possible words left. Something went wrong or the word is not in the list.")
-            break
-
-        print(f"Number of possible words: {len(possible_words)}")
-        if len(possible_words) < 20:
-            print(f"Possible words: {', '.join(possible_words)}")
-        
-        # Show current knowledge
-        if guess_num > 1:
-            known_str = ['_'] * 5
-            for i, letter in enumerate(known_letters):
-                if letter:
-                    known_str[i] = letter.upper()
-            
-            print(f"Known positions (Green): {' '.join(known_str)}")
-            if present_letters:
-                print(f"Present letters (Yellow): {', '.join(sorted(present_letters)).upper()}")
-            if absent_letters:
-                print(f"Absent letters (Gray): {', '.join(sorted(absent_letters)).upper()}")
-
-        suggested_guess = suggest_next_guess(possible_words, tried_letters)
-        if guess_num == 1: # For the first guess, suggest a common starter
-            # Common high-information starting words. Could also use a more sophisticated strategy.
-            starters = ["crane", "slate", "soare", "adieu", "trace"]
-            # Ensure starter is in the word list if possible
-            valid_starters = [s for s in starters if s in possible_words]
-            if valid_starters:
-                suggested_guess = random.choice(valid_starters)
-            elif possible_words: # Fallback if no preferred starters are in the (potentially small) list
-                 suggested_guess = random.choice(possible_words)
-            else: # No words left, should not happen here
-                print("No words left to suggest.")
+            if not game.can_undo():
                 break
+            print("Type 'undo' or 'edit N' to correct the feedback.")
+        else:
+            print(f"Number of possible words: {len(possible_words)}")
+            if len(possible_words) < 20:
+                print(f"Possible words: {', '.join(possible_words)}")
 
+            # Show current knowledge
+            if guess_num > 1:
+                known_str = ['_'] * length
+                for i, letter in enumerate(constraints.known_letters()):
+                    if letter:
+                        known_str[i] = letter.upper()
 
-        if suggested_guess:
-            print(f"Suggested guess: {suggested_guess.upper()}")
-        else:
-            # This case should ideally be caught by the check at the start of the loop
-            print("No words left to suggest. The word might not be in your dictionary or there was contradictory feedback.")
-            break
+                print(f"Known positions (Green): {' '.join(known_str)}")
+                present_letters = constraints.present_letters()
+                absent_letters = constraints.absent_letters()
+                if present_letters:
+                    print(f"Present letters (Yellow): {', '.join(sorted(present_letters)).upper()}")
+                if absent_letters:
+                    print(f"Absent letters (Gray): {', '.join(sorted(absent_letters)).upper()}")
 
-        guess, feedback = get_guess_and_feedback()
-        
-        # Add to tried letters
-        for letter in guess:
-            tried_letters.add(letter)
+            # Remembered per snapshot, so undo and redo show the same suggestion as before
+            if game.current not in suggestions:
+                suggestions[game.current] = suggest_next_guess(possible_words, game.tried_letters(), strategy,
+                                                               game.history(), time_budget_ms=time_budget_ms)
+                if suggestions[game.current] and LAST_PRUNING is not None and strategy == "entropy":
+                    print(pruning_report(LAST_PRUNING))
+                if LAST_LOOKAHEAD is not None:
+                    print(lookahead_report(LAST_LOOKAHEAD))
+            if suggestions[game.current]:
+                print(f"Suggested guess: {suggestions[game.current].upper()}")
 
-        if feedback == "GGGGG":
+        guess, feedback = get_guess_and_feedback(length, HISTORY_COMMANDS)
+        if feedback is None:
+            run_history_command(game, guess, length)
+            continue
+
+        if feedback == all_green:
             print(f"\nCongratulations! You found the word: {guess.upper()}")
             break
 
-        possible_words = filter_words(possible_words, guess, feedback, known_letters, present_letters, absent_letters, yellow_misplaced)
+        game.push(guess, feedback)
 
-        if guess_num == 6 and feedback != "GGGGG":
+        if game.turns == 6:
             print("\nGame over! Word not found within 6 guesses.")
+            possible_words = word_index.words_of(game.current.candidates)
             if possible_words:
                 print(f"Remaining possible words: {', '.join(possible_words)}")
             else:
                 print("No possible words remain according to the feedback.")
+            break
     
     # Game ended
     print("\nThanks for using Wordle Solver!")
     print("Run the program again for a new game.")
 
+def main_multi_board(all_words, boards, length=5):
+    """Plays Dordle/Quordle/Octordle style: one guess per turn, feedback from every unsolved board."""
+    from multi_board import MultiBoardSolver, max_guesses
+
+    solver = MultiBoardSolver(all_words, boards, guess_pool() or all_words)
+    state = solver.new_game()
+    turns = max_guesses(boards)
+
+    print(f"\n===== Wordle Solver: {boards} boards =====")
+    print(f"Loaded {len(all_words)} possible words. You have {turns} guesses to solve all {boards} boards.")
+    print("After each guess, enter the G/Y/X feedback for every board that isn't solved yet.")
+
+    for guess_num in range(1, turns + 1):
+        print(f"\n--- Guess {guess_num}/{turns} ---")
+        for b in range(boards):
+            if state.solved[b]:
+                print(f"Board {b + 1}: solved ({state.solved[b].upper()})")
+                continue
+            possible_words = solver.candidates(state, b)
+            shown = f": {', '.join(possible_words)}" if 0 < len(possible_words) <= 10 else ""
+            print(f"Board {b + 1}: {len(possible_words)} possible words{shown}")
+            if not possible_words:
+                print("  No possible words left on this board. Please check the feedback you entered.")
+
+        suggested_guess = solver.suggest(state)
+        if suggested_guess is None:
+            print("No words left to suggest. The words might not be in your dictionary or there was contradictory feedback.")
+            break
+        print(f"Suggested guess: {suggested_guess.upper()}")
+
+        print("\nAfter playing your guess in the game:")
+        guess = read_guess(length)
+        while guess not in solver.table.guess_index:
+            print(f"'{guess.upper()}' isn't in the word list, so its feedback can't be used. Please play a listed word.")
+            guess = read_guess(length)
+        feedbacks = [None] * boards
+        for b in state.unsolved():
+            feedbacks[b] = read_feedback(length, f"Board {b + 1} feedback (GGYXX format): ")
+        state = solver.apply(state, guess, feedbacks)
+
+        if state.is_finished():
+            print(f"\nCongratulations! You solved all {boards} boards in {guess_num} guesses.")
+            break
+    else:
+        print(f"\nGame over! {len(state.unsolved())} board(s) not solved within {turns} guesses.")
+        for b in state.unsolved():
+            print(f"Board {b + 1} remaining words: {', '.join(solver.candidates(state, b)) or 'none'}")
+
+    print("\nThanks for using Wordle Solver!")
+    print("Run the program again for a new game.")
+
+# Opt-in tracing (see instrumentation.py); these are left untouched when tracing is off
+TRACED_FUNCTIONS = ["load_word_universe", "load_words", "load_past_words", "filter_words", "suggest_next_guess"]
+instrument_module(globals(), TRACED_FUNCTIONS)
+instrument_class(WordIndex, ["filter"])
+
+def enable_tracing(filename):
+    """Turns on tracing of the solver entry points, in this process and any it starts."""
+    os.environ[TRACE_ENV] = filename
+    instrumentation.enable(filename)
+    instrument_module(globals(), TRACED_FUNCTIONS)
+    instrument_class(WordIndex, ["filter"])
+
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Interactive Wordle solver (or, with --stream, a JSON-lines filter)")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="frequency",
+                        help="how to pick suggestions (default: frequency)")
+    parser.add_argument("--length", type=int, default=5, help="letters per word, e.g. 4-8 (default: 5)")
+    parser.add_argument("--words", default="words.txt", help="word list (default: words.txt)")
+    parser.add_argument("--boards", type=int, default=1, help="boards played at once: 2 (Dordle), 4 (Quordle) or 8 (Octordle)")
+    parser.add_argument("--guesses", metavar="FILE", help="extra allowed guesses that are never answers, one per line")
+    parser.add_argument("--trace", metavar="FILE", help="write a JSON-lines timing trace of the solver functions")
+    parser.add_argument("--profile", metavar="FILE", help="run the game under cProfile and dump the stats")
+    parser.add_argument("--time-budget", type=int, metavar="MS",
+                        help="search two guesses ahead for up to MS milliseconds per suggestion (see lookahead.py)")
+    parser.add_argument("--stream", action="store_true",
+                        help="read guess histories as JSON lines on stdin and write suggestions as JSON lines (see solver_stream.py)")
+    parser.add_argument("--candidates", type=int, default=0, metavar="N", help="with --stream, include up to N remaining words")
+    parser.add_argument("--workers", type=int, default=1, help="with --stream, worker processes (output stays in input order)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="with --stream, lines per batch and per flush (default: 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="with --stream, seed for the solver's random tie-breaks")
+    args = parser.parse_args()
+    if args.trace:
+        enable_tracing(args.trace)
+    if args.stream:
+        import sys
+        from solver_stream import main as stream_main
+
+        sys.exit(stream_main(args.strategy, args.length, args.words, args.guesses, args.workers, args.candidates,
+                             args.seed, args.batch_size))
+    if args.profile:
+        instrumentation.profile_call(args.profile, main, args.strategy, args.length, args.words, args.boards, args.guesses,
+                                     args.time_budget)
+    else:
+        main(args.strategy, args.length, args.words, args.boards, args.guesses, args.time_budget) 
\ No newline at end of file
@@ -1,32 +1,111 @@
 import tkinter as tk
 from tkinter import messagebox, scrolledtext, ttk
-import random
-from wordle_solver import load_past_words, load_words, filter_words, suggest_next_guess
+import wordle_solver
+from game_history import GameHistory
+from instrumentation import instrument_class, instrument_module
+from solver_worker import SolverWorker
+from word_index import WordIndex
+from word_list_view import VirtualWordList
+from word_universe import file_stamp
+from wordle_solver import frequency_scores, load_book, load_tree, load_word_universe, suggest_next_guess
+
+POLL_MS = 30  # How often the Tk loop checks for finished background jobs
+
+SAMPLE_WORDS = [
+    "crane", "slate", "audio", "adieu", "trace", "roate", "raise", "soare", 
+    "alert", "alter", "later", "table", "ratio", "stare", "arise", "irate",
+    "learn", "noble", "media", "ocean", "ideal", "radio", "steam", "dream"
+]
+
+def load_word_data(exclude_past_words, length=5, words_file="words.txt"):
+    """Read the word files and build the index (runs on the worker thread, so no Tk calls)"""
+    wordle_solver.WORD_LENGTH = length
+    load_word_universe(words_file, length=length)
+    past_words = wordle_solver.PAST_WORDS
+    all_words_with_past = wordle_solver.ALL_WORDS
+    used_sample = not all_words_with_past
+    if used_sample:
+        # Fallback to a small sample list
+        all_words_with_past = [word for word in SAMPLE_WORDS if len(word) == length]
+    word_index = WordIndex(all_words_with_past, length)
+    if exclude_past_words and past_words:
+        answers = [word for word in all_words_with_past if word not in past_words]
+    else:
+        answers = all_words_with_past
+    if length != 5:
+        # Decision trees are only built for the standard 5-letter game
+        wordle_solver.DECISION_TREE = None
+    else:
+        load_tree(answers)
+    wordle_solver.OPENING_BOOK = None
+    if wordle_solver.DECISION_TREE is None and not used_sample:
+        load_book(answers)
+    return {
+        "past_words": past_words,
+        "all_words_with_past": all_words_with_past,
+        "word_index": word_index,
+        "used_sample": used_sample,
+        "stamps": word_file_stamps(words_file),
+    }
+
+def word_file_stamps(words_file="words.txt"):
+    """Sizes and mtimes of the word files, to notice when they change (e.g. a new past answer)"""
+    return file_stamp(words_file), file_stamp("past_used_words.txt")
+
+def pick_suggestion(possible_words, tried_letters, history, time_budget_ms=None):
+    """Choose the suggested word for the current state (runs on the worker thread)"""
+    # The first two guesses come from the decision tree or opening book when history is given
+    return suggest_next_guess(possible_words, tried_letters, history=history, time_budget_ms=time_budget_ms)
+
+def refresh_state(word_index, snapshot, tried_letters, history, time_budget_ms=None):
+    """List a turn's candidates and pick a suggestion (runs on the worker thread)"""
+    # The snapshot's candidates were filtered when the turn was played (see game_history.py)
+    possible_words = word_index.words_of(snapshot.candidates)
+    suggestion = pick_suggestion(possible_words, tried_letters, history, time_budget_ms) if possible_words else None
+    # Scores for sorting the candidate list, best suggestion first
+    scores = frequency_scores(possible_words) if possible_words else {}
+    return {"snapshot": snapshot, "possible_words": possible_words, "suggestion": suggestion, "scores": scores,
+            "lookahead": wordle_solver.LAST_LOOKAHEAD if possible_words else None}
+
+def lookahead_status(stats):
+    """How far the lookahead search got, for the status line"""
+    if stats["depth"] == 1:
+        return "one step ahead, out of time"
+    return "two steps ahead" + (", search complete" if stats["complete"] else ", best found in time")
 
 class WordleSolverGUI:
-    def __init__(self, root):
+    def __init__(self, root, length=5, words_file="words.txt", time_budget_ms=None):
         self.root = root
+        self.length = length  # Letters per word
+        self.words_file = words_file
+        self.time_budget_ms = time_budget_ms  # Lookahead search time per suggestion, or None for the one-step heuristic
         self.root.title("Wordle Solver GUI")
         self.root.geometry("800x600")
         self.root.resizable(True, True)
         self.root.configure(bg="#f0f0f0")
         
-        # Set up the solver variables
-        self.past_words = load_past_words()
+        # Set up the solver variables (the word lists are loaded in the background, see on_words_loaded)
+        self.past_words = set()
         self.exclude_past_words = tk.BooleanVar(value=True)  # Default: exclude past words
-        self.all_words_with_past = None  # Will hold all words including past words
-        self.all_words = None  # Will hold filtered words (or all if not excluding)
-        self.load_word_lists()  # Initialize word lists
-        
-        self.possible_words = list(self.all_words)
-        self.known_letters = [None] * 5
-        self.present_letters = set()
-        self.absent_letters = set()
-        self.yellow_misplaced = [set() for _ in range(5)]
-        self.tried_letters = set()
-        self.guess_number = 1
+        self.all_words_with_past = []  # Will hold all words including past words
+        self.all_words = []  # Will hold filtered words (or all if not excluding)
+        self.word_index = None  # Bitset index over all_words_with_past
+        self.word_stamps = None  # Word file sizes and mtimes when they were loaded
+        self.use_tree = False  # Whether the decision tree was built for the current word list
+        self.use_book = False  # Whether the opening book was built for the current word list
+        
+        # The turns so far as undoable snapshots of the candidate bitset and constraints (created once
+        # the word lists are loaded); possible_words is the current candidate set as a list for display
+        self.game = None
+        self.results = {}  # Snapshot -> its refresh result, so undo and redo show it without recomputing
+        self.possible_words = []
+        self.word_scores = {}  # Frequency score of each possible word, for sorting the list
+        self.editing_turn = None  # Earlier turn being corrected, or None when entering a new turn
         self.current_guess = ""
-        self.current_feedback = ["X"] * 5
+        self.current_feedback = ["X"] * length
+
+        # Loading, filtering and suggesting run on a worker thread so the window never freezes
+        self.worker = SolverWorker()
         
         # Color constants
         self.GREEN = "#6aaa64"  # Wordle green
@@ -58,14 +137,15 @@ class WordleSolverGUI:
             text="Exclude past used Wordle words",
             variable=self.exclude_past_words,
             bg=self.BG_COLOR,
-            command=self.toggle_exclude_past_words
+            command=self.toggle_exclude_past_words,
+            state=tk.DISABLED
         )
         self.exclude_past_checkbox.pack(side=tk.LEFT, padx=(0, 10))
         
         # Info about excluded words
         self.excluded_info = tk.Label(
             self.options_frame,
-            text=self.get_word_count_text(),
+            text="Loading word lists...",
             font=("Helvetica", 10),
             bg=self.BG_COLOR
         )
@@ -92,6 +172,17 @@ class WordleSolverGUI:
         )
         self.suggested_word_label.pack(side=tk.LEFT)
         
+        # Shows "Computing..." while a background job runs, then how long it took
+        self.compute_var = tk.StringVar(value="Loading...")
+        self.compute_label = tk.Label(
+            self.suggestion_frame,
+            textvariable=self.compute_var,
+            font=("Helvetica", 10),
+            fg="#787c7e",
+            bg=self.BG_COLOR
+        )
+        self.compute_label.pack(side=tk.LEFT, padx=(10, 0))
+        
         # Frame for guess input
         self.guess_frame = tk.Frame(self.main_frame, bg=self.BG_COLOR)
         self.guess_frame.pack(pady=10, fill=tk.X)
@@ -109,7 +200,7 @@ class WordleSolverGUI:
             self.guess_frame,
             textvariable=self.guess_var,
             font=("Helvetica", 16),
-            width=10
+            width=max(10, self.length + 3)
         )
         self.guess_entry.pack(side=tk.LEFT)
         
@@ -119,7 +210,7 @@ class WordleSolverGUI:
         
         # Create letter boxes
         self.letter_boxes = []
-        for i in range(5):
+        for i in range(self.length):
             box = tk.Label(
                 self.letters_frame,
                 text="",
@@ -141,7 +232,8 @@ class WordleSolverGUI:
             self.submit_frame,
             text="Enter Guess",
             font=("Helvetica", 12),
-            command=self.enter_guess
+            command=self.enter_guess,
+            state=tk.DISABLED
         )
         self.enter_guess_btn.pack(side=tk.LEFT, padx=5)
         
@@ -158,10 +250,31 @@ class WordleSolverGUI:
             self.submit_frame,
             text="New Game",
             font=("Helvetica", 12),
-            command=self.reset_game
+            command=self.reset_game,
+            state=tk.DISABLED
         )
         self.reset_btn.pack(side=tk.LEFT, padx=5)
         
+        self.undo_btn = tk.Button(
+            self.submit_frame,
+            text="Undo",
+            font=("Helvetica", 12),
+            command=self.undo_turn,
+            state=tk.DISABLED
+        )
+        self.undo_btn.pack(side=tk.LEFT, padx=5)
+        
+        self.redo_btn = tk.Button(
+            self.submit_frame,
+            text="Redo",
+            font=("Helvetica", 12),
+            command=self.redo_turn,
+            state=tk.DISABLED
+        )
+        self.redo_btn.pack(side=tk.LEFT, padx=5)
+        self.root.bind("<Control-z>", lambda event: self.undo_turn())
+        self.root.bind("<Control-y>", lambda event: self.redo_turn())
+        
         # Frame for game status
         self.status_frame = tk.Frame(self.main_frame, bg=self.BG_COLOR)
         self.status_frame.pack(pady=10, fill=tk.X)
@@ -174,6 +287,11 @@ class WordleSolverGUI:
         )
         self.status_label.pack(side=tk.LEFT)
         
+        # The turns played so far; clicking one loads it back into the letter boxes for correcting
+        self.turns_frame = tk.Frame(self.main_frame, bg=self.BG_COLOR)
+        self.turns_frame.pack(pady=5, fill=tk.X)
+        self.turn_buttons = []
+        
         # Create frame for known letters display
         self.known_frame = tk.Frame(self.main_frame, bg=self.BG_COLOR)
         self.known_frame.pack(pady=5, fill=tk.X)
@@ -186,7 +304,7 @@ class WordleSolverGUI:
         )
         self.known_label.pack(side=tk.LEFT, padx=(0, 5))
         
-        self.known_var = tk.StringVar(value="_ _ _ _ _")
+        self.known_var = tk.StringVar(value=" ".join("_" * self.length))
         self.known_value = tk.Label(
             self.known_frame,
             textvariable=self.known_var,
@@ -247,15 +365,26 @@ class WordleSolverGUI:
             font=("Helvetica", 10),
             bg=self.BG_COLOR
         )
-        self.possible_label.pack(anchor=tk.W)
-        
-        self.possible_words_text = scrolledtext.ScrolledText(
-            self.possible_frame,
-            width=40,
-            height=5,
-            font=("Helvetica", 10)
-        )
-        self.possible_words_text.pack(fill=tk.BOTH, expand=True)
+        self.possible_label.pack(side=tk.TOP, anchor=tk.W)
+        
+        # Sort order for the candidate list
+        self.sort_frame = tk.Frame(self.possible_frame, bg=self.BG_COLOR)
+        self.sort_frame.pack(side=tk.TOP, anchor=tk.W)
+        self.sort_order = tk.StringVar(value="score")
+        tk.Label(self.sort_frame, text="Sort by:", font=("Helvetica", 10), bg=self.BG_COLOR).pack(side=tk.LEFT)
+        for value, text in (("score", "Score"), ("alpha", "A-Z")):
+            tk.Radiobutton(
+                self.sort_frame,
+                text=text,
+                value=value,
+                variable=self.sort_order,
+                bg=self.BG_COLOR,
+                command=lambda: self.possible_list.set_order(self.sort_order.get())
+            ).pack(side=tk.LEFT)
+        
+        # Draws only the visible rows, so the full candidate set can always be shown
+        self.possible_list = VirtualWordList(self.possible_frame, font=("Courier", 10), height=5, bg=self.BG_COLOR)
+        self.possible_list.pack(fill=tk.BOTH, expand=True)
         
         # Instructions frame
         self.instructions_frame = tk.Frame(self.main_frame, bg=self.BG_COLOR)
@@ -269,33 +398,91 @@ class WordleSolverGUI:
         )
         self.instructions_label.pack()
         
-        # Initialize with a suggested word
-        self.update_suggestion()
+        # Load the word lists in the background and start polling for results
+        self.worker.submit("load", load_word_data, self.exclude_past_words.get(), self.length, self.words_file)
+        self.root.after(POLL_MS, self.poll_worker)
+    
+    def poll_worker(self):
+        """Apply finished background jobs; runs on the Tk main loop"""
+        for kind, result, error, elapsed_ms in self.worker.poll():
+            if error is not None:
+                self.compute_var.set("")
+                messagebox.showerror("Error", f"Background {kind} failed: {error}")
+            elif kind == "load":
+                self.on_words_loaded(result, elapsed_ms)
+            elif kind == "refresh":
+                self.on_refresh(result, elapsed_ms)
+        self.root.after(POLL_MS, self.poll_worker)
+    
+    def on_words_loaded(self, result, elapsed_ms):
+        """Set up the game once the word lists have been loaded"""
+        self.past_words = result["past_words"]
+        self.all_words_with_past = result["all_words_with_past"]
+        self.word_index = result["word_index"]
+        self.word_stamps = result["stamps"]
+        if result["used_sample"]:
+            messagebox.showwarning("Warning", f"{self.words_file} not found. Using small sample list.")
+        self.load_word_lists()
+        
+        self.game = GameHistory(self.word_index, self.word_index.from_words(self.all_words))
+        self.results = {}
+        self.possible_words = list(self.all_words)
+        self.excluded_info.config(text=self.get_word_count_text())
+        self.compute_var.set(f"Loaded in {elapsed_ms:.0f} ms")
+        
+        self.exclude_past_checkbox.config(state=tk.NORMAL)
+        self.enter_guess_btn.config(state=tk.NORMAL)
+        self.reset_btn.config(state=tk.NORMAL)
+        self.clear_guess_input()
+        self.show_turn()
+    
+    def on_refresh(self, result, elapsed_ms):
+        """Show the candidates and suggestion computed in the background"""
+        self.results[result["snapshot"]] = result
+        if result["snapshot"] is not self.game.current:
+            return  # Undo or redo moved to a turn whose result was already saved
+        status = f"Computed in {elapsed_ms:.1f} ms"
+        if result["lookahead"]:
+            status += f" ({lookahead_status(result['lookahead'])})"
+        self.compute_var.set(status)
+        self.show_result(result)
+    
+    def show_result(self, result):
+        """Show a turn's candidates and suggestion"""
+        self.possible_words = result["possible_words"]
+        self.word_scores = result["scores"]
+        suggestion = result["suggestion"]
+        
+        self.update_known_letters_display()
+        self.update_present_letters_display()
+        self.update_absent_letters_display()
         self.update_possible_words_display()
+        
+        if not self.possible_words:
+            self.suggested_word.set("No words left")
+            messagebox.showwarning("Warning", "No possible words left. Please check your feedback (use Undo, or click a turn to correct it).")
+            self.submit_btn.config(state=tk.DISABLED)
+            return
+        self.suggested_word.set(suggestion.upper() if suggestion else "No suggestion")
     
     def load_word_lists(self):
-        """Load word lists based on current settings"""
-        # If we haven't loaded all words yet, do it now
-        if self.all_words_with_past is None:
-            # Load all 5-letter words
-            try:
-                with open("words.txt", 'r') as file:
-                    self.all_words_with_past = [word.strip().lower() for word in file 
-                                         if len(word.strip()) == 5 and word.strip().isalpha()]
-            except FileNotFoundError:
-                messagebox.showwarning("Warning", "words.txt not found. Using small sample list.")
-                # Fallback to a small sample list
-                self.all_words_with_past = [
-                    "crane", "slate", "audio", "adieu", "trace", "roate", "raise", "soare", 
-                    "alert", "alter", "later", "table", "ratio", "stare", "arise", "irate",
-                    "learn", "noble", "media", "ocean", "ideal", "radio", "steam", "dream"
-                ]
-        
+        """Filter the loaded word lists based on current settings"""
         # Filter based on exclude_past_words setting
         if self.exclude_past_words.get() and self.past_words:
             self.all_words = [word for word in self.all_words_with_past if word not in self.past_words]
         else:
             self.all_words = list(self.all_words_with_past)
+        self.use_tree = self.tree_matches_word_list()
+        self.use_book = self.book_matches_word_list()
+
+    def tree_matches_word_list(self):
+        """Check whether the loaded decision tree was built for the current word list"""
+        return wordle_solver.DECISION_TREE is not None and wordle_solver.DECISION_TREE.matches(self.all_words)
+
+    def book_matches_word_list(self):
+        """Check whether the loaded opening book was built for the current word list"""
+        book = wordle_solver.OPENING_BOOK
+        return book is not None and book.matches(self.all_words_with_past, self.all_words)
     
     def get_word_count_text(self):
         """Get text describing the current word list status"""
@@ -317,14 +504,14 @@ class WordleSolverGUI:
                              "Word list has been updated. Do you want to start a new game?"):
             self.reset_game()
         else:
-            # Just update the possible words
-            self.possible_words = [word for word in self.possible_words if word in self.all_words]
-            self.update_possible_words_display()
-            self.update_suggestion()
+            # Just update the possible words, replaying the turns so far over the new list
+            self.game.rebase(self.word_index.from_words(self.all_words))
+            self.results = {}
+            self.show_turn()
         
     def toggle_letter_color(self, index):
         """Toggle letter color between green, yellow, and gray"""
-        if not self.current_guess or len(self.current_guess) != 5:
+        if not self.current_guess or len(self.current_guess) != self.length:
             return
             
         current_color = self.letter_boxes[index].cget("bg")
@@ -350,8 +537,8 @@ class WordleSolverGUI:
             messagebox.showerror("Error", "Please enter a guess.")
             return
             
-        if len(guess) != 5:
-            messagebox.showerror("Error", "Guess must be 5 letters.")
+        if len(guess) != self.length:
+            messagebox.showerror("Error", f"Guess must be {self.length} letters.")
             return
             
         if not guess.isalpha():
@@ -360,7 +547,7 @@ class WordleSolverGUI:
         
         # Set current guess and update letter boxes
         self.current_guess = guess
-        for i in range(5):
+        for i in range(self.length):
             self.letter_boxes[i].config(text=guess[i].upper(), bg=self.GRAY)
             self.current_feedback[i] = "X"  # Default to gray
         
@@ -372,83 +559,136 @@ class WordleSolverGUI:
         """Process the feedback and update the word list"""
         feedback = "".join(self.current_feedback)
         
-        # Add to tried letters
-        for letter in self.current_guess:
-            self.tried_letters.add(letter)
+        if self.editing_turn is not None:
+            # Correcting an earlier turn: only the turns after it are replayed
+            self.game.edit(self.editing_turn, self.current_guess, feedback)
+            self.clear_guess_input()
+            self.show_turn()
+            return
         
         # Check if all green (win)
-        if feedback == "GGGGG":
+        if feedback == "G" * self.length:
             messagebox.showinfo("Congratulations!", f"You found the word: {self.current_guess.upper()}")
             self.submit_btn.config(state=tk.DISABLED)
             return
             
-        # Filter words based on feedback
-        self.possible_words = filter_words(
-            self.possible_words, 
-            self.current_guess, 
-            feedback, 
-            self.known_letters, 
-            self.present_letters, 
-            self.absent_letters, 
-            self.yellow_misplaced
-        )
-        
-        # Check if we ran out of possible words
-        if not self.possible_words:
-            messagebox.showwarning("Warning", "No possible words left. Please check your feedback.")
-            self.submit_btn.config(state=tk.DISABLED)
-            return
+        # Record the turn; filtering the candidate bitset takes well under a millisecond
+        self.game.push(self.current_guess, feedback)
         
-        # Update the guess number
-        self.guess_number += 1
         if self.guess_number > 6:
             messagebox.showinfo("Game Over", "You've used all 6 guesses.")
             self.submit_btn.config(state=tk.DISABLED)
+            self.update_turns_display()
+            self.update_history_buttons()
             return
-            
-        self.status_label.config(text=f"Guess {self.guess_number}/6")
-        
-        # Update displays
-        self.update_known_letters_display()
-        self.update_present_letters_display()
-        self.update_absent_letters_display()
-        self.update_possible_words_display()
-        self.update_suggestion()
         
-        # Reset for next guess
+        self.clear_guess_input()
+        self.show_turn()
+    
+    @property
+    def guess_number(self):
+        return self.game.turns + 1 if self.game else 1
+    
+    @property
+    def constraints(self):
+        return self.game.current.constraints
+    
+    def clear_guess_input(self):
+        """Empty the guess entry and letter boxes for the next guess"""
         self.guess_var.set("")
         for box in self.letter_boxes:
             box.config(text="", bg=self.EMPTY)
         self.current_guess = ""
-        self.current_feedback = ["X"] * 5
+        self.current_feedback = ["X"] * self.length
+        self.editing_turn = None
         
         # Reset button states
         self.submit_btn.config(state=tk.DISABLED)
         self.enter_guess_btn.config(state=tk.NORMAL)
     
+    def show_turn(self):
+        """Update everything that depends on the current turn"""
+        self.status_label.config(text=f"Guess {self.guess_number}/6")
+        self.update_turns_display()
+        self.update_history_buttons()
+        self.update_suggestion()
+    
+    def undo_turn(self):
+        """Step back one turn, restoring its snapshot without re-filtering"""
+        if self.game is None or self.game.undo() is None:
+            return
+        self.clear_guess_input()
+        self.show_turn()
+    
+    def redo_turn(self):
+        """Step forward one undone turn"""
+        if self.game is None or self.game.redo() is None:
+            return
+        self.clear_guess_input()
+        self.show_turn()
+    
+    def edit_turn(self, turn):
+        """Load an earlier turn into the letter boxes so its guess or colors can be corrected"""
+        guess, feedback = self.game.history()[turn - 1]
+        colors = {"G": self.GREEN, "Y": self.YELLOW, "X": self.GRAY}
+        self.editing_turn = turn
+        self.guess_var.set(guess)
+        self.current_guess = guess
+        self.current_feedback = list(feedback)
+        for box, letter, fb in zip(self.letter_boxes, guess, feedback):
+            box.config(text=letter.upper(), bg=colors[fb])
+        self.status_label.config(text=f"Correcting guess {turn}/6")
+        self.submit_btn.config(state=tk.NORMAL)
+        self.enter_guess_btn.config(state=tk.NORMAL)
+    
+    def update_history_buttons(self):
+        self.undo_btn.config(state=tk.NORMAL if self.game.can_undo() else tk.DISABLED)
+        self.redo_btn.config(state=tk.NORMAL if self.game.can_redo() else tk.DISABLED)
+    
+    def update_turns_display(self):
+        """Show a button for each turn played so far"""
+        for button in self.turn_buttons:
+            button.destroy()
+        self.turn_buttons = []
+        for turn, (guess, feedback) in enumerate(self.game.history(), 1):
+            button = tk.Button(
+                self.turns_frame,
+                text=f"{turn}. {guess.upper()} {feedback}",
+                font=("Courier", 10),
+                command=lambda turn=turn: self.edit_turn(turn)
+            )
+            button.pack(side=tk.LEFT, padx=2)
+            self.turn_buttons.append(button)
+    
     def update_suggestion(self):
-        """Update the suggested word"""
-        if len(self.possible_words) == 0:
-            self.suggested_word.set("No words left")
+        """Update the suggested word in the background"""
+        snapshot = self.game.current
+        if snapshot in self.results:
+            # Seen this turn before (undo or redo): show the saved result right away
+            self.compute_var.set("")
+            self.show_result(self.results[snapshot])
             return
-            
-        # For first guess, use predefined starters
-        if self.guess_number == 1:
-            starters = ["crane", "slate", "soare", "adieu", "trace"]
-            valid_starters = [s for s in starters if s in self.possible_words]
-            if valid_starters:
-                suggestion = random.choice(valid_starters)
-            else:
-                suggestion = suggest_next_guess(self.possible_words, self.tried_letters)
-        else:
-            suggestion = suggest_next_guess(self.possible_words, self.tried_letters)
-            
-        self.suggested_word.set(suggestion.upper() if suggestion else "No suggestion")
+        # Walk the decision tree or opening book when it was built for this word list
+        history = self.game.history() if self.use_tree or self.use_book else None
+        
+        self.suggested_word.set("...")
+        self.compute_var.set("Computing...")
+        # Submitting again makes any refresh still in flight stale; a result for another turn
+        # that still arrives is only saved (see on_refresh)
+        self.worker.submit(
+            "refresh",
+            refresh_state,
+            self.word_index,
+            snapshot,
+            self.game.tried_letters(),
+            history,
+            self.time_budget_ms
+        )
     
     def update_known_letters_display(self):
         """Update the display of known letter positions"""
         known_str = []
-        for letter in self.known_letters:
+        for letter in self.constraints.known_letters():
             if letter:
                 known_str.append(letter.upper())
             else:
@@ -457,16 +697,18 @@ class WordleSolverGUI:
     
     def update_present_letters_display(self):
         """Update the display of present letters (yellow)"""
-        if self.present_letters:
-            present_str = ", ".join(sorted([l.upper() for l in self.present_letters]))
+        present_letters = self.constraints.present_letters()
+        if present_letters:
+            present_str = ", ".join(sorted([l.upper() for l in present_letters]))
             self.present_var.set(present_str)
         else:
             self.present_var.set("None")
     
     def update_absent_letters_display(self):
         """Update the display of absent letters (gray)"""
-        if self.absent_letters:
-            absent_str = ", ".join(sorted([l.upper() for l in self.absent_letters]))
+        absent_letters = self.constraints.absent_letters()
+        if absent_letters:
+            absent_str = ", ".join(sorted([l.upper() for l in absent_letters]))
             self.absent_var.set(absent_str)
         else:
             self.absent_var.set("None")
@@ -474,65 +716,288 @@ class WordleSolverGUI:
     def update_possible_words_display(self):
         """Update the display of possible words"""
         self.possible_label.config(text=f"Possible words ({len(self.possible_words)}):")
-        
-        self.possible_words_text.delete(1.0, tk.END)
-        
-        # Only show all words if there are a reasonable number
-        show_all = len(self.possible_words) <= 200
-        
-        if show_all:
-            # Sort alphabetically
-            words_to_show = sorted(self.possible_words)
-            
-            # Format into columns for easier reading
-            columns = 8  # Number of columns for display
-            rows = (len(words_to_show) + columns - 1) // columns  # Ceiling division
-            
-            for row in range(rows):
-                line = ""
-                for col in range(columns):
-                    idx = col * rows + row
-                    if idx < len(words_to_show):
-                        line += f"{words_to_show[idx]:8} "  # Pad to 8 chars
-                self.possible_words_text.insert(tk.END, line + "\n")
-        else:
-            self.possible_words_text.insert(tk.END, "Too many words to display. Keep guessing to narrow down.")
+        # Removed candidates are dropped from the list in place; only the visible rows are redrawn
+        self.possible_list.set_words(self.possible_words, self.word_scores, "No possible words.")
     
     def reset_game(self):
         """Reset the game state for a new game"""
+        if word_file_stamps(self.words_file) != self.word_stamps:
+            # The word files changed (e.g. a new past answer): reload them, which also starts the new game
+            self.compute_var.set("Reloading word lists...")
+            self.worker.submit("load", load_word_data, self.exclude_past_words.get(), self.length, self.words_file)
+            return
         # Reset solver variables
+        self.game = GameHistory(self.word_index, self.word_index.from_words(self.all_words))
+        self.results = {}
         self.possible_words = list(self.all_words)
-        self.known_letters = [None] * 5
-        self.present_letters = set()
-        self.absent_letters = set()
-        self.yellow_misplaced = [set() for _ in range(5)]
-        self.tried_letters = set()
-        self.guess_number = 1
-        self.current_guess = ""
-        self.current_feedback = ["X"] * 5
         
         # Reset UI
-        self.status_label.config(text=f"Guess {self.guess_number}/6")
-        self.guess_var.set("")
-        for box in self.letter_boxes:
-            box.config(text="", bg=self.EMPTY)
+        self.clear_guess_input()
         
         # Reset displays
-        self.known_var.set("_ _ _ _ _")
+        self.known_var.set(" ".join("_" * self.length))
         self.present_var.set("None")
         self.absent_var.set("None")
         
-        # Reset button states
+        # Update turns, suggestion and possible words
+        self.show_turn()
+        
+        messagebox.showinfo("New Game", "Game has been reset. Good luck!")
+
+def load_multi_board_data(boards, length=5, words_file="words.txt"):
+    """Load the word lists and build the multi-board solver (runs on the worker thread)"""
+    from multi_board import MultiBoardSolver
+
+    data = load_word_data(True, length, words_file)
+    past_words = data["past_words"]
+    answers = [word for word in data["all_words_with_past"] if word not in past_words]
+    return MultiBoardSolver(answers, boards, data["all_words_with_past"])
+
+class MultiBoardGUI:
+    """Dordle/Quordle/Octordle mode: one guess per turn, colored separately on every board"""
+
+    def __init__(self, root, boards, length=5, words_file="words.txt"):
+        from multi_board import max_guesses
+
+        self.root = root
+        self.boards = boards
+        self.length = length
+        self.words_file = words_file
+        self.max_guesses = max_guesses(boards)
+        self.root.title(f"Wordle Solver GUI - {boards} boards")
+        self.root.geometry("900x700")
+        self.root.configure(bg="#f0f0f0")
+
+        self.solver = None  # Built in the background, see on_loaded
+        self.state = None  # MultiBoardState of the current game
+        self.current_guess = ""
+        self.current_feedback = [["X"] * length for _ in range(boards)]
+        self.worker = SolverWorker()
+
+        self.GREEN = "#6aaa64"
+        self.YELLOW = "#c9b458"
+        self.GRAY = "#787c7e"
+        self.EMPTY = "#ffffff"
+        self.SOLVED = "#d3d6da"
+        self.BG_COLOR = "#f0f0f0"
+
+        self.main_frame = tk.Frame(root, bg=self.BG_COLOR)
+        self.main_frame.pack(padx=20, pady=20, fill=tk.BOTH, expand=True)
+
+        tk.Label(self.main_frame, text=f"Wordle Solver ({boards} boards)", font=("Helvetica", 24, "bold"),
+                 bg=self.BG_COLOR).pack(pady=(0, 10))
+
+        # Suggested word and how long it took
+        self.suggestion_frame = tk.Frame(self.main_frame, bg=self.BG_COLOR)
+        self.suggestion_frame.pack(pady=5, fill=tk.X)
+        tk.Label(self.suggestion_frame, text="Suggested word:", font=("Helvetica", 12),
+                 bg=self.BG_COLOR).pack(side=tk.LEFT, padx=(0, 10))
+        self.suggested_word = tk.StringVar()
+        tk.Label(self.suggestion_frame, textvariable=self.suggested_word, font=("Helvetica", 16, "bold"),
+                 bg=self.BG_COLOR).pack(side=tk.LEFT)
+        self.compute_var = tk.StringVar(value="Loading...")
+        tk.Label(self.suggestion_frame, textvariable=self.compute_var, font=("Helvetica", 10), fg="#787c7e",
+                 bg=self.BG_COLOR).pack(side=tk.LEFT, padx=(10, 0))
+
+        # Guess entry and buttons
+        self.guess_frame = tk.Frame(self.main_frame, bg=self.BG_COLOR)
+        self.guess_frame.pack(pady=5, fill=tk.X)
+        tk.Label(self.guess_frame, text="Enter your guess:", font=("Helvetica", 12),
+                 bg=self.BG_COLOR).pack(side=tk.LEFT, padx=(0, 10))
+        self.guess_var = tk.StringVar()
+        tk.Entry(self.guess_frame, textvariable=self.guess_var, font=("Helvetica", 12),
+                 width=max(10, length + 3)).pack(side=tk.LEFT)
+        self.enter_guess_btn = tk.Button(self.guess_frame, text="Enter Guess", font=("Helvetica", 12),
+                                         command=self.enter_guess, state=tk.DISABLED)
+        self.enter_guess_btn.pack(side=tk.LEFT, padx=5)
+        self.submit_btn = tk.Button(self.guess_frame, text="Submit Feedback", font=("Helvetica", 12),
+                                    command=self.submit_feedback, state=tk.DISABLED)
+        self.submit_btn.pack(side=tk.LEFT, padx=5)
+        self.reset_btn = tk.Button(self.guess_frame, text="New Game", font=("Helvetica", 12),
+                                   command=self.reset_game, state=tk.DISABLED)
+        self.reset_btn.pack(side=tk.LEFT, padx=5)
+
+        self.status_label = tk.Label(self.main_frame, text=f"Guess 1/{self.max_guesses}",
+                                     font=("Helvetica", 12, "bold"), bg=self.BG_COLOR)
+        self.status_label.pack(pady=5, anchor=tk.W)
+
+        # One panel per board: a row of clickable letter boxes and its remaining words
+        self.boards_frame = tk.Frame(self.main_frame, bg=self.BG_COLOR)
+        self.boards_frame.pack(fill=tk.BOTH, expand=True)
+        columns = min(boards, 4)
+        self.board_titles = []
+        self.letter_rows = []
+        self.board_texts = []
+        for b in range(boards):
+            panel = tk.Frame(self.boards_frame, bg=self.BG_COLOR, relief=tk.GROOVE, borderwidth=1)
+            panel.grid(row=b // columns, column=b % columns, padx=5, pady=5, sticky="nsew")
+            self.boards_frame.columnconfigure(b % columns, weight=1)
+            self.boards_frame.rowconfigure(b // columns, weight=1)
+
+            title = tk.StringVar(value=f"Board {b + 1}")
+            tk.Label(panel, textvariable=title, font=("Helvetica", 10, "bold"), bg=self.BG_COLOR).pack(anchor=tk.W)
+            self.board_titles.append(title)
+
+            row = tk.Frame(panel, bg=self.BG_COLOR)
+            row.pack(pady=3)
+            boxes = []
+            for i in range(length):
+                box = tk.Label(row, text="", font=("Helvetica", 14, "bold"), width=2, relief=tk.RAISED, bg=self.EMPTY)
+                box.pack(side=tk.LEFT, padx=1)
+                box.bind("<Button-1>", lambda event, board=b, idx=i: self.toggle_letter_color(board, idx))
+                boxes.append(box)
+            self.letter_rows.append(boxes)
+
+            text = scrolledtext.ScrolledText(panel, width=24, height=4, font=("Helvetica", 9))
+            text.pack(fill=tk.BOTH, expand=True)
+            self.board_texts.append(text)
+
+        tk.Label(self.main_frame,
+                 text="Instructions: 1. Enter your guess. 2. Click each board's letters to set its colors. 3. Submit feedback.",
+                 font=("Helvetica", 10), bg=self.BG_COLOR).pack(pady=5)
+
+        self.worker.submit("load", load_multi_board_data, boards, length, words_file)
+        self.root.after(POLL_MS, self.poll_worker)
+
+    def poll_worker(self):
+        """Apply finished background jobs; runs on the Tk main loop"""
+        for kind, result, error, elapsed_ms in self.worker.poll():
+            if error is not None:
+                self.compute_var.set("")
+                messagebox.showerror("Error", f"Background {kind} failed: {error}")
+            elif kind == "load":
+                self.on_loaded(result, elapsed_ms)
+            elif kind == "refresh":
+                self.suggested_word.set(result.upper() if result else "No suggestion")
+                self.compute_var.set(f"Computed in {elapsed_ms:.1f} ms")
+        self.root.after(POLL_MS, self.poll_worker)
+
+    def on_loaded(self, solver, elapsed_ms):
+        """Start the first game once the solver has been built"""
+        self.solver = solver
+        self.compute_var.set(f"Loaded in {elapsed_ms:.0f} ms")
+        self.enter_guess_btn.config(state=tk.NORMAL)
+        self.reset_btn.config(state=tk.NORMAL)
+        self.start_game()
+
+    def start_game(self):
+        self.state = self.solver.new_game()
+        self.current_guess = ""
+        self.guess_var.set("")
+        self.status_label.config(text=f"Guess 1/{self.max_guesses}")
         self.submit_btn.config(state=tk.DISABLED)
         self.enter_guess_btn.config(state=tk.NORMAL)
-        
-        # Update suggestion and possible words
+        self.update_boards_display()
         self.update_suggestion()
-        self.update_possible_words_display()
-        
+
+    def update_suggestion(self):
+        """Score the next guess across all boards in the background"""
+        self.suggested_word.set("...")
+        self.compute_var.set("Computing...")
+        self.worker.submit("refresh", self.solver.suggest, self.state)
+
+    def update_boards_display(self):
+        """Show each board's remaining words, or the word that solved it"""
+        for b in range(self.boards):
+            text = self.board_texts[b]
+            text.delete(1.0, tk.END)
+            for box in self.letter_rows[b]:
+                box.config(text="", bg=self.SOLVED if self.state.solved[b] else self.EMPTY)
+            if self.state.solved[b]:
+                self.board_titles[b].set(f"Board {b + 1}: solved ({self.state.solved[b].upper()})")
+                continue
+            words = self.solver.candidates(self.state, b)
+            self.board_titles[b].set(f"Board {b + 1}: {len(words)} words")
+            if not words:
+                text.insert(tk.END, "No words left. Please check this board's feedback.")
+            elif len(words) <= 200:
+                text.insert(tk.END, " ".join(sorted(words)))
+            else:
+                text.insert(tk.END, "Too many words to display.")
+
+    def toggle_letter_color(self, board, index):
+        """Cycle a letter on one board between green, yellow and gray"""
+        if not self.current_guess or self.state.solved[board]:
+            return
+        color = self.letter_rows[board][index].cget("bg")
+        if color == self.GREEN:
+            new_color, feedback = self.YELLOW, "Y"
+        elif color == self.YELLOW:
+            new_color, feedback = self.GRAY, "X"
+        else:
+            new_color, feedback = self.GREEN, "G"
+        self.letter_rows[board][index].config(bg=new_color)
+        self.current_feedback[board][index] = feedback
+
+    def enter_guess(self):
+        """Show the guess on every unsolved board, all gray to start with"""
+        guess = self.guess_var.get().lower().strip()
+        if len(guess) != self.length or not guess.isalpha():
+            messagebox.showerror("Error", f"Guess must be {self.length} letters.")
+            return
+        if guess not in self.solver.table.guess_index:
+            messagebox.showerror("Error", f"'{guess.upper()}' is not in the word list.")
+            return
+        self.current_guess = guess
+        for b in self.state.unsolved():
+            for i, box in enumerate(self.letter_rows[b]):
+                box.config(text=guess[i].upper(), bg=self.GRAY)
+            self.current_feedback[b] = ["X"] * self.length
+        self.submit_btn.config(state=tk.NORMAL)
+        self.enter_guess_btn.config(state=tk.DISABLED)
+
+    def submit_feedback(self):
+        """Filter every board with its feedback and suggest the next guess"""
+        feedbacks = ["".join(feedback) for feedback in self.current_feedback]
+        self.state = self.solver.apply(self.state, self.current_guess, feedbacks)
+        self.current_guess = ""
+        self.guess_var.set("")
+        self.submit_btn.config(state=tk.DISABLED)
+        self.enter_guess_btn.config(state=tk.NORMAL)
+        self.update_boards_display()
+
+        if self.state.is_finished():
+            self.suggested_word.set("")
+            messagebox.showinfo("Congratulations!", f"You solved all {self.boards} boards in {self.state.guesses_used} guesses.")
+            self.enter_guess_btn.config(state=tk.DISABLED)
+            return
+        if self.state.guesses_used >= self.max_guesses:
+            self.suggested_word.set("")
+            messagebox.showinfo("Game Over", f"You've used all {self.max_guesses} guesses.")
+            self.enter_guess_btn.config(state=tk.DISABLED)
+            return
+        self.status_label.config(text=f"Guess {self.state.guesses_used + 1}/{self.max_guesses}")
+        self.update_suggestion()
+
+    def reset_game(self):
+        """Start a new game on every board"""
+        self.start_game()
         messagebox.showinfo("New Game", "Game has been reset. Good luck!")
 
+# Opt-in tracing of the load and refresh paths (see instrumentation.py)
+instrument_module(globals(), ["load_word_data", "pick_suggestion", "refresh_state"])
+instrument_class(WordleSolverGUI, ["on_words_loaded", "on_refresh", "update_suggestion", "update_possible_words_display"])
+instrument_class(MultiBoardGUI, ["on_loaded", "update_boards_display"])
+
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Wordle solver GUI")
+    parser.add_argument("--length", type=int, default=5, help="letters per word, e.g. 4-8 (default: 5)")
+    parser.add_argument("--words", default="words.txt", help="word list (default: words.txt)")
+    parser.add_argument("--boards", type=int, default=1, help="boards played at once: 2 (Dordle), 4 (Quordle) or 8 (Octordle)")
+    parser.add_argument("--trace", metavar="FILE", help="write a JSON-lines timing trace of the solver and GUI refreshes")
+    parser.add_argument("--time-budget", type=int, metavar="MS",
+                        help="search two guesses ahead for up to MS milliseconds per suggestion (see lookahead.py)")
+    args = parser.parse_args()
+    if args.trace:
+        wordle_solver.enable_tracing(args.trace)
+        instrument_module(globals(), ["load_word_data", "pick_suggestion", "refresh_state", "suggest_next_guess"])
+        instrument_class(WordleSolverGUI, ["on_words_loaded", "on_refresh", "update_suggestion", "update_possible_words_display"])
+
     root = tk.Tk()
-    app = WordleSolverGUI(root)
+    if args.boards > 1:
+        app = MultiBoardGUI(root, args.boards, args.length, args.words)
+    else:
+        app = WordleSolverGUI(root, args.length, args.words, args.time_budget)
     root.mainloop() 
\ No newline at end of file